@@ -644,18 +644,13 @@ async def route_to_ollama(
 
         # Call Ollama
         with request_duration.labels(endpoint="ollama").time():
-            response_text = ""
-            eval_count = 0
-            async for chunk in ollama_client.chat(
+            result = await ollama_client.chat_once(
                 model=ollama_model,
                 messages=messages,
-                temperature=request.temperature,
-                stream=False
-            ):
-                if chunk.get("done"):
-                    response_text = chunk.get("message", {}).get("content", "")
-                    eval_count = chunk.get("eval_count", 0)
-                    break
+                temperature=request.temperature
+            )
+            response_text = result.get("message", {}).get("content", "")
+            eval_count = result.get("eval_count", 0)
 
         # Calculate metrics
         latency_seconds = time.time() - start_time
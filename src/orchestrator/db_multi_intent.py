@@ -7,13 +7,50 @@ import re
 import json
 import asyncio
 import logging
+import time
 from typing import List, Dict, Any, Tuple, Optional
 import asyncpg
 import redis.asyncio as redis
-from datetime import datetime
+from redis.exceptions import RedisError
 
 logger = logging.getLogger(__name__)
 
+# Refresh queries. Kept as constants so the statement text is identical on
+# every call and asyncpg's per-connection statement cache reuses the plan.
+_CONFIG_SQL = """
+    SELECT * FROM multi_intent_config
+    ORDER BY id DESC
+    LIMIT 1
+"""
+
+_CHAIN_RULES_SQL = """
+    SELECT * FROM intent_chain_rules
+    WHERE enabled = true
+    ORDER BY id
+"""
+
+# Context words used when none are configured
+_DEFAULT_CONTEXT_WORDS = ('lights', 'temperature', 'door', 'lock', 'blinds')
+
+# Words suggesting a split part is an action that may need carried-over context
+_ACTION_WORDS = frozenset(('on', 'off', 'up', 'down', 'open', 'close'))
+_ACTION_RE = re.compile('|'.join(sorted(_ACTION_WORDS)), re.IGNORECASE)
+
+# Template for queries that resolve to a single intent
+_SINGLE_INTENT_RESULT = {
+    'has_multiple_intents': False,
+    'intent_parts': None,
+    'chain_match': None,
+    'processing_strategy': 'sequential'
+}
+
+
+def _single_intent(query: str) -> Dict[str, Any]:
+    """Build the analyze_query result for a single-intent query"""
+    result = _SINGLE_INTENT_RESULT.copy()
+    result['intent_parts'] = [query]
+    return result
+
 
 class DatabaseMultiIntentHandler:
     """
@@ -33,8 +70,17 @@ class DatabaseMultiIntentHandler:
 
         # Cache configuration
         self.config: Dict[str, Any] = {}
-        self.chain_rules: List[Dict] = []
-        self.last_refresh = None
+        # asyncpg Records from refresh; dicts when applied from pub/sub
+        self.chain_rules: List[Any] = []
+        self.last_refresh: Optional[float] = None  # time.monotonic()
+
+        # Compiled triggers and their rules as parallel lists
+        self._rule_patterns: List[re.Pattern] = []
+        self._rule_records: List[Any] = []
+
+        self._closing = False
+        self._listener_task: Optional[asyncio.Task] = None
+        self._snapshot_config()
 
     async def initialize(self):
         """Load initial configuration from database"""
@@ -45,18 +91,14 @@ class DatabaseMultiIntentHandler:
         await self.pubsub.subscribe('multi_intent_config_update')
 
         # Start listener
-        asyncio.create_task(self._listen_for_updates())
+        self._listener_task = asyncio.create_task(self._listen_for_updates())
 
     async def refresh_configuration(self):
         """Load multi-intent configuration from database"""
         try:
             async with self.db_pool.acquire() as conn:
                 # Load global config
-                config_row = await conn.fetchrow("""
-                    SELECT * FROM multi_intent_config
-                    ORDER BY id DESC
-                    LIMIT 1
-                """)
+                config_row = await conn.fetchrow(_CONFIG_SQL)
 
                 if config_row:
                     self.config = dict(config_row)
@@ -72,17 +114,13 @@ class DatabaseMultiIntentHandler:
                         'min_words_per_intent': 2,
                         'context_words_to_preserve': []
                     }
+                self._snapshot_config()
 
                 # Load chain rules
-                self.chain_rules = [
-                    dict(row) for row in await conn.fetch("""
-                        SELECT * FROM intent_chain_rules
-                        WHERE enabled = true
-                        ORDER BY id
-                    """)
-                ]
-
-            self.last_refresh = datetime.now()
+                self.chain_rules = await conn.fetch(_CHAIN_RULES_SQL)
+                self._compile_chain_rules()
+
+            self.last_refresh = time.monotonic()
             logger.info(
                 f"Multi-intent config refreshed: "
                 f"enabled={self.config.get('enabled')}, "
@@ -94,13 +132,117 @@ class DatabaseMultiIntentHandler:
             logger.error(f"Failed to refresh multi-intent configuration: {e}")
 
     async def _listen_for_updates(self):
-        """Listen for configuration updates"""
-        async for message in self.pubsub.listen():
-            if message['type'] == 'message':
+        """
+        Listen for configuration updates.
+        Reconnects with exponential backoff if the Redis connection drops so
+        the cached configuration keeps receiving invalidations.
+        """
+        backoff = 1
+        while not self._closing:
+            try:
+                async for message in self.pubsub.listen():
+                    backoff = 1
+                    if message['type'] == 'message':
+                        try:
+                            await self._handle_update(json.loads(message['data']))
+                        except Exception as e:
+                            logger.error(f"Failed to process update: {e}")
+            except (ConnectionError, RedisError) as e:
+                if self._closing:
+                    break
+                logger.warning(
+                    f"Multi-intent update listener lost Redis connection: {e}; "
+                    f"retrying in {backoff}s"
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30)
                 try:
-                    await self.refresh_configuration()
-                except Exception as e:
-                    logger.error(f"Failed to process update: {e}")
+                    await self.pubsub.subscribe('multi_intent_config_update')
+                    # Updates may have been missed while disconnected
+                    await asyncio.shield(self.refresh_configuration())
+                except (ConnectionError, RedisError) as e:
+                    logger.warning(f"Failed to resubscribe to multi-intent updates: {e}")
+            else:
+                # listen() returned without error (e.g. unsubscribed)
+                break
+
+    async def _handle_update(self, payload: Dict[str, Any]):
+        """
+        Apply a published configuration update.
+
+        Publishers include the changed rows in the message so subscribers can
+        apply them locally; anything else falls back to a full reload.
+        """
+        action = payload.get('action')
+
+        if action == 'apply' and 'config' in payload:
+            self._apply_config(payload['config'])
+        elif action == 'add_chain' and 'rule' in payload:
+            self._apply_chain_rule(payload['rule'])
+        else:
+            # Shielded so a cancelled listener can't leave config half-loaded
+            await asyncio.shield(self.refresh_configuration())
+
+    def _apply_config(self, updates: Dict[str, Any]):
+        """Merge updated config fields into the cached configuration"""
+        self.config.update(updates)
+        self._snapshot_config()
+
+    def _snapshot_config(self):
+        """
+        Copy hot config fields onto instance attributes.
+        self.config stays authoritative; these are read on every request.
+        """
+        self._enabled = bool(self.config.get('enabled', True))
+        self._separators = list(self.config.get('separators') or [])
+        # NULL columns come back as None; fall back to the defaults
+        self._max_intents = int(self.config.get('max_intents_per_query') or 3)
+        self._parallel = bool(self.config.get('parallel_processing', False))
+        self._context_pres = bool(self.config.get('context_preservation', True))
+        self._context_words = list(self.config.get('context_words_to_preserve') or [])
+        min_words = self.config.get('min_words_per_intent')
+        self._min_words = int(min_words) if min_words is not None else 2
+        self._strategy = self.config.get('combination_strategy', 'concatenate')
+
+        # Default context words if none configured
+        context_words = self._context_words or _DEFAULT_CONTEXT_WORDS
+        self._context_re = re.compile(
+            '|'.join(re.escape(w) for w in sorted(context_words, key=len, reverse=True)),
+            re.IGNORECASE
+        )
+
+        # One alternation for all separators; longest first so overlapping
+        # separators (e.g. ' and ' / ' and then ') split on the longer one
+        self._sep_re = re.compile(
+            '|'.join(re.escape(sep) for sep in sorted(self._separators, key=len, reverse=True)),
+            re.IGNORECASE
+        ) if self._separators else None
+        self._fast_passthrough = not self._rule_patterns and not self._separators
+
+    def _compile_chain_rules(self):
+        """Compile chain rule trigger patterns (case-insensitive)"""
+        patterns = []
+        records = []
+        for rule in self.chain_rules:
+            trigger_pattern = rule['trigger_pattern']
+            if not trigger_pattern:
+                continue
+            try:
+                patterns.append(re.compile(trigger_pattern, re.IGNORECASE))
+                records.append(rule)
+            except re.error:
+                logger.error(f"Invalid regex in chain rule '{rule['name']}': {trigger_pattern}")
+        self._rule_patterns = patterns
+        self._rule_records = records
+        self._fast_passthrough = not self._rule_patterns and not self._separators
+
+    def _apply_chain_rule(self, rule: Dict[str, Any]):
+        """Insert or replace a chain rule in the cached rule list"""
+        self.chain_rules = [r for r in self.chain_rules if r['id'] != rule['id']]
+        if rule.get('enabled', True):
+            self.chain_rules.append(rule)
+            self.chain_rules.sort(key=lambda r: r['id'])
+        self._compile_chain_rules()
 
     async def analyze_query(
         self,
@@ -116,72 +258,71 @@ class DatabaseMultiIntentHandler:
             - chain_match: Optional matched chain rule
             - processing_strategy: 'sequential' or 'parallel'
         """
-        if not self.config.get('enabled', True):
-            return {
-                'has_multiple_intents': False,
-                'intent_parts': [query],
-                'chain_match': None,
-                'processing_strategy': 'sequential'
-            }
+        return self._analyze_query_impl(query)
+
+    def analyze_query_sync(
+        self,
+        query: str
+    ) -> Dict[str, Any]:
+        """
+        Synchronous variant of analyze_query.
+        Analysis does no I/O, so callers already on the event loop can skip
+        scheduling a coroutine.
+        """
+        return self._analyze_query_impl(query)
+
+    def _analyze_query_impl(
+        self,
+        query: str
+    ) -> Dict[str, Any]:
+        """Shared body of analyze_query / analyze_query_sync"""
+        if not self._enabled or self._fast_passthrough:
+            # Nothing to split on and no chains to match
+            return _single_intent(query)
 
         # Check for chain rule match first
-        chain_match = await self._check_chain_rules(query)
+        chain_match = self._check_chain_rules(query)
         if chain_match:
             return {
                 'has_multiple_intents': True,
-                'intent_parts': await self._generate_chain_queries(query, chain_match),
+                'intent_parts': self._generate_chain_queries(query, chain_match),
                 'chain_match': chain_match,
                 'processing_strategy': 'sequential'  # Chains are always sequential
             }
 
         # Check for multi-intent separators
-        separators = self.config.get('separators', [])
-        intent_parts = await self._split_query(query, separators)
+        intent_parts = self._split_query(query)
 
         if len(intent_parts) > 1:
             # Limit to max configured intents
-            max_intents = self.config.get('max_intents_per_query', 3)
-            intent_parts = intent_parts[:max_intents]
+            intent_parts = intent_parts[:self._max_intents]
 
             return {
                 'has_multiple_intents': True,
                 'intent_parts': intent_parts,
                 'chain_match': None,
                 'processing_strategy': (
-                    'parallel' if self.config.get('parallel_processing', False)
-                    else 'sequential'
+                    'parallel' if self._parallel else 'sequential'
                 )
             }
 
-        return {
-            'has_multiple_intents': False,
-            'intent_parts': [query],
-            'chain_match': None,
-            'processing_strategy': 'sequential'
-        }
+        return _single_intent(query)
 
-    async def _check_chain_rules(
+    def _check_chain_rules(
         self,
         query: str
     ) -> Optional[Dict[str, Any]]:
         """Check if query matches any chain rules"""
-        query_lower = query.lower()
-
-        for rule in self.chain_rules:
-            trigger_pattern = rule.get('trigger_pattern', '')
-
-            # Check if pattern matches
-            if trigger_pattern:
-                try:
-                    if re.search(trigger_pattern, query_lower):
-                        logger.info(f"Query matches chain rule: {rule['name']}")
-                        return rule
-                except re.error:
-                    logger.error(f"Invalid regex in chain rule '{rule['name']}': {trigger_pattern}")
+        # Patterns are compiled with re.IGNORECASE, so no lowercased copy is needed
+        for i, pattern in enumerate(self._rule_patterns):
+            if pattern.search(query):
+                rule = self._rule_records[i]
+                logger.info(f"Query matches chain rule: {rule['name']}")
+                return dict(rule)
 
         return None
 
-    async def _generate_chain_queries(
+    def _generate_chain_queries(
         self,
         original_query: str,
         chain_rule: Dict
@@ -220,81 +361,60 @@ class DatabaseMultiIntentHandler:
 
         return queries
 
-    async def _split_query(
+    def _split_query(
         self,
-        query: str,
-        separators: List[str]
+        query: str
     ) -> List[str]:
         """Split query into multiple intents based on separators"""
-        parts = [query]
-
-        # Split on each separator
-        for separator in separators:
-            new_parts = []
-            for part in parts:
-                if separator in part.lower():
-                    # Case-insensitive split while preserving original case
-                    split_index = part.lower().index(separator)
-                    before = part[:split_index]
-                    after = part[split_index + len(separator):]
-
-                    if before.strip():
-                        new_parts.append(before.strip())
-                    if after.strip():
-                        new_parts.append(after.strip())
-                else:
-                    new_parts.append(part)
+        if self._sep_re is None:
+            return [query]
 
-            parts = new_parts
+        # Single case-insensitive pass over all separators, preserving original case
+        parts = [p for p in (p.strip() for p in self._sep_re.split(query)) if p]
+        if len(parts) < 2:
+            return [query]
 
         # Apply context preservation if enabled
-        if self.config.get('context_preservation', True):
-            parts = await self._preserve_context(parts)
+        if self._context_pres:
+            parts = self._preserve_context(parts, query)
 
         # Filter by minimum word count
-        min_words = self.config.get('min_words_per_intent', 2)
-        valid_parts = [
-            p for p in parts
-            if len(p.split()) >= min_words
-        ]
+        if self._min_words > 1:
+            parts = [p for p in parts if len(p.split()) >= self._min_words]
 
-        return valid_parts if valid_parts else [query]
+        return parts or [query]
 
-    async def _preserve_context(
+    def _preserve_context(
         self,
-        intent_parts: List[str]
+        intent_parts: List[str],
+        original_query: Optional[str] = None
     ) -> List[str]:
         """
         Preserve context between split intents.
         Adds missing context words from previous parts.
         """
-        context_words = self.config.get('context_words_to_preserve', [])
-
-        if not context_words:
-            # Default context words if none configured
-            context_words = ['lights', 'temperature', 'door', 'lock', 'blinds']
+        # Nothing to carry over if no context word appears anywhere
+        if original_query is not None and not self._context_re.search(original_query):
+            return intent_parts
 
         enhanced_parts = []
-        previous_context = set()
+        # dict used as an insertion-ordered set so the chosen word is deterministic
+        previous_context: Dict[str, None] = {}
 
         for i, part in enumerate(intent_parts):
-            part_lower = part.lower()
-            current_context = set()
-
             # Extract context words from current part
-            for word in context_words:
-                if word in part_lower:
-                    current_context.add(word)
+            current_context = dict.fromkeys(
+                m.group(0).lower() for m in self._context_re.finditer(part)
+            )
 
             # If this part is missing context but previous had it
             if i > 0 and not current_context and previous_context:
                 # Check if this looks like it needs context
-                action_words = ['on', 'off', 'up', 'down', 'open', 'close']
-                needs_context = any(word in part_lower for word in action_words)
+                needs_context = _ACTION_RE.search(part) is not None
 
                 if needs_context and previous_context:
                     # Add the most relevant context word
-                    context_word = list(previous_context)[0]
+                    context_word = next(iter(previous_context))
                     part = f"{context_word} {part}"
 
             enhanced_parts.append(part)
@@ -318,26 +438,21 @@ class DatabaseMultiIntentHandler:
         if not responses:
             return ""
 
-        strategy = self.config.get('combination_strategy', 'concatenate')
-
-        if strategy == 'concatenate':
-            # Simple concatenation with connectors
-            combined_parts = []
+        texts = [t for t in (r.get('response', '').strip() for r in responses) if t]
 
-            for i, resp in enumerate(responses):
-                response_text = resp.get('response', '').strip()
+        # Nothing to combine for a single answer, whatever the strategy
+        if len(texts) < 2:
+            return texts[0] if texts else ""
 
-                if response_text:
-                    # Add connector for multiple responses
-                    if i > 0:
-                        if i == len(responses) - 1:
-                            combined_parts.append("Finally,")
-                        else:
-                            combined_parts.append("Additionally,")
+        strategy = self._strategy
 
-                    combined_parts.append(response_text)
+        if strategy == 'concatenate':
+            # Simple concatenation with connectors
+            parts = [texts[0]]
+            parts.extend(f"Additionally, {t}" for t in texts[1:-1])
+            parts.append(f"Finally, {texts[-1]}")
 
-            return " ".join(combined_parts)
+            return " ".join(parts)
 
         elif strategy == 'summarize':
             # Use LLM to create a coherent summary
@@ -441,14 +556,19 @@ class DatabaseMultiIntentHandler:
 
                     await conn.execute(query, *params)
 
-                    # Notify about update
+                    # Notify about update, carrying the changed fields so
+                    # subscribers can apply them without re-querying
                     await self.redis.publish(
                         'multi_intent_config_update',
-                        json.dumps({'action': 'refresh', 'timestamp': datetime.now().isoformat()})
+                        json.dumps({
+                            'action': 'apply',
+                            'config': updates,
+                            'timestamp': int(time.time())
+                        })
                     )
 
-                    # Refresh local config
-                    await self.refresh_configuration()
+                    # Apply locally
+                    self._apply_config(updates)
 
                     return True
 
@@ -468,23 +588,27 @@ class DatabaseMultiIntentHandler:
         """Add a new intent chain rule"""
         try:
             async with self.db_pool.acquire() as conn:
-                rule_id = await conn.fetchval("""
+                row = await conn.fetchrow("""
                     INSERT INTO intent_chain_rules
                     (name, trigger_pattern, intent_sequence, description, examples, enabled)
                     VALUES ($1, $2, $3, $4, $5, true)
-                    RETURNING id
+                    RETURNING *
                 """, name, trigger_pattern, intent_sequence, description, examples)
+                rule = dict(row)
 
-                # Notify about update
+                # Notify about update, carrying the new rule row
                 await self.redis.publish(
                     'multi_intent_config_update',
-                    json.dumps({'action': 'refresh', 'table': 'intent_chain_rules'})
+                    json.dumps(
+                        {'action': 'add_chain', 'table': 'intent_chain_rules', 'rule': rule},
+                        default=str
+                    )
                 )
 
-                # Refresh local config
-                await self.refresh_configuration()
+                # Apply locally
+                self._apply_chain_rule(rule)
 
-                return rule_id
+                return rule['id']
 
         except Exception as e:
             logger.error(f"Failed to add chain rule: {e}")
@@ -521,6 +645,9 @@ class DatabaseMultiIntentHandler:
 
     async def close(self):
         """Clean up resources"""
+        self._closing = True
+        if self._listener_task:
+            self._listener_task.cancel()
         if hasattr(self, 'pubsub'):
             await self.pubsub.unsubscribe()
             await self.pubsub.close()
\ No newline at end of file
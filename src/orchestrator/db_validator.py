@@ -4,17 +4,150 @@ Loads anti-hallucination rules and cross-validation config from database
 """
 
 import re
-import json
+import time
 import asyncio
+import contextlib
+import hashlib
 import logging
-from typing import Tuple, Dict, Any, Optional, List
+from typing import Tuple, Dict, Any, Optional, List, Callable
 import httpx
+import orjson
 import asyncpg
 import redis.asyncio as redis
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Redis stream carrying configuration update events
+CONFIG_UPDATE_STREAM = "validation_config_updates"
+CONFIG_UPDATE_STREAM_MAXLEN = 1000
+
+# Validation verdict cache
+VERDICT_CACHE_PREFIX = "valresp"
+VERDICT_CACHE_TTL = 300  # 5 minutes
+
+# Responses longer than this (chars) are checked off the event loop
+CHECK_OFFLOAD_THRESHOLD = 4096
+
+_NUM_RE = re.compile(r'\d+')
+
+# Byte table mapping everything except ASCII digits to a space
+_KEEP_DIGITS = bytes(i if 48 <= i <= 57 else 32 for i in range(256))
+
+
+def _extract_numbers(text: str) -> set:
+    """Return the set of digit runs in text"""
+    if text.isascii():
+        # One C-level translate + split instead of building match objects
+        return {n.decode() for n in text.encode('ascii').translate(_KEEP_DIGITS).split()}
+    # Regex path also handles non-ASCII (Unicode) digits
+    return set(_NUM_RE.findall(text))
+
+def _has_validator_errors(validation_metadata: Dict[str, Any]) -> bool:
+    """Whether any hallucination check or validation model errored while validating"""
+    return (
+        any('error' in r for r in validation_metadata['checks_performed'])
+        or any('error' in r for r in validation_metadata['cross_validation'].get('results', ()))
+    )
+
+# Validator response format: CONFIDENCE: X.X | ASSESSMENT: <text> | ISSUES: <text or none>
+_CONFIDENCE_RE = re.compile(r'CONFIDENCE:\s*(\d\.\d+)')
+_ASSESSMENT_RE = re.compile(r'ASSESSMENT:\s*([^|]+)')
+_ISSUES_RE = re.compile(r'ISSUES:\s*(.+)')
+
+# Field fully generated (followed by more text) while streaming
+_CONFIDENCE_DONE_RE = re.compile(r'CONFIDENCE:\s*\d\.\d+\D')
+_ASSESSMENT_DONE_RE = re.compile(r'ASSESSMENT:[^|]*\|')
+
+# Configuration queries loaded on refresh
+_CHECKS_SQL = """
+    SELECT * FROM hallucination_checks
+    WHERE enabled = true
+    ORDER BY priority DESC, severity DESC
+"""
+
+_MODELS_SQL = """
+    SELECT * FROM cross_validation_models
+    WHERE enabled = true
+    ORDER BY model_type, weight DESC
+"""
+
+_RULES_SQL = """
+    SELECT r.*, c.name as category_name
+    FROM confidence_score_rules r
+    JOIN intent_categories c ON r.category_id = c.id
+    WHERE r.enabled = true
+    ORDER BY c.name, r.factor_type
+"""
+
+_CATEGORIES_SQL = """
+    SELECT name, confidence_threshold
+    FROM intent_categories
+"""
+
+# Test scenario queries. Constant text lets asyncpg's per-connection
+# statement cache reuse the prepared statement on every run.
+_SCENARIO_SQL = """
+    SELECT * FROM validation_test_scenarios
+    WHERE id = $1
+"""
+
+_SCENARIOS_SQL = """
+    SELECT * FROM validation_test_scenarios
+    WHERE id = ANY($1::int[])
+    ORDER BY id
+"""
+
+_UPDATE_SCENARIO_SQL = """
+    UPDATE validation_test_scenarios
+    SET last_run_result = $1, last_run_date = NOW()
+    WHERE id = $2
+"""
+
+
+def _pattern_match_count_adjustment(
+    condition: Dict, adjustment_value: float, max_impact: float, query: str, metadata: Dict
+) -> Optional[float]:
+    """Based on number of pattern matches; scales with match count"""
+    match_count = len(metadata.get('matched_patterns', []))
+    min_matches = condition.get('min_matches', 1)
+
+    if match_count >= min_matches:
+        return min(adjustment_value * (match_count / max(min_matches, 1)), max_impact)
+    return None
+
+
+def _entity_presence_adjustment(
+    condition: Dict, adjustment_value: float, max_impact: float, query: str, metadata: Dict
+) -> Optional[float]:
+    """Based on entity extraction"""
+    entities = metadata.get('entities', {})
+    required_entities = condition.get('required_entities', [])
+
+    if all(e in entities for e in required_entities):
+        return adjustment_value
+    return None
+
+
+def _query_length_adjustment(
+    condition: Dict, adjustment_value: float, max_impact: float, query: str, metadata: Dict
+) -> Optional[float]:
+    """Based on query complexity"""
+    word_count = len(query.split())
+    min_words = condition.get('min_words', 5)
+    max_words = condition.get('max_words', 50)
+
+    if min_words <= word_count <= max_words:
+        return adjustment_value
+    return None
+
+
+# Confidence rule factor_name -> adjustment function (None when not applicable)
+_CONFIDENCE_FACTORS = {
+    'pattern_match_count': _pattern_match_count_adjustment,
+    'entity_presence': _entity_presence_adjustment,
+    'query_length': _query_length_adjustment,
+}
+
 
 class DatabaseResponseValidator:
     """
@@ -26,69 +159,132 @@ class DatabaseResponseValidator:
         self,
         db_pool: asyncpg.Pool,
         redis_client: redis.Redis,
-        llm_service_url: str = "http://localhost:11434"
+        llm_service_url: str = "http://localhost:11434",
+        max_concurrent_checks: int = 8,
+        max_concurrent_llm_calls: int = 4,
+        fail_fast: bool = True,
+        local_scorer: Optional[Callable[[str, str], float]] = None,
+        local_uncertainty_band: Tuple[float, float] = (0.3, 0.7)
     ):
         self.db_pool = db_pool
         self.redis = redis_client
         self.llm_service_url = llm_service_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # HTTP/2 lets concurrent validator calls to the same LLM host share a
+        # connection; keep-alive avoids reconnecting between requests
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=120
+            ),
+            timeout=httpx.Timeout(30.0, connect=3.0, write=10.0, pool=5.0)
+        )
+
+        # Skip warning-only checks once an error check has failed
+        self.fail_fast = fail_fast
+
+        # Optional local hallucination classifier (e.g. an HHEM-style model)
+        # scoring (query, response) -> support probability. Scores outside
+        # the uncertainty band are trusted without calling the LLM validators.
+        self.local_scorer = local_scorer
+        self.local_uncertainty_band = local_uncertainty_band
+
+        # Caps how many hallucination checks run at once
+        self._check_sem = asyncio.Semaphore(max_concurrent_checks)
+        # Caps concurrent validation calls to the LLM server
+        self._llm_sem = asyncio.Semaphore(max_concurrent_llm_calls)
 
         # Cache configuration
         self.hallucination_checks: List[Dict] = []
         self.cross_validation_models: List[Dict] = []
-        self.confidence_rules: Dict[str, List[Dict]] = {}
-        self.last_refresh = None
+        # category -> factor_name -> rules
+        self.confidence_rules: Dict[str, Dict[str, List[Dict]]] = {}
+        self.category_thresholds: Dict[str, float] = {}
+        self.last_refresh: Optional[float] = None  # time.monotonic()
+
+        # Per-category part of _should_cross_validate; depends only on the
+        # loaded configuration, so it is filled lazily and reset on refresh
+        self._requires_cross_validation: Dict[str, bool] = {}
+
+        # Fingerprint of the loaded configuration; part of every verdict
+        # cache key so a config change invalidates cached verdicts
+        self._config_version = "0"
+
+        # Every validator must see every update, so each one reads the stream
+        # with plain XREAD from the last entry it handled; unlike consumer
+        # groups this leaves no per-instance state behind in Redis
+        self._last_update_id = '0-0'
+        self._listener_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
         """Load initial configuration from database"""
+        await self._mark_update_position()
         await self.refresh_configuration()
 
-        # Set up Redis pub/sub for real-time updates
-        self.pubsub = self.redis.pubsub()
-        await self.pubsub.subscribe('validation_config_update')
-
         # Start background tasks
-        asyncio.create_task(self._listen_for_updates())
+        self._listener_task = asyncio.create_task(self._listen_for_updates())
 
     async def refresh_configuration(self):
         """Load validation configuration from database"""
         try:
-            async with self.db_pool.acquire() as conn:
-                # Load hallucination checks
-                self.hallucination_checks = [
-                    dict(row) for row in await conn.fetch("""
-                        SELECT * FROM hallucination_checks
-                        WHERE enabled = true
-                        ORDER BY priority DESC, severity DESC
-                    """)
-                ]
-
-                # Load cross-validation models
-                self.cross_validation_models = [
-                    dict(row) for row in await conn.fetch("""
-                        SELECT * FROM cross_validation_models
-                        WHERE enabled = true
-                        ORDER BY model_type, weight DESC
-                    """)
-                ]
-
-                # Load confidence score rules
-                confidence_rules = await conn.fetch("""
-                    SELECT r.*, c.name as category_name
-                    FROM confidence_score_rules r
-                    JOIN intent_categories c ON r.category_id = c.id
-                    WHERE r.enabled = true
-                    ORDER BY c.name, r.factor_type
-                """)
-
-                self.confidence_rules = {}
-                for rule in confidence_rules:
-                    cat_name = rule['category_name']
-                    if cat_name not in self.confidence_rules:
-                        self.confidence_rules[cat_name] = []
-                    self.confidence_rules[cat_name].append(dict(rule))
-
-            self.last_refresh = datetime.now()
+            # Independent queries, each on its own pooled connection so the
+            # round-trips overlap
+            check_rows, model_rows, rule_rows, category_rows = await asyncio.gather(
+                self._fetch(_CHECKS_SQL),
+                self._fetch(_MODELS_SQL),
+                self._fetch(_RULES_SQL),
+                self._fetch(_CATEGORIES_SQL)
+            )
+
+            # Load hallucination checks; a malformed row is skipped on its own
+            # rather than aborting the whole refresh
+            hallucination_checks = []
+            for row in check_rows:
+                check = dict(row)
+                try:
+                    # Sets for O(1) category membership tests per request
+                    check['applies_to_categories'] = frozenset(check.get('applies_to_categories') or ())
+                    # JSONB arrives as text when no codec is registered; NULL -> {}
+                    configuration = check.get('configuration') or {}
+                    if isinstance(configuration, str):
+                        configuration = orjson.loads(configuration)
+                    check['configuration'] = configuration
+                    self._compile_check(check)
+                except Exception as e:
+                    logger.error(f"Skipping hallucination check '{check.get('name')}': {e}")
+                    continue
+                hallucination_checks.append(check)
+
+            cross_validation_models = [dict(row) for row in model_rows]
+            for model in cross_validation_models:
+                model['use_for_categories'] = frozenset(model.get('use_for_categories') or ())
+
+            # Load confidence score rules
+            confidence_rules = {}
+            for rule in rule_rows:
+                factor_name = rule['factor_name']
+                if factor_name not in _CONFIDENCE_FACTORS:
+                    logger.warning(f"Ignoring confidence rule with unknown factor '{factor_name}'")
+                    continue
+                confidence_rules.setdefault(rule['category_name'], {}).setdefault(
+                    factor_name, []
+                ).append(dict(rule))
+
+            self.hallucination_checks = hallucination_checks
+            self.cross_validation_models = cross_validation_models
+            self.confidence_rules = confidence_rules
+            self.category_thresholds = {
+                row['name']: float(row['confidence_threshold'] or 0.7)
+                for row in category_rows
+            }
+            self._requires_cross_validation = {}
+            self._config_version = hashlib.blake2b(
+                repr((check_rows, model_rows, rule_rows, category_rows)).encode(),
+                digest_size=8
+            ).hexdigest()
+
+            self.last_refresh = time.monotonic()
             logger.info(
                 f"Validation configuration refreshed: "
                 f"{len(self.hallucination_checks)} checks, "
@@ -98,16 +294,82 @@ class DatabaseResponseValidator:
         except Exception as e:
             logger.error(f"Failed to refresh validation configuration: {e}")
 
-    async def _listen_for_updates(self):
-        """Listen for configuration updates via Redis"""
-        async for message in self.pubsub.listen():
-            if message['type'] == 'message':
+    async def _fetch(self, query: str) -> List[asyncpg.Record]:
+        """Run a query on a connection from the pool"""
+        async with self.db_pool.acquire() as conn:
+            return await conn.fetch(query)
+
+    def _compile_check(self, check: Dict):
+        """Precompile a check's required-element patterns"""
+        if check['check_type'] != 'required_elements':
+            return
+
+        patterns = check['configuration'].get('patterns', [])
+        regexes = []
+        literals = []
+        for pattern in patterns:
+            if '\\d' in pattern:  # Regex pattern
                 try:
-                    data = json.loads(message['data'])
-                    if data.get('action') == 'refresh':
-                        await self.refresh_configuration()
-                except Exception as e:
-                    logger.error(f"Failed to process update: {e}")
+                    regexes.append(re.compile(pattern))
+                except re.error:
+                    logger.error(f"Invalid regex in check '{check['name']}': {pattern}")
+            else:  # Simple substring
+                literals.append(pattern)
+
+        # Merge each group into one alternation so a single scan covers all
+        # patterns; keep the individual regexes if they can't be combined
+        # (e.g. they use numbered backreferences)
+        if len(regexes) > 1:
+            try:
+                regexes = [re.compile('|'.join(f'(?:{r.pattern})' for r in regexes))]
+            except re.error:
+                pass
+
+        check['_compiled_patterns'] = regexes
+        check['_literal_re'] = (
+            re.compile('|'.join(re.escape(p) for p in literals)) if literals else None
+        )
+
+    async def _mark_update_position(self):
+        """Start reading updates after the newest entry currently in the stream"""
+        # Taken before the configuration load, so an update published during
+        # the load is still read afterwards
+        latest = await self.redis.xrevrange(CONFIG_UPDATE_STREAM, count=1)
+        self._last_update_id = latest[0][0] if latest else '0-0'
+
+    async def _listen_for_updates(self):
+        """
+        Consume configuration updates from the Redis stream.
+        A batch of pending updates is coalesced into a single refresh, and
+        the read position only advances once the refresh has run.
+        """
+        while True:
+            try:
+                entries = await self.redis.xread(
+                    {CONFIG_UPDATE_STREAM: self._last_update_id},
+                    count=10,
+                    block=5000
+                )
+                if not entries:
+                    continue
+
+                await self.refresh_configuration()
+                self._last_update_id = entries[-1][1][-1][0]
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to process update: {e}")
+                await asyncio.sleep(1)
+
+    async def publish_config_update(self, action: str = 'refresh'):
+        """Notify all validators that configuration changed"""
+        await self.redis.xadd(
+            CONFIG_UPDATE_STREAM,
+            {'action': action},
+            maxlen=CONFIG_UPDATE_STREAM_MAXLEN,
+            approximate=True
+        )
 
     async def validate_response(
         self,
@@ -122,6 +384,58 @@ class DatabaseResponseValidator:
         Returns:
             Tuple of (is_valid, final_response, validation_metadata)
         """
+        metadata = metadata or {}
+        cache_key = self._verdict_cache_key(query, response, intent_category, metadata)
+
+        try:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                is_valid, final_response, validation_metadata = orjson.loads(cached)
+                return is_valid, final_response, validation_metadata
+        except Exception as e:
+            logger.warning(f"Verdict cache read failed: {e}")
+
+        verdict = await self._validate_uncached(query, response, intent_category, metadata)
+
+        # A verdict built on a failed check or model call holds fallback
+        # scores; don't pin it for the TTL after a transient failure
+        if _has_validator_errors(verdict[2]):
+            return verdict
+
+        try:
+            await self.redis.setex(
+                cache_key,
+                VERDICT_CACHE_TTL,
+                orjson.dumps(verdict, default=str)
+            )
+        except Exception as e:
+            logger.warning(f"Verdict cache write failed: {e}")
+
+        return verdict
+
+    def _verdict_cache_key(
+        self,
+        query: str,
+        response: str,
+        intent_category: str,
+        metadata: Dict[str, Any]
+    ) -> str:
+        """Build the verdict cache key for a validation request"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (query, response, intent_category):
+            digest.update(part.encode())
+            digest.update(b'\x1f')
+        digest.update(orjson.dumps(metadata, default=str, option=orjson.OPT_SORT_KEYS))
+        return f"{VERDICT_CACHE_PREFIX}:{self._config_version}:{digest.hexdigest()}"
+
+    async def _validate_uncached(
+        self,
+        query: str,
+        response: str,
+        intent_category: str,
+        metadata: Dict[str, Any]
+    ) -> Tuple[bool, str, Dict[str, Any]]:
+        """Run all validation layers"""
         validation_metadata = {
             'checks_performed': [],
             'cross_validation': {},
@@ -130,23 +444,29 @@ class DatabaseResponseValidator:
             'final_confidence': 0.0
         }
 
+        # Normalised once and shared by every check
         query_lower = query.lower()
-        metadata = metadata or {}
+        response_lower = response.lower()
 
         # Layer 1: Run hallucination checks
-        for check in self.hallucination_checks:
-            # Check if this rule applies to the category
-            applies_to = check.get('applies_to_categories', [])
-            if applies_to and intent_category not in applies_to:
-                continue
+        applicable_checks = [
+            check for check in self.hallucination_checks
+            if not check.get('applies_to_categories')
+            or intent_category in check['applies_to_categories']
+        ]
 
-            check_result = await self._run_hallucination_check(
-                check,
-                query_lower,
-                response,
-                intent_category
-            )
+        # Checks are independent, so run them concurrently against the
+        # original response; auto-fixes are applied serially afterwards
+        check_results = await self._run_checks(
+            applicable_checks, query_lower, response, response_lower, intent_category
+        )
+        skipped = sum(1 for r in check_results if r is None)
+        if skipped:
+            validation_metadata['checks_skipped'] = skipped
 
+        for check, check_result in zip(applicable_checks, check_results):
+            if check_result is None:
+                continue
             validation_metadata['checks_performed'].append(check_result)
 
             # Handle check failure based on severity
@@ -172,7 +492,7 @@ class DatabaseResponseValidator:
                     )
 
         # Layer 2: Cross-model validation if required
-        if await self._should_cross_validate(intent_category, metadata):
+        if self._should_cross_validate(intent_category, metadata):
             cross_validation_result = await self._run_cross_validation(
                 query,
                 response,
@@ -185,7 +505,7 @@ class DatabaseResponseValidator:
             )
 
             # Check confidence threshold
-            min_confidence = await self._get_min_confidence_for_category(intent_category)
+            min_confidence = self._get_min_confidence_for_category(intent_category)
             if validation_metadata['final_confidence'] < min_confidence:
                 validation_metadata['overall_valid'] = False
 
@@ -213,14 +533,90 @@ class DatabaseResponseValidator:
             validation_metadata
         )
 
+    async def _run_checks(
+        self,
+        checks: List[Dict],
+        query: str,
+        response: str,
+        response_lower: str,
+        category: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run hallucination checks, returning results in check order.
+
+        With fail_fast, error-severity checks run first; if one fails the
+        response is already invalid, so the remaining (warning-only) checks
+        are skipped and their slots are None.
+        """
+        if not self.fail_fast:
+            return list(await asyncio.gather(*[
+                self._run_bounded_check(check, query, response, response_lower, category)
+                for check in checks
+            ]))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(checks)
+        error_idx = [i for i, c in enumerate(checks) if c['severity'] == 'error']
+        other_idx = [i for i, c in enumerate(checks) if c['severity'] != 'error']
+
+        for tier in (error_idx, other_idx):
+            tier_results = await asyncio.gather(*[
+                self._run_bounded_check(checks[i], query, response, response_lower, category)
+                for i in tier
+            ])
+            for i, result in zip(tier, tier_results):
+                results[i] = result
+
+            if not all(r['passed'] for r in tier_results):
+                # Response is already invalid; later checks can't change that
+                break
+
+        return results
+
+    async def _run_bounded_check(
+        self,
+        check: Dict,
+        query: str,
+        response: str,
+        response_lower: str,
+        category: str
+    ) -> Dict[str, Any]:
+        """Run a hallucination check under the concurrency limit"""
+        async with self._check_sem:
+            return await self._run_hallucination_check(
+                check, query, response, response_lower, category
+            )
+
     async def _run_hallucination_check(
         self,
         check: Dict,
         query: str,
         response: str,
+        response_lower: str,
+        category: str
+    ) -> Dict[str, Any]:
+        """
+        Run a single hallucination check.
+        Long responses are scanned in a worker thread so regex work doesn't
+        block the event loop.
+        """
+        if len(response) > CHECK_OFFLOAD_THRESHOLD:
+            return await asyncio.to_thread(
+                self._run_hallucination_check_sync,
+                check, query, response, response_lower, category
+            )
+        return self._run_hallucination_check_sync(
+            check, query, response, response_lower, category
+        )
+
+    def _run_hallucination_check_sync(
+        self,
+        check: Dict,
+        query: str,
+        response: str,
+        response_lower: str,
         category: str
     ) -> Dict[str, Any]:
-        """Run a single hallucination check"""
+        """Check body; pure CPU work"""
         check_type = check['check_type']
         config = check.get('configuration', {})
 
@@ -234,24 +630,17 @@ class DatabaseResponseValidator:
         try:
             if check_type == 'required_elements':
                 # Check if response contains required elements
-                response_lower = response.lower()
-                required_patterns = config.get('patterns', [])
                 query_patterns = config.get('query_patterns', [])
 
                 # Only check if query matches trigger patterns
                 should_check = any(p in query for p in query_patterns)
 
                 if should_check:
-                    has_required = False
-                    for pattern in required_patterns:
-                        if '\\d' in pattern:  # Regex pattern
-                            if re.search(pattern, response):
-                                has_required = True
-                                break
-                        else:  # Simple substring
-                            if pattern in response_lower:
-                                has_required = True
-                                break
+                    has_required = (
+                        (check['_literal_re'] is not None
+                         and check['_literal_re'].search(response_lower) is not None)
+                        or any(p.search(response) for p in check['_compiled_patterns'])
+                    )
 
                     if not has_required:
                         result['passed'] = False
@@ -266,8 +655,8 @@ class DatabaseResponseValidator:
 
                 if fact_config.get('check_numbers'):
                     # Extract numbers from both query and response
-                    query_numbers = set(re.findall(r'\d+', query))
-                    response_numbers = set(re.findall(r'\d+', response))
+                    query_numbers = _extract_numbers(query)
+                    response_numbers = _extract_numbers(response)
 
                     # If query has specific numbers, response should reference them
                     if query_numbers and not query_numbers.intersection(response_numbers):
@@ -284,12 +673,22 @@ class DatabaseResponseValidator:
 
         return result
 
-    async def _should_cross_validate(
+    def _should_cross_validate(
         self,
         category: str,
         metadata: Dict
     ) -> bool:
         """Determine if cross-validation is needed"""
+        required = self._requires_cross_validation.get(category)
+        if required is None:
+            required = self._category_requires_cross_validation(category)
+            self._requires_cross_validation[category] = required
+
+        # Check confidence threshold
+        return required or metadata.get('confidence', 1.0) < 0.6
+
+    def _category_requires_cross_validation(self, category: str) -> bool:
+        """Whether the loaded configuration always cross-validates a category"""
         # Check if any hallucination check requires it
         for check in self.hallucination_checks:
             if check.get('require_cross_model_validation'):
@@ -297,11 +696,6 @@ class DatabaseResponseValidator:
                 if not applies_to or category in applies_to:
                     return True
 
-        # Check confidence threshold
-        confidence = metadata.get('confidence', 1.0)
-        if confidence < 0.6:
-            return True
-
         # Check if category requires validation
         validation_models = [
             m for m in self.cross_validation_models
@@ -317,35 +711,53 @@ class DatabaseResponseValidator:
         category: str
     ) -> Dict[str, Any]:
         """Run cross-model validation using configured models"""
+        if self.local_scorer is not None:
+            local_result = await self._run_local_scorer(query, response)
+            if local_result is not None:
+                return local_result
+
         validation_results = []
 
-        # Get applicable models
-        applicable_models = [
+        # Get applicable validation models
+        validation_models = [
             m for m in self.cross_validation_models
-            if not m.get('use_for_categories') or category in m.get('use_for_categories', [])
+            if (not m.get('use_for_categories') or category in m.get('use_for_categories', []))
+            and m['model_type'] == 'validation'
         ]
 
-        # Run validation with each model
-        for model in applicable_models:
-            if model['model_type'] == 'validation':
-                model_result = await self._validate_with_model(
-                    model,
-                    query,
-                    response
-                )
-                validation_results.append({
-                    'model': model['name'],
-                    'confidence': model_result['confidence'],
-                    'weight': float(model.get('weight', 1.0)),
-                    'assessment': model_result.get('assessment')
-                })
+        # Query all validation models concurrently
+        model_results = await asyncio.gather(
+            *[self._validate_with_model_bounded(m, query, response) for m in validation_models],
+            return_exceptions=True
+        )
+
+        for model, model_result in zip(validation_models, model_results):
+            if isinstance(model_result, Exception):
+                logger.error(f"Validation with model '{model['name']}' failed: {model_result}")
+                model_result = {
+                    'confidence': 0.5,
+                    'assessment': 'Validation error',
+                    'error': str(model_result)
+                }
+            result = {
+                'model': model['name'],
+                'confidence': model_result['confidence'],
+                'weight': float(model.get('weight', 1.0)),
+                'assessment': model_result.get('assessment')
+            }
+            if model_result.get('error'):
+                result['error'] = model_result['error']
+            validation_results.append(result)
 
         # Calculate ensemble confidence
         if validation_results:
-            total_weight = sum(r['weight'] for r in validation_results)
-            weighted_confidence = sum(
-                r['confidence'] * r['weight'] for r in validation_results
-            ) / max(total_weight, 1.0)
+            # Single pass over the results for both sums
+            total_weight = 0.0
+            weighted_sum = 0.0
+            for r in validation_results:
+                total_weight += r['weight']
+                weighted_sum += r['confidence'] * r['weight']
+            weighted_confidence = weighted_sum / max(total_weight, 1.0)
         else:
             weighted_confidence = 0.7  # Default if no validation models
 
@@ -355,6 +767,43 @@ class DatabaseResponseValidator:
             'ensemble_confidence': weighted_confidence
         }
 
+    async def _run_local_scorer(
+        self,
+        query: str,
+        response: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Score with the local classifier.
+        Returns a cross-validation result when the score is confident enough,
+        or None to escalate to the LLM validators.
+        """
+        try:
+            score = float(await asyncio.to_thread(self.local_scorer, query, response))
+        except Exception as e:
+            logger.error(f"Local hallucination scorer failed: {e}")
+            return None
+
+        low, high = self.local_uncertainty_band
+        if low < score < high:
+            return None
+
+        return {
+            'models_used': 0,
+            'results': [],
+            'ensemble_confidence': score,
+            'local_only': True
+        }
+
+    async def _validate_with_model_bounded(
+        self,
+        model_config: Dict,
+        query: str,
+        response: str
+    ) -> Dict[str, Any]:
+        """Validate with a model under the LLM concurrency limit"""
+        async with self._llm_sem:
+            return await self._validate_with_model(model_config, query, response)
+
     async def _validate_with_model(
         self,
         model_config: Dict,
@@ -377,45 +826,60 @@ class DatabaseResponseValidator:
             Format: CONFIDENCE: X.X | ASSESSMENT: <text> | ISSUES: <text or none>
             """
 
-            # Call validation model
+            # Call validation model, streaming so we can stop reading once
+            # the fields we use have been generated
             endpoint = model_config.get('endpoint_url', self.llm_service_url)
-            result = await self.client.post(
+            async with self.client.stream(
+                "POST",
                 f"{endpoint}/api/generate",
                 json={
                     "model": model_config['model_id'],
                     "prompt": validation_prompt,
                     "temperature": float(model_config.get('temperature', 0.1)),
                     "max_tokens": model_config.get('max_tokens', 200),
-                    "stream": False
+                    "stream": True
                 },
                 timeout=model_config.get('timeout_seconds', 30)
-            )
-
-            if result.status_code == 200:
-                response_text = result.json().get('response', '')
-
-                # Parse response
-                confidence = 0.5  # Default
-                assessment = ""
-                issues = ""
-
-                confidence_match = re.search(r'CONFIDENCE:\s*(\d\.\d+)', response_text)
-                if confidence_match:
-                    confidence = float(confidence_match.group(1))
-
-                assessment_match = re.search(r'ASSESSMENT:\s*([^|]+)', response_text)
-                if assessment_match:
-                    assessment = assessment_match.group(1).strip()
-
-                issues_match = re.search(r'ISSUES:\s*(.+)', response_text)
-                if issues_match:
-                    issues = issues_match.group(1).strip()
+            ) as result:
+                if result.status_code != 200:
+                    return {'confidence': 0.5, 'assessment': 'Default'}
+
+                response_text = ""
+                async for line in result.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    response_text += chunk.get('response', '')
+                    if chunk.get('done'):
+                        break
+                    # Confidence and assessment are all the ensemble uses;
+                    # leaving the block closes the stream early
+                    if (_CONFIDENCE_DONE_RE.search(response_text)
+                            and _ASSESSMENT_DONE_RE.search(response_text)):
+                        break
+
+            # Parse response
+            confidence = 0.5  # Default
+            assessment = ""
+            issues = ""
+
+            confidence_match = _CONFIDENCE_RE.search(response_text)
+            if confidence_match:
+                confidence = float(confidence_match.group(1))
+
+            assessment_match = _ASSESSMENT_RE.search(response_text)
+            if assessment_match:
+                assessment = assessment_match.group(1).strip()
+
+            issues_match = _ISSUES_RE.search(response_text)
+            if issues_match:
+                issues = issues_match.group(1).strip()
 
-                return {
-                    'confidence': confidence,
-                    'assessment': assessment,
-                    'issues': issues if issues and issues.lower() != 'none' else None
-                }
+            return {
+                'confidence': confidence,
+                'assessment': assessment,
+                'issues': issues if issues and issues.lower() != 'none' else None
+            }
 
         except Exception as e:
             logger.error(f"Validation with model '{model_config['name']}' failed: {e}")
@@ -491,77 +955,40 @@ class DatabaseResponseValidator:
         if category not in self.confidence_rules:
             return adjustments
 
-        for rule in self.confidence_rules[category]:
-            try:
-                factor_name = rule['factor_name']
-                factor_type = rule['factor_type']
-                condition = rule.get('condition', {})
-                adjustment_value = float(rule['adjustment_value'])
-                max_impact = float(rule.get('max_impact', 0.2))
-
-                should_apply = False
-                actual_adjustment = 0.0
-
-                # Check different factor types
-                if factor_name == 'pattern_match_count':
-                    # Based on number of pattern matches
-                    match_count = len(metadata.get('matched_patterns', []))
-                    min_matches = condition.get('min_matches', 1)
-
-                    if match_count >= min_matches:
-                        should_apply = True
-                        # Scale adjustment based on match count
-                        actual_adjustment = min(
-                            adjustment_value * (match_count / max(min_matches, 1)),
-                            max_impact
-                        )
+        for factor_name, rules in self.confidence_rules[category].items():
+            compute_adjustment = _CONFIDENCE_FACTORS[factor_name]
 
-                elif factor_name == 'entity_presence':
-                    # Based on entity extraction
-                    entities = metadata.get('entities', {})
-                    required_entities = condition.get('required_entities', [])
-
-                    if all(e in entities for e in required_entities):
-                        should_apply = True
-                        actual_adjustment = adjustment_value
-
-                elif factor_name == 'query_length':
-                    # Based on query complexity
-                    word_count = len(query.split())
-                    min_words = condition.get('min_words', 5)
-                    max_words = condition.get('max_words', 50)
-
-                    if min_words <= word_count <= max_words:
-                        should_apply = True
-                        actual_adjustment = adjustment_value
-
-                if should_apply:
-                    # Apply factor type (boost, penalty, multiplier)
-                    if factor_type == 'penalty':
-                        actual_adjustment = -abs(actual_adjustment)
-
-                    adjustments.append({
-                        'rule': rule['factor_name'],
-                        'type': factor_type,
-                        'value': actual_adjustment,
-                        'reason': f"Applied {factor_name} rule"
-                    })
+            for rule in rules:
+                try:
+                    factor_type = rule['factor_type']
+                    actual_adjustment = compute_adjustment(
+                        rule.get('condition', {}),
+                        float(rule['adjustment_value']),
+                        float(rule.get('max_impact', 0.2)),
+                        query,
+                        metadata
+                    )
 
-            except Exception as e:
-                logger.error(f"Error applying confidence rule: {e}")
+                    if actual_adjustment is not None:
+                        # Apply factor type (boost, penalty, multiplier)
+                        if factor_type == 'penalty':
+                            actual_adjustment = -abs(actual_adjustment)
+
+                        adjustments.append({
+                            'rule': factor_name,
+                            'type': factor_type,
+                            'value': actual_adjustment,
+                            'reason': f"Applied {factor_name} rule"
+                        })
+
+                except Exception as e:
+                    logger.error(f"Error applying confidence rule: {e}")
 
         return adjustments
 
-    async def _get_min_confidence_for_category(self, category: str) -> float:
+    def _get_min_confidence_for_category(self, category: str) -> float:
         """Get minimum confidence threshold for a category"""
-        async with self.db_pool.acquire() as conn:
-            threshold = await conn.fetchval("""
-                SELECT confidence_threshold
-                FROM intent_categories
-                WHERE name = $1
-            """, category)
-
-        return float(threshold) if threshold else 0.7
+        return self.category_thresholds.get(category, 0.7)
 
     async def test_validation(
         self,
@@ -569,10 +996,7 @@ class DatabaseResponseValidator:
     ) -> Dict[str, Any]:
         """Test validation with a specific scenario from database"""
         async with self.db_pool.acquire() as conn:
-            scenario = await conn.fetchrow("""
-                SELECT * FROM validation_test_scenarios
-                WHERE id = $1
-            """, test_scenario_id)
+            scenario = await conn.fetchrow(_SCENARIO_SQL, test_scenario_id)
 
             if not scenario:
                 return {'error': 'Test scenario not found'}
@@ -586,27 +1010,74 @@ class DatabaseResponseValidator:
             )
 
             # Check against expected
-            result = {
-                'scenario': dict(scenario),
-                'actual_valid': is_valid,
-                'expected_valid': scenario['expected_validation_result'] == 'pass',
-                'passed': is_valid == (scenario['expected_validation_result'] == 'pass'),
-                'final_response': final_response,
-                'metadata': metadata
-            }
+            result = self._build_test_result(scenario, is_valid, final_response, metadata)
 
             # Update test result in database
-            await conn.execute("""
-                UPDATE validation_test_scenarios
-                SET last_run_result = $1, last_run_date = $2
-                WHERE id = $3
-            """, json.dumps(result), datetime.now(), test_scenario_id)
+            await conn.execute(
+                _UPDATE_SCENARIO_SQL,
+                orjson.dumps(result, default=str).decode(), test_scenario_id
+            )
 
         return result
 
+    async def test_validation_batch(
+        self,
+        test_scenario_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Test validation for several scenarios at once.
+        Scenarios are validated concurrently and their results written back
+        in a single executemany.
+        """
+        async with self.db_pool.acquire() as conn:
+            scenarios = await conn.fetch(_SCENARIOS_SQL, test_scenario_ids)
+
+        validations = await asyncio.gather(*[
+            self.validate_response(
+                scenario['test_query'],
+                scenario['initial_response'],
+                scenario['category'],
+                {}
+            )
+            for scenario in scenarios
+        ])
+
+        results = [
+            self._build_test_result(scenario, *validation)
+            for scenario, validation in zip(scenarios, validations)
+        ]
+
+        if results:
+            async with self.db_pool.acquire() as conn:
+                await conn.executemany(_UPDATE_SCENARIO_SQL, [
+                    (orjson.dumps(result, default=str).decode(), scenario['id'])
+                    for scenario, result in zip(scenarios, results)
+                ])
+
+        return results
+
+    def _build_test_result(
+        self,
+        scenario: asyncpg.Record,
+        is_valid: bool,
+        final_response: str,
+        metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Compare a validation outcome against the scenario's expectation"""
+        expected_valid = scenario['expected_validation_result'] == 'pass'
+        return {
+            'scenario': dict(scenario),
+            'actual_valid': is_valid,
+            'expected_valid': expected_valid,
+            'passed': is_valid == expected_valid,
+            'final_response': final_response,
+            'metadata': metadata
+        }
+
     async def close(self):
         """Clean up resources"""
         await self.client.aclose()
-        if hasattr(self, 'pubsub'):
-            await self.pubsub.unsubscribe()
-            await self.pubsub.close()
\ No newline at end of file
+        if self._listener_task:
+            self._listener_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener_task
\ No newline at end of file
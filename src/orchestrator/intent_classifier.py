@@ -8,10 +8,99 @@ from enum import Enum
 import re
 import logging
 import asyncio
+from collections import OrderedDict
+import ahocorasick
 from shared.admin_config import get_admin_client
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct queries kept in the classification result cache
+CLASSIFY_CACHE_SIZE = 2048
+
+# Score bucket ids: fixed slots for the non-category keyword families, then one
+# slot per info category in info_patterns order. Integer slots index a flat
+# count list, avoiding the Python-level Enum.__hash__ a dict of categories pays.
+_CONTROL = 0
+_ACTION = 1
+_DEVICE = 2
+_ROOM = 3
+_COMPLEX = 4
+_FIRST_CATEGORY = 5
+
+# "How to" / "what is" phrasing that marks a weather-word hit as general info
+_HOW_TO_RE = re.compile(
+    r'\bhow (to|do|does|can|should)\b'
+    r'|\bwhat (is|are|was|were)\b.*\b(snowboard|ski|brain|drain)\b',
+    re.IGNORECASE
+)
+
+# Entity extraction patterns (queries arrive lowercased)
+_TEMPERATURE_RE = re.compile(r'(\d+)\s*(?:degrees?|°)')
+_PERCENT_RE = re.compile(r'(\d+)\s*(?:%|percent)')
+_LOCATION_RE = re.compile(r'in\s+([a-z]+(?:\s+[a-z]+)?(?:\s+[a-z]+)?)')
+_FLIGHT_RE = re.compile(r'([A-Z]{2})\s*(\d+)')
+
+# Entity lookup tables
+_COLORS = ("red", "blue", "green", "white", "warm", "cool", "yellow", "purple", "orange")
+_WEATHER_TIMEFRAMES = {
+    "today": "today",
+    "tonight": "tonight",
+    "tomorrow": "tomorrow",
+    "weekend": "weekend",
+    "next week": "next_week",
+    "this week": "this_week"
+}
+# Future timeframes or phrasing ("will", "going to") that call for a forecast
+_FORECAST_KEYWORDS = (
+    "tomorrow", "weekend", "next week", "this week",
+    "will it", "going to", "is it going to",
+    "when will", "when is it going to"
+)
+_TEAMS = {
+    "ravens": "Baltimore Ravens",
+    "orioles": "Baltimore Orioles",
+    "terps": "Maryland Terrapins",
+    "caps": "Washington Capitals",
+    "commanders": "Washington Commanders"
+}
+_AIRPORT_CODES = {
+    "bwi": "BWI",
+    "dulles": "IAD",
+    "reagan": "DCA",
+    "national": "DCA",
+    "philadelphia": "PHL"
+}
+
+# Every other literal probed by entity extraction and complexity checks. These
+# ride along in the automaton so those probes are set lookups on its hits;
+# a new literal test must be listed here or it will never match.
+_LITERAL_KEYWORDS = (
+    *_COLORS, *_WEATHER_TIMEFRAMES, *_FORECAST_KEYWORDS, *_TEAMS, *_AIRPORT_CODES,
+    "last", "yesterday", "next", "upcoming", "today", "tonight",
+    "score", "schedule", "tickets", "arrival", "departure", "delay",
+    " if ", " unless ", " versus ", " vs ", " or "
+)
+
+# Openers of questions that need reasoning; prefixes, so "what's" counts too
+_QUESTION_PREFIXES = ("why", "how", "what", "when", "where", "who", "which")
+
+# Common words that don't affect intent, dropped from cache keys
+_STOPWORDS = frozenset({"the", "a", "an", "is", "are", "what", "whats", "please", "can", "you"})
+
+
+def _rank_keywords(pairs) -> Dict[str, Tuple[int, str]]:
+    """Map each keyword to (position of its first listing, value)"""
+    ranks: Dict[str, Tuple[int, str]] = {}
+    for position, (keyword, value) in enumerate(pairs):
+        ranks.setdefault(keyword, (position, value))
+    return ranks
+
+
+def _first_listed(hits, ranks: Dict[str, Tuple[int, str]]) -> Optional[str]:
+    """Value of the earliest-listed keyword among the hits, or None"""
+    found = [ranks[keyword] for keyword in hits if keyword in ranks]
+    return min(found)[1] if found else None
+
 
 class IntentCategory(Enum):
     """Comprehensive intent categories from Jetson facades"""
@@ -28,9 +117,17 @@ class IntentCategory(Enum):
     UNKNOWN = "unknown"
 
 
+# Admin API category strings that may carry patterns ("unknown" never does)
+_CATEGORY_MAP: Dict[str, IntentCategory] = {
+    c.value: c for c in IntentCategory if c is not IntentCategory.UNKNOWN
+}
+
+
 class IntentClassification:
     """Intent classification result with confidence and entities"""
 
+    __slots__ = ("category", "confidence", "entities", "requires_llm", "cache_key", "sub_intents")
+
     def __init__(self):
         self.category: IntentCategory = IntentCategory.UNKNOWN
         self.confidence: float = 0.0
@@ -39,6 +136,37 @@ class IntentClassification:
         self.cache_key: Optional[str] = None
         self.sub_intents: List['IntentClassification'] = []  # For multi-intent
 
+    def copy(self) -> 'IntentClassification':
+        """Copy with its own entities/sub_intents containers"""
+        clone = IntentClassification.__new__(IntentClassification)
+        clone.category = self.category
+        clone.confidence = self.confidence
+        clone.entities = dict(self.entities)
+        clone.requires_llm = self.requires_llm
+        clone.cache_key = self.cache_key
+        clone.sub_intents = list(self.sub_intents)
+        return clone
+
+
+class _ClassifierState:
+    """
+    Immutable snapshot of the info patterns and the automaton built from them.
+    Reloads publish a new snapshot with a single assignment, so a
+    classification reads one consistent state without locking.
+    """
+
+    __slots__ = ("info_patterns", "categories", "automaton")
+
+    def __init__(
+        self,
+        info_patterns: Dict[IntentCategory, List[str]],
+        automaton: ahocorasick.Automaton
+    ):
+        self.info_patterns = info_patterns
+        # Category per slot, offset by _FIRST_CATEGORY
+        self.categories = tuple(info_patterns)
+        self.automaton = automaton
+
 
 class EnhancedIntentClassifier:
     """
@@ -142,33 +270,109 @@ class EnhancedIntentClassifier:
         self._db_load_attempted = False
         self._db_load_task: Optional[asyncio.Task] = None
 
+        self._state = self._build_state(self.info_patterns)
+
+        # Entity keyword -> (list position, value) so extraction walks only the
+        # scan's hits and still picks the first-listed match
+        self._room_ranks = _rank_keywords((room, room) for room in self.room_entities)
+        self._device_ranks = _rank_keywords((device, device) for device in self.device_entities)
+        self._action_ranks = _rank_keywords(
+            (keyword, action)
+            for action, keywords in self.action_keywords.items()
+            for keyword in keywords
+        )
+
+        # Results keyed on the lowercased, stripped query; cleared on pattern reload
+        self._result_cache: OrderedDict[str, IntentClassification] = OrderedDict()
+
+    def _build_state(self, info_patterns: Dict[IntentCategory, List[str]]) -> _ClassifierState:
+        """
+        Build one Aho-Corasick automaton over every keyword family so a query
+        is scanned once. Each pattern's payload is the reverse index entry for
+        it: the pattern and the bucket slots it counts towards, repeated once
+        per listing so scores match the per-list substring counts.
+        """
+        buckets: Dict[str, List[int]] = {}
+
+        def add(patterns, bucket):
+            for pattern in patterns:
+                if pattern:
+                    buckets.setdefault(pattern, []).append(bucket)
+
+        for patterns in self.control_patterns.values():
+            add(patterns, _CONTROL)
+        for slot, patterns in enumerate(info_patterns.values(), _FIRST_CATEGORY):
+            add(patterns, slot)
+        for keywords in self.action_keywords.values():
+            add(keywords, _ACTION)
+        add(self.device_entities, _DEVICE)
+        add(self.room_entities, _ROOM)
+        add(self.complex_indicators, _COMPLEX)
+        for pattern in _LITERAL_KEYWORDS:
+            buckets.setdefault(pattern, [])
+
+        automaton = ahocorasick.Automaton()
+        for pattern, slots in buckets.items():
+            automaton.add_word(pattern, (pattern, tuple(slots)))
+        automaton.make_automaton()
+        return _ClassifierState(info_patterns, automaton)
+
+    def _scan(self, state: _ClassifierState, query: str) -> Tuple[Dict[str, Tuple[int, ...]], List[int]]:
+        """
+        Single pass over the query feeding every later layer.
+        Returns the distinct keywords found (mapped to their bucket slots)
+        and the hit count per bucket slot.
+        """
+        hits = dict(payload for _, payload in state.automaton.iter(query))
+        counts = [0] * (_FIRST_CATEGORY + len(state.info_patterns))
+        for slots in hits.values():
+            for slot in slots:
+                counts[slot] += 1
+        return hits, counts
+
     def _ensure_db_loading_started(self):
         """
         Ensure database loading has been started (non-blocking).
         Creates a background task on first call to load patterns from database.
         """
-        if not self._db_load_attempted:
-            self._db_load_attempted = True
-            try:
-                # Try to get the current event loop
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Create background task to load patterns
-                    self._db_load_task = loop.create_task(self._load_db_patterns_async())
-                    logger.info("Started background task to load intent patterns from database")
-                else:
-                    logger.info("No running event loop, using hardcoded intent patterns")
-            except RuntimeError:
-                logger.info("No event loop available, using hardcoded intent patterns")
+        if self._db_load_attempted:
+            return
+
+        self._db_load_attempted = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.info("No running event loop, using hardcoded intent patterns")
+            return
+
+        # Create background task to load patterns
+        self._db_load_task = loop.create_task(self._load_db_patterns_async())
+        logger.info("Started background task to load intent patterns from database")
+
+    async def warmup(self):
+        """
+        Load database patterns and exercise the classification path up front,
+        so the first request doesn't pay for the fetch and automaton rebuild.
+        """
+        # Loading inline here replaces the lazy background load
+        self._db_load_attempted = True
+        await self._load_db_patterns_async()
+        self._classify_uncached("weather")
+        logger.info("Intent classifier warmed up")
 
     async def _load_db_patterns_async(self):
         """Background task to load intent patterns from database."""
         try:
             db_patterns = await self._fetch_db_patterns()
             if db_patterns:
-                # Merge/replace hardcoded patterns with database patterns
+                # Merge/replace hardcoded patterns with database patterns into
+                # a fresh snapshot; in-flight classifications keep the old one
+                info_patterns = {**self._state.info_patterns, **db_patterns}
+                state = self._build_state(info_patterns)
                 self._db_patterns = db_patterns
-                self.info_patterns.update(db_patterns)
+                self._state = state
+                self.info_patterns = info_patterns
+                self._result_cache.clear()
                 logger.info(
                     f"Loaded {sum(len(kws) for kws in db_patterns.values())} intent patterns "
                     f"from database across {len(db_patterns)} categories"
@@ -193,21 +397,9 @@ class EnhancedIntentClassifier:
             # Convert from Dict[category_string, List[keywords]]
             # to Dict[IntentCategory, List[keywords]]
             converted: Dict[IntentCategory, List[str]] = {}
-            category_map = {
-                "control": IntentCategory.CONTROL,
-                "weather": IntentCategory.WEATHER,
-                "sports": IntentCategory.SPORTS,
-                "airports": IntentCategory.AIRPORTS,
-                "transit": IntentCategory.TRANSIT,
-                "food": IntentCategory.FOOD,
-                "emergency": IntentCategory.EMERGENCY,
-                "events": IntentCategory.EVENTS,
-                "location": IntentCategory.LOCATION,
-                "general_info": IntentCategory.GENERAL_INFO
-            }
 
             for category_str, keywords in raw_patterns.items():
-                intent_cat = category_map.get(category_str)
+                intent_cat = _CATEGORY_MAP.get(category_str)
                 if intent_cat:
                     converted[intent_cat] = keywords
 
@@ -227,18 +419,52 @@ class EnhancedIntentClassifier:
         # Ensure database loading has started (lazy loading)
         self._ensure_db_loading_started()
 
-        result = IntentClassification()
+        return self._classify_sync(query)
+
+    async def classify_batch(self, queries: List[str]) -> List[IntentClassification]:
+        """
+        Classify several queries (e.g. multi-intent splits) in one call.
+        Classification never awaits once patterns are loaded, so the batch
+        runs inline rather than paying executor dispatch per sub-query.
+        """
+        self._ensure_db_loading_started()
+
+        return [self._classify_sync(query) for query in queries]
+
+    def _classify_sync(self, query: str) -> IntentClassification:
+        """Synchronous classification core shared by classify and classify_batch"""
         query_lower = query.lower().strip()
 
+        cached = self._result_cache.get(query_lower)
+        if cached is not None:
+            self._result_cache.move_to_end(query_lower)
+            return cached.copy()
+
+        result = self._classify_uncached(query_lower)
+
+        self._result_cache[query_lower] = result.copy()
+        if len(self._result_cache) > CLASSIFY_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+        return result
+
+    def _classify_uncached(self, query_lower: str) -> IntentClassification:
+        """Run the classification layers on an already-normalized query"""
+        result = IntentClassification()
+        # Tokenize and scan once; every layer below reads these
+        words = query_lower.split()
+        state = self._state
+        hits, counts = self._scan(state, query_lower)
+
         # Layer 1: Fast path pattern matching
-        pattern_result = self._pattern_match(query_lower)
+        pattern_result = self._pattern_match(query_lower, counts, state)
         if pattern_result:
             result.category, result.confidence = pattern_result
 
             # High confidence pattern match - skip LLM
             if result.confidence >= 0.8:
-                result.entities = self._extract_entities(query_lower, result.category)
-                result.cache_key = self._generate_cache_key(query_lower, result.category)
+                result.entities = self._extract_entities(query_lower, result.category, hits)
+                result.cache_key = self._generate_cache_key(words, result.category)
                 logger.debug(
                     f"High confidence classification: {result.category.value} "
                     f"(confidence: {result.confidence:.2f})"
@@ -246,13 +472,13 @@ class EnhancedIntentClassifier:
                 return result
 
         # Check if complex query needing LLM
-        if self._is_complex(query_lower):
+        if self._is_complex(query_lower, words, hits, counts):
             result.requires_llm = True
             result.confidence = min(result.confidence, 0.5)  # Cap confidence for complex queries
 
         # Layer 2: Entity extraction regardless of classification
-        result.entities = self._extract_entities(query_lower, result.category)
-        result.cache_key = self._generate_cache_key(query_lower, result.category)
+        result.entities = self._extract_entities(query_lower, result.category, hits)
+        result.cache_key = self._generate_cache_key(words, result.category)
 
         # If no pattern match and not complex, mark as unknown
         if result.category == IntentCategory.UNKNOWN and not result.requires_llm:
@@ -265,21 +491,20 @@ class EnhancedIntentClassifier:
 
         return result
 
-    def _pattern_match(self, query: str) -> Optional[Tuple[IntentCategory, float]]:
+    def _pattern_match(
+        self,
+        query: str,
+        counts: List[int],
+        state: _ClassifierState
+    ) -> Optional[Tuple[IntentCategory, float]]:
         """
-        Pattern-based classification with confidence scoring.
-        Returns (category, confidence) or None
+        Pattern-based classification with confidence scoring from the scan's
+        per-bucket counts. Returns (category, confidence) or None
         """
 
-        # Check control patterns first (highest priority)
-        control_score = 0
-        matched_patterns = []
-
-        for pattern_type, patterns in self.control_patterns.items():
-            for pattern in patterns:
-                if pattern in query:
-                    control_score += 1
-                    matched_patterns.append(pattern)
+        # Check control patterns first (highest priority). Any control hit
+        # returns here, before a single info category score is read.
+        control_score = counts[_CONTROL]
 
         if control_score > 0:
             # Calculate confidence based on match strength
@@ -289,43 +514,27 @@ class EnhancedIntentClassifier:
             confidence = base_confidence + confidence_boost
 
             # Boost confidence if we have both action and device
-            has_action = any(
-                action in query
-                for actions in self.action_keywords.values()
-                for action in actions
-            )
-            has_device = any(device in query for device in self.device_entities)
+            has_action = counts[_ACTION] > 0
+            has_device = counts[_DEVICE] > 0
 
             if has_action and has_device:
                 confidence = min(confidence + 0.1, 0.95)
 
             return (IntentCategory.CONTROL, confidence)
 
-        # Check information patterns
-        best_match = None
-        best_score = 0
-        total_patterns_checked = 0
-
-        for category, patterns in self.info_patterns.items():
-            score = sum(1 for p in patterns if p in query)
-            total_patterns_checked += len(patterns)
+        # Check information patterns: highest score wins, earliest category on ties
+        category_counts = counts[_FIRST_CATEGORY:]
+        best_score = max(category_counts, default=0)
 
-            if score > best_score:
-                best_score = score
-                best_match = category
+        if best_score > 0:
+            best_match = state.categories[category_counts.index(best_score)]
 
-        if best_match and best_score > 0:
             # Special handling: Exclude "how to" questions from weather classification
             # Questions like "How do you snowboard?" should not be classified as weather
             # even though they contain weather-related words like "snow"
             if best_match == IntentCategory.WEATHER:
                 # Check for "how to/do/does" patterns
-                how_to_patterns = [
-                    r'\bhow (to|do|does|can|should)\b',
-                    r'\bwhat (is|are|was|were)\b.*\b(snowboard|ski|brain|drain)\b',
-                ]
-
-                is_how_to = any(re.search(pattern, query, re.IGNORECASE) for pattern in how_to_patterns)
+                is_how_to = _HOW_TO_RE.search(query) is not None
 
                 if is_how_to:
                     # This is a "how to" or "what is" question, not a weather query
@@ -335,7 +544,7 @@ class EnhancedIntentClassifier:
 
             # Calculate confidence based on match density
             # More pattern matches relative to pattern count = higher confidence
-            pattern_count = len(self.info_patterns[best_match])
+            pattern_count = len(state.info_patterns[best_match])
             match_ratio = best_score / max(pattern_count, 1)
 
             # Base confidence starts at 0.5
@@ -355,92 +564,79 @@ class EnhancedIntentClassifier:
 
         return None
 
-    def _is_complex(self, query: str) -> bool:
+    def _is_complex(self, query: str, words: List[str], hits: Dict[str, Tuple[int, ...]], counts: List[int]) -> bool:
         """Check if query requires complex LLM processing"""
         # Check for complex indicators
-        for indicator in self.complex_indicators:
-            if indicator in query:
-                return True
+        if counts[_COMPLEX]:
+            return True
 
         # Check for questions that need reasoning
-        question_words = ["why", "how", "what", "when", "where", "who", "which"]
-        has_question = any(query.startswith(word) for word in question_words)
+        has_question = query.startswith(_QUESTION_PREFIXES)
 
         # Check for length and complexity
-        word_count = len(query.split())
+        word_count = len(words)
         is_long = word_count > 15
 
         # Multiple conditions or comparisons
-        has_multiple_conditions = " if " in query or " unless " in query
-        has_comparison = " versus " in query or " vs " in query or " or " in query
+        has_multiple_conditions = " if " in hits or " unless " in hits
+        has_comparison = " versus " in hits or " vs " in hits or " or " in hits
 
         return (has_question and word_count > 5) or is_long or has_multiple_conditions or has_comparison
 
-    def _extract_entities(self, query: str, category: IntentCategory) -> Dict[str, Any]:
-        """Extract relevant entities based on intent category"""
+    def _extract_entities(
+        self,
+        query: str,
+        category: IntentCategory,
+        hits: Dict[str, Tuple[int, ...]]
+    ) -> Dict[str, Any]:
+        """
+        Extract relevant entities based on intent category.
+        Keyword lookups are probes against the scan's hits.
+        """
         entities = {}
 
         if category == IntentCategory.CONTROL:
             # Extract room/location
-            for room in self.room_entities:
-                if room in query:
-                    entities["room"] = room
-                    break
+            room = _first_listed(hits, self._room_ranks)
+            if room:
+                entities["room"] = room
 
             # Extract device
-            for device in self.device_entities:
-                if device in query:
-                    entities["device"] = device
-                    break
+            device = _first_listed(hits, self._device_ranks)
+            if device:
+                entities["device"] = device
 
             # Extract action
-            for action, keywords in self.action_keywords.items():
-                if any(keyword in query for keyword in keywords):
-                    entities["action"] = action
-                    break
+            action = _first_listed(hits, self._action_ranks)
+            if action:
+                entities["action"] = action
 
             # Extract numeric values
             # Temperature
-            temp_match = re.search(r'(\d+)\s*(?:degrees?|°)', query)
+            temp_match = _TEMPERATURE_RE.search(query)
             if temp_match:
                 entities["temperature"] = int(temp_match.group(1))
 
             # Brightness/percentage
-            percent_match = re.search(r'(\d+)\s*(?:%|percent)', query)
+            percent_match = _PERCENT_RE.search(query)
             if percent_match:
                 entities["brightness"] = int(percent_match.group(1))
 
             # Color
-            colors = ["red", "blue", "green", "white", "warm", "cool", "yellow", "purple", "orange"]
-            for color in colors:
-                if color in query:
+            for color in _COLORS:
+                if color in hits:
                     entities["color"] = color
                     break
 
         elif category == IntentCategory.WEATHER:
             # Extract time references
-            time_refs = {
-                "today": "today",
-                "tonight": "tonight",
-                "tomorrow": "tomorrow",
-                "weekend": "weekend",
-                "next week": "next_week",
-                "this week": "this_week"
-            }
-            for ref, value in time_refs.items():
-                if ref in query:
+            for ref, value in _WEATHER_TIMEFRAMES.items():
+                if ref in hits:
                     entities["timeframe"] = value
                     break
 
             # Mark if forecast is needed (future timeframes or keywords like "will", "going to")
-            future_keywords = [
-                "tomorrow", "weekend", "next week", "this week",
-                "will it", "going to", "is it going to",
-                "when will", "when is it going to"
-            ]
-
-            # Check if question is about future weather
-            if any(keyword in query for keyword in future_keywords):
+            if any(keyword in hits for keyword in _FORECAST_KEYWORDS):
                 entities["forecast"] = True
             # Default to current weather
             elif "timeframe" not in entities or entities["timeframe"] == "today":
@@ -448,7 +644,7 @@ class EnhancedIntentClassifier:
 
             # Extract location if specified (works with lowercase queries)
             # Patterns: "in chicago", "in new york", "in los angeles", "weather in seattle"
-            location_match = re.search(r'in\s+([a-z]+(?:\s+[a-z]+)?(?:\s+[a-z]+)?)', query)
+            location_match = _LOCATION_RE.search(query)
             if location_match:
                 # Capitalize each word in the location
                 location = location_match.group(1).strip()
@@ -457,71 +653,53 @@ class EnhancedIntentClassifier:
 
         elif category == IntentCategory.SPORTS:
             # Extract team names
-            teams = {
-                "ravens": "Baltimore Ravens",
-                "orioles": "Baltimore Orioles",
-                "terps": "Maryland Terrapins",
-                "caps": "Washington Capitals",
-                "commanders": "Washington Commanders"
-            }
-            for team_key, team_name in teams.items():
-                if team_key in query:
+            for team_key, team_name in _TEAMS.items():
+                if team_key in hits:
                     entities["team"] = team_name
                     break
 
             # Extract time references
-            if "last" in query or "yesterday" in query:
+            if "last" in hits or "yesterday" in hits:
                 entities["timeframe"] = "past"
-            elif "next" in query or "upcoming" in query:
+            elif "next" in hits or "upcoming" in hits:
                 entities["timeframe"] = "future"
-            elif "today" in query or "tonight" in query:
+            elif "today" in hits or "tonight" in hits:
                 entities["timeframe"] = "current"
 
             # Check for specific info requested
-            if "score" in query:
+            if "score" in hits:
                 entities["info_type"] = "score"
-            elif "schedule" in query:
+            elif "schedule" in hits:
                 entities["info_type"] = "schedule"
-            elif "tickets" in query:
+            elif "tickets" in hits:
                 entities["info_type"] = "tickets"
 
         elif category == IntentCategory.AIRPORTS:
             # Extract airport codes
-            airports = {
-                "bwi": "BWI",
-                "dulles": "IAD",
-                "reagan": "DCA",
-                "national": "DCA",
-                "philadelphia": "PHL"
-            }
-            for airport_key, code in airports.items():
-                if airport_key in query:
+            for airport_key, code in _AIRPORT_CODES.items():
+                if airport_key in hits:
                     entities["airport"] = code
                     break
 
             # Extract flight info
-            if "arrival" in query:
+            if "arrival" in hits:
                 entities["info_type"] = "arrival"
-            elif "departure" in query:
+            elif "departure" in hits:
                 entities["info_type"] = "departure"
-            elif "delay" in query:
+            elif "delay" in hits:
                 entities["info_type"] = "delay"
 
             # Extract flight number if present
-            flight_match = re.search(r'([A-Z]{2})\s*(\d+)', query)
+            flight_match = _FLIGHT_RE.search(query)
             if flight_match:
                 entities["flight"] = f"{flight_match.group(1)}{flight_match.group(2)}"
 
         return entities
 
-    def _generate_cache_key(self, query: str, category: IntentCategory) -> str:
-        """Generate a cache key for the query"""
-        # Normalize query for caching
-        normalized = re.sub(r'\s+', ' ', query.lower().strip())
+    def _generate_cache_key(self, words: List[str], category: IntentCategory) -> str:
+        """Generate a cache key from the lowercased query words"""
         # Remove common words that don't affect intent
-        stopwords = ["the", "a", "an", "is", "are", "what", "whats", "please", "can", "you"]
-        words = normalized.split()
-        filtered = [w for w in words if w not in stopwords]
+        filtered = [w for w in words if w not in _STOPWORDS]
         key_base = "_".join(filtered[:5])  # Use first 5 significant words
         return f"{category.value}:{key_base}"
 
@@ -582,8 +760,27 @@ class EnhancedIntentClassifier:
     def _add_context(self, previous: str, current: str) -> str:
         """Add context from previous part if current lacks it"""
         # Extract subject from previous if current lacks it
-        if "lights" in previous.lower() and "lights" not in current.lower():
-            if "on" in current.lower() or "off" in current.lower():
+        current_lower = current.lower()
+        if "lights" in previous.lower() and "lights" not in current_lower:
+            if "on" in current_lower or "off" in current_lower:
                 current = f"lights {current}"
 
-        return current
\ No newline at end of file
+        return current
+
+
+# Global classifier instance
+_intent_classifier: Optional[EnhancedIntentClassifier] = None
+
+
+async def get_intent_classifier() -> EnhancedIntentClassifier:
+    """
+    Get global intent classifier instance, warmed up on first access.
+
+    Returns:
+        EnhancedIntentClassifier instance
+    """
+    global _intent_classifier
+    if _intent_classifier is None:
+        _intent_classifier = EnhancedIntentClassifier()
+        await _intent_classifier.warmup()
+    return _intent_classifier
@@ -11,20 +11,25 @@ LangGraph-based state machine that coordinates between:
 
 import os
 import json
+import asyncio
+import functools
 import time
 import hashlib
 import re
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Literal, Tuple
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from enum import Enum
 
+import ahocorasick
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from langgraph.graph import StateGraph, END
 from prometheus_client import Counter, Histogram, generate_latest
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 # Add to Python path for imports
 import sys
@@ -47,6 +52,9 @@ from orchestrator.config_loader import get_config
 # RAG validation imports
 from orchestrator.rag_validator import validator, ValidationResult
 
+# Pattern-based intent classification
+from orchestrator.intent_classifier import EnhancedIntentClassifier, get_intent_classifier
+
 # Configure logging
 logger = configure_logging("orchestrator")
 
@@ -66,19 +74,110 @@ node_duration = Histogram(
     'Node execution duration in seconds',
     ['node']
 )
+intent_cache_counter = Counter(
+    'orchestrator_intent_cache_total',
+    'Intent classification cache lookups',
+    ['result']
+)
+rag_cache_counter = Counter(
+    'orchestrator_rag_cache_total',
+    'RAG response cache lookups',
+    ['intent', 'result']
+)
 
 # Global clients
 ha_client: Optional[HomeAssistantClient] = None
+# Background admin bootstrap that creates ha_client; see _get_ha_client()
+_ha_init_task: Optional[asyncio.Task] = None
 llm_router: Optional[LLMRouter] = None
 cache_client: Optional[CacheClient] = None
 session_manager: Optional[SessionManager] = None
-rag_clients: Dict[str, httpx.AsyncClient] = {}
+# One pooled client for every RAG service; callers pass absolute URLs
+rag_http_client: Optional[httpx.AsyncClient] = None
+_model_warmup_task: Optional[asyncio.Task] = None
+# Event queue for the /query/stream request being processed, if any; synthesize
+# pushes answer fragments here as the LLM produces them
+_synthesis_stream: ContextVar[Optional[asyncio.Queue]] = ContextVar("synthesis_stream", default=None)
+# Fire-and-forget work (cache writes) kept referenced until it completes
+_background_tasks: set = set()
+# Shared, pre-warmed classifier; use this instead of constructing one per request
+intent_classifier: Optional[EnhancedIntentClassifier] = None
+
+# Team name -> sports team ID; teams rarely change, so resolved IDs are reused
+# for a day and the search GET only runs on a miss
+TEAM_ID_CACHE_TTL = int(os.getenv("TEAM_ID_CACHE_TTL", str(24 * 3600)))
+_TEAM_ID_CACHE_MAX = 512
+_team_id_cache: Dict[str, Tuple[str, float]] = {}
 
 # Configuration
 WEATHER_SERVICE_URL = os.getenv("RAG_WEATHER_URL", "http://localhost:8010")
 SPORTS_SERVICE_URL = os.getenv("RAG_SPORTS_URL", "http://localhost:8011")
 AIRPORTS_SERVICE_URL = os.getenv("RAG_AIRPORTS_URL", "http://localhost:8012")
-OLLAMA_URL = os.getenv("LLM_SERVICE_URL", "http://localhost:11434")
+# Database-configured intent -> RAG URL routing, refreshed in the background
+# every RAG_ROUTING_REFRESH_INTERVAL seconds; RAG_SERVICE_URLS is the fallback
+RAG_ROUTING_REFRESH_INTERVAL = float(os.getenv("RAG_ROUTING_REFRESH_INTERVAL", "30"))
+_rag_routing_table: Dict[str, str] = {}
+_rag_routing_task: Optional[asyncio.Task] = None
+
+RAG_SERVICE_URLS = {
+    "weather": WEATHER_SERVICE_URL,
+    "airports": AIRPORTS_SERVICE_URL,
+    "sports": SPORTS_SERVICE_URL,
+}
+
+# Seconds a RAG GET response is served from Redis, per intent; sized to how
+# fast the upstream data goes stale (flight status and scores move quickly)
+RAG_CACHE_TTLS = {
+    "weather": int(os.getenv("RAG_CACHE_TTL_WEATHER", "300")),
+    "airports": int(os.getenv("RAG_CACHE_TTL_AIRPORTS", "60")),
+    "sports": int(os.getenv("RAG_CACHE_TTL_SPORTS", "30")),
+}
+
+# Classification and fact-checking only emit short strict JSON, so they can run
+# on 4-bit quantized tags (e.g. "phi3:3.8b-mini-4k-instruct-q4_K_M"). Ollama's
+# default "phi3:mini" tag is itself Q4, which keeps the fallback safe to run
+# on hosts that have not pulled anything else.
+CLASSIFY_MODEL = os.getenv("CLASSIFY_MODEL", "phi3:mini")
+VALIDATE_MODEL = os.getenv("VALIDATE_MODEL", "phi3:mini")
+
+# Start RAG retrieval alongside classification when keyword patterns already
+# point at a RAG-backed intent
+SPECULATIVE_RETRIEVAL = os.getenv("ENABLE_SPECULATIVE_RETRIEVAL", "true").lower() == "true"
+
+# Classifications are keyed on the normalized query text, so repeats of common
+# commands and questions skip the LLM for hours
+INTENT_CACHE_TTL = int(os.getenv("INTENT_CACHE_TTL", str(6 * 3600)))
+
+# Specific facts that need supporting data (validate_node Layer 2):
+# dates (Month DD, YYYY or MM/DD/YYYY), times (HH:MM AM/PM), dollar amounts, phone numbers
+_FACT_RE = re.compile(
+    r'(?P<date>\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b)'
+    r'|(?P<time>\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)\b)'
+    r'|(?P<money>\$\d+(?:,\d{3})*(?:\.\d{2})?)'
+    r'|(?P<phone>\b\d{3}[-.]?\d{3}[-.]?\d{4}\b)'
+)
+# JSON object in an LLM reply (handles markdown code blocks)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+# "CATEGORY: <name>" / "CONFIDENCE: <float>" lines in a text classification reply
+_CATEGORY_RE = re.compile(r'CATEGORY:\s*(\w+)', re.IGNORECASE)
+_CONFIDENCE_RE = re.compile(r'CONFIDENCE:\s*([\d.]+)')
+# "in <city>" (up to three words) in lowercased text
+_LOCATION_RE = re.compile(r'in\s+([a-z]+(?:\s+[a-z]+)?(?:\s+[a-z]+)?)')
+# Three-letter uppercase airport code ("BWI")
+_AIRPORT_CODE_RE = re.compile(r'\b([A-Z]{3})\b')
+# Questions about a team's upcoming game ("when do the ravens play next",
+# "when is the next ravens game"), not past results ("when did they last win")
+_NEXT_GAME_RE = re.compile(
+    r'\bnext\s+(?:\w+\s+)?(?:game|match)\b'
+    r'|\bplay(?:ing)?\s+next\b'
+    r'|\bwhen\s+(?:do|does|are|is)\b.*\b(?:play(?:ing)?|game|match)\b'
+)
+# Sports event sources whose next-event payload has real matchup fields; the
+# api-football feed puts fixture status in strEvent and olympics-news events
+# are headlines
+_TEMPLATE_SPORTS_SOURCES = {"thesportsdb", "espn"}
+# Entity ID separators spoken as spaces ("light.office_ceiling" -> "light office ceiling")
+_DEVICE_NAME_TABLE = str.maketrans("_.", "  ")
 
 # Intent categories
 class IntentCategory(str, Enum):
@@ -99,6 +198,11 @@ class ModelTier(str, Enum):
 class OrchestratorState(BaseModel):
     """State that flows through the LangGraph state machine."""
 
+    # Nodes mutate the state many times per request; keep assignments
+    # unvalidated. Enums stay as members (no use_enum_values) since nodes
+    # read state.intent.value / state.model_tier.value.
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     # Input
     query: str = Field(..., description="User's query")
     mode: Literal["owner", "guest"] = Field("owner", description="User mode")
@@ -131,55 +235,64 @@ class OrchestratorState(BaseModel):
     validation_details: List[str] = Field(default_factory=list)
 
     # Metadata
-    request_id: str = Field(default_factory=lambda: hashlib.md5(str(time.time()).encode()).hexdigest()[:8])
-    start_time: float = Field(default_factory=time.time)
+    # Random rather than derived from the clock, so requests arriving in the same
+    # time.time() tick cannot share an ID (and no hash is needed)
+    request_id: str = Field(default_factory=lambda: os.urandom(4).hex())
+    # Monotonic integer clock: durations can't go negative on wall-clock steps
+    start_time_ns: int = Field(default_factory=time.perf_counter_ns)
     node_timings: Dict[str, float] = Field(default_factory=dict)
     error: Optional[str] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
-    global ha_client, llm_router, cache_client, session_manager, rag_clients, parallel_search_engine, result_fusion
+    global llm_router, cache_client, session_manager, parallel_search_engine, result_fusion, _model_warmup_task
+    global _rag_routing_task, _ha_init_task
+    global intent_classifier
 
     # Startup
-    logger.info("Starting Orchestrator service")
-
-    # Initialize clients
-    # Home Assistant client - optional, gracefully handle if unavailable
-    try:
-        # TODO: Get HA token from admin API instead of environment
-        admin_client = get_admin_client()
-        ha_token = await admin_client.get_secret("home-assistant")
-        if ha_token:
-            ha_client = HomeAssistantClient(token=ha_token)
-            logger.info("Home Assistant client initialized from database")
-        else:
-            logger.warning("HA token not in database, trying environment")
-            ha_token_env = os.getenv("HA_TOKEN")
-            if ha_token_env:
-                ha_client = HomeAssistantClient(token=ha_token_env)
-                logger.info("Home Assistant client initialized from environment")
-            else:
-                ha_client = None
-                logger.warning("Home Assistant not configured (token unavailable)")
-    except Exception as e:
-        ha_client = None
-        logger.warning(f"Home Assistant client initialization failed: {e}")
+    # uvicorn picks uvloop automatically when it is installed; log which loop
+    # actually runs so a fallback to the stdlib selector loop is visible
+    loop = asyncio.get_running_loop()
+    logger.info("Starting Orchestrator service (event loop: %s.%s)", type(loop).__module__, type(loop).__name__)
 
     # Initialize LLM router with database-driven backend configuration
     llm_router = get_llm_router()
-    logger.info(f"LLM Router initialized with admin API: {llm_router.admin_url}")
+    logger.info("LLM Router initialized with admin API: %s", llm_router.admin_url)
+
+    # Load the classify/validate models in the background so the first
+    # request does not pay the model load
+    _model_warmup_task = asyncio.create_task(_warm_models({CLASSIFY_MODEL, VALIDATE_MODEL}))
 
     cache_client = CacheClient()
 
-    # Initialize session manager
-    session_manager = await get_session_manager()
+    # Admin bootstrap (HA token, RAG routing table, search API keys in one
+    # batch) doesn't gate readiness: only control intents need Home Assistant
+    # and they wait via _get_ha_client(); RAG routing uses the env URLs until
+    # it lands. Started first so the search engine reuses its requests.
+    _ha_init_task = asyncio.create_task(_bootstrap_from_admin())
+
+    # RAG health checks only log, so they run in the background too
+    for name, url in RAG_SERVICE_URLS.items():
+        _run_in_background(_check_rag_health(name, url), f"{name} RAG health check")
+
+    # The remaining startup steps are independent network calls (admin API,
+    # database, Redis), so run them concurrently:
+    # - intent classifier (loads DB patterns and builds the matcher now,
+    #   not on the first request)
+    # - session manager
+    # - parallel search engine (async to fetch API keys from database)
+    intent_classifier, session_manager, parallel_search_engine = await asyncio.gather(
+        get_intent_classifier(),
+        get_session_manager(),
+        ParallelSearchEngine.from_environment()
+    )
+    logger.info("Intent classifier initialized")
     logger.info("Session manager initialized")
-
-    # Initialize parallel search engine (async to fetch API keys from database)
-    parallel_search_engine = await ParallelSearchEngine.from_environment()
     logger.info("Parallel search engine initialized")
 
+    _rag_routing_task = asyncio.create_task(_refresh_rag_routing_loop())
+
     # Initialize result fusion
     result_fusion = ResultFusion(
         similarity_threshold=0.7,
@@ -187,40 +300,31 @@ async def lifespan(app: FastAPI):
     )
     logger.info("Result fusion initialized")
 
-    # Initialize RAG service clients
-    rag_clients = {
-        "weather": httpx.AsyncClient(base_url=WEATHER_SERVICE_URL, timeout=30.0),
-        "airports": httpx.AsyncClient(base_url=AIRPORTS_SERVICE_URL, timeout=30.0),
-        "sports": httpx.AsyncClient(base_url=SPORTS_SERVICE_URL, timeout=30.0),
-    }
-
-    # Check service health
-    for name, client in rag_clients.items():
-        try:
-            response = await client.get("/health")
-            if response.status_code == 200:
-                logger.info(f"RAG service {name} is healthy")
-            else:
-                logger.warning(f"RAG service {name} unhealthy: {response.status_code}")
-        except Exception as e:
-            logger.warning(f"RAG service {name} not available: {e}")
-
     yield
 
     # Shutdown
     logger.info("Shutting down Orchestrator service")
+    if _ha_init_task and not _ha_init_task.done():
+        _ha_init_task.cancel()
     if ha_client:
         await ha_client.close()
+    if _model_warmup_task and not _model_warmup_task.done():
+        _model_warmup_task.cancel()
+    if _rag_routing_task:
+        _rag_routing_task.cancel()
     if llm_router:
         await llm_router.close()
+    if _background_tasks:
+        # Let in-flight cache writes land before the Redis client closes
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
     if cache_client:
         await cache_client.close()
     if session_manager:
         await session_manager.close()
     if parallel_search_engine:
         await parallel_search_engine.close_all()
-    for client in rag_clients.values():
-        await client.aclose()
+    if rag_http_client:
+        await rag_http_client.aclose()
 
 app = FastAPI(
     title="Athena Orchestrator",
@@ -233,44 +337,323 @@ app = FastAPI(
 # Helper Functions
 # ============================================================================
 
-async def get_rag_service_url(intent: str) -> Optional[str]:
+def _init_ha_client(ha_token: Optional[str]) -> Optional[HomeAssistantClient]:
+    """Create the Home Assistant client; optional, returns None if unavailable."""
+    try:
+        if ha_token:
+            logger.info("Home Assistant client initialized from database")
+            return HomeAssistantClient(token=ha_token)
+
+        logger.warning("HA token not in database, trying environment")
+        ha_token_env = os.getenv("HA_TOKEN")
+        if ha_token_env:
+            logger.info("Home Assistant client initialized from environment")
+            return HomeAssistantClient(token=ha_token_env)
+
+        logger.warning("Home Assistant not configured (token unavailable)")
+    except Exception as e:
+        logger.warning("Home Assistant client initialization failed: %s", e)
+    return None
+
+async def _bootstrap_from_admin():
+    """
+    Load startup config from the admin API in one batch and hand it out.
+
+    The search engine asks for the same routing and API keys while this runs;
+    those calls share the batch's requests or read the primed cache.
+    """
+    global ha_client
+    bootstrap = await get_admin_client().get_bootstrap_config()
+    _apply_rag_routing(bootstrap["intent_routing"])
+    ha_client = _init_ha_client(bootstrap["ha_token"])
+
+async def _get_ha_client() -> Optional[HomeAssistantClient]:
+    """Return the Home Assistant client, waiting for the startup bootstrap if it is still running."""
+    if _ha_init_task is not None and not _ha_init_task.done():
+        # Shielded so a cancelled request doesn't cancel init for everyone
+        await asyncio.shield(_ha_init_task)
+    return ha_client
+
+async def _check_rag_health(name: str, service_url: str):
+    """Log whether a RAG service answers its health endpoint."""
+    try:
+        response = await _get_rag_http_client().get(f"{service_url}/health")
+        if response.status_code == 200:
+            logger.info("RAG service %s is healthy (%s)", name, response.http_version)
+        else:
+            logger.warning("RAG service %s unhealthy: %s", name, response.status_code)
+    except Exception as e:
+        logger.warning("RAG service %s not available: %s", name, e)
+
+def _get_rag_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared RAG client, creating it on first use.
+
+    A single pool serves every RAG service so keep-alive connections (and
+    HTTP/2 streams) are reused across requests and targets instead of each
+    service holding its own pool. httpx only negotiates HTTP/2 through TLS
+    ALPN, so plain http:// services (uvicorn) stay on HTTP/1.1 keep-alive;
+    the startup health check logs which version each service got.
+    """
+    global rag_http_client
+    if rag_http_client is None or rag_http_client.is_closed:
+        # Limits and HTTP/2 go on the transport; httpx ignores the
+        # client-level ones once a transport is passed
+        rag_http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=2.0),
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=64,
+                    max_connections=128,
+                    keepalive_expiry=60.0
+                )
+            )
+        )
+    return rag_http_client
+
+async def _rag_get(intent: str, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    GET a RAG endpoint and return its JSON, served from Redis within the intent's TTL.
+
+    The key hashes the full request (URL and sorted params), so different
+    locations, airports or teams never share an entry. Cache failures fall
+    through to the live request; HTTP errors propagate as before.
+    """
+    ttl = RAG_CACHE_TTLS.get(intent)
+    cache_key = None
+    if ttl and cache_client is not None:
+        request_key = f"{intent}|{url}|{sorted((params or {}).items())}"
+        cache_key = f"rag:{hashlib.blake2b(request_key.encode(), digest_size=16).hexdigest()}"
+        try:
+            cached = await cache_client.get(cache_key)
+        except Exception as e:
+            logger.warning("RAG cache lookup failed: %s", e)
+            cached = None
+        rag_cache_counter.labels(intent=intent, result="hit" if cached is not None else "miss").inc()
+        if cached is not None:
+            return cached
+
+    response = await _get_rag_http_client().get(url, params=params)
+    response.raise_for_status()
+    data = response.json()
+
+    if cache_key is not None:
+        # Cache the raw body, not `data`: callers mutate the parsed payload
+        # (e.g. pruning sports events) before the background write would run
+        _run_in_background(
+            cache_client.set(cache_key, response.text, ttl=ttl),
+            f"RAG cache write for {intent}"
+        )
+    return data
+
+def _get_cached_team_id(team: str) -> Optional[str]:
+    """Return the sports team ID resolved for this name within the TTL, if any."""
+    entry = _team_id_cache.get(team.lower())
+    if entry is None:
+        return None
+    team_id, cached_at = entry
+    if time.time() - cached_at > TEAM_ID_CACHE_TTL:
+        del _team_id_cache[team.lower()]
+        return None
+    return team_id
+
+def _cache_team_id(team: str, team_id: str):
+    """Remember a resolved sports team ID, evicting the oldest entry when full."""
+    if len(_team_id_cache) >= _TEAM_ID_CACHE_MAX:
+        _team_id_cache.pop(next(iter(_team_id_cache)))
+    _team_id_cache[team.lower()] = (team_id, time.time())
+
+async def _warm_models(models: set):
+    """Issue a one-token generation per model so the backend keeps it resident."""
+    for model in models:
+        try:
+            await llm_router.generate(model=model, prompt="ok", max_tokens=1)
+            logger.info("Model %s warmed up", model)
+        except Exception as e:
+            logger.warning("Model %s warmup failed: %s", model, e)
+
+def get_rag_service_url(intent: str) -> Optional[str]:
     """
     Get RAG service URL for intent from database configuration.
     Falls back to environment variables if database unavailable.
 
+    Reads the routing table kept fresh by _refresh_rag_routing_loop(), so no
+    admin API call happens on the request path.
+
     Args:
         intent: Intent category (e.g., "weather", "sports", "airports")
 
     Returns:
         RAG service URL or None
     """
+    return _rag_routing_table.get(intent) or RAG_SERVICE_URLS.get(intent)
+
+async def _refresh_rag_routing():
+    """Reload intent -> RAG URL routing from the admin API, keeping the old table on failure."""
     try:
         client = get_admin_client()
         routing_config = await client.get_intent_routing()
-
-        if routing_config and intent in routing_config:
-            url = routing_config[intent].get("rag_service_url")
-            if url:
-                logger.info(f"Using database RAG URL for '{intent}': {url}")
-                return url
     except Exception as e:
-        logger.warning(f"Failed to get RAG URL from database for '{intent}': {e}")
-
-    # Fallback to environment variables
-    url_map = {
-        "weather": WEATHER_SERVICE_URL,
-        "airports": AIRPORTS_SERVICE_URL,
-        "sports": SPORTS_SERVICE_URL
+        logger.warning("Failed to refresh RAG routing from database: %s", e)
+        return
+    _apply_rag_routing(routing_config)
+
+def _apply_rag_routing(routing_config: Optional[Dict[str, Dict]]):
+    """Rebuild the intent -> RAG URL table from admin routing config."""
+    global _rag_routing_table
+    if not routing_config:
+        return
+
+    table = {
+        # Callers append absolute paths to this base
+        intent: config["rag_service_url"].rstrip("/")
+        for intent, config in routing_config.items()
+        if config.get("rag_service_url")
     }
-    fallback_url = url_map.get(intent)
-    if fallback_url:
-        logger.info(f"Using environment variable RAG URL for '{intent}': {fallback_url}")
-    return fallback_url
+    if table != _rag_routing_table:
+        logger.info("Using database RAG URLs: %s", table)
+    _rag_routing_table = table
+
+async def _refresh_rag_routing_loop():
+    """Refresh RAG routing every RAG_ROUTING_REFRESH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(RAG_ROUTING_REFRESH_INTERVAL)
+        await _refresh_rag_routing()
 
 # ============================================================================
 # Node Implementations
 # ============================================================================
 
+# Static prompt prefixes. Each LLM call starts with one of these byte-identical
+# strings and appends the per-request text after it, so the backend can reuse
+# the cached prefix instead of re-processing the instructions every time.
+_SYS_CLASSIFY = """You are an intent classifier. Respond only with valid JSON.
+
+Classify the user query at the end into a category and extract entities.
+
+Categories:
+- control: Home automation commands (lights, switches, thermostats, scenes)
+- weather: Weather information requests
+- airports: Airport or flight information
+- sports: Sports scores, games, teams
+- general_info: Other information requests
+- unknown: Unclear or ambiguous
+
+Respond in JSON format:
+{
+    "intent": "category_name",
+    "confidence": 0.0-1.0,
+    "entities": {
+        "device": "optional device name",
+        "location": "optional location",
+        "team": "optional sports team",
+        "airport": "optional airport code"
+    }
+}
+
+"""
+
+# Simplified (text-format) classification, followed by history and the query
+_SYS_CLASSIFY_SIMPLE = """Classify the current query at the end into ONE category.
+
+Categories:
+- CONTROL: Home automation commands (lights, switches, thermostats, devices)
+- WEATHER: Weather conditions, forecasts, temperature
+- SPORTS: Sports scores, schedules, teams, games (Ravens, Orioles, Giants, etc.)
+- AIRPORTS: Flight info, airport status, delays (BWI, DCA, IAD, etc.)
+- GENERAL_INFO: General knowledge, facts, explanations, anything else
+- UNKNOWN: Unclear or ambiguous intent
+
+IMPORTANT: Use the conversation history to resolve pronouns and references.
+For example, if previous message was "Who do the Giants play?" and current is "who do they play next week?",
+then "they" refers to "Giants" and the intent is SPORTS.
+
+Respond in this format:
+CATEGORY: <category_name>
+CONFIDENCE: <0.0-1.0>
+REASON: <brief explanation>
+
+"""
+
+_SYS_SYNTHESIZE = "You are Athena, a helpful home assistant. Provide clear, concise answers.\n\n"
+
+_SYNTH_CONTEXT_RULES = """Answer the question at the end using ONLY the provided context.
+
+CRITICAL INSTRUCTIONS:
+1. ONLY use facts from the Context Data
+2. If the context doesn't have the information, say "I don't have current information about that"
+3. NEVER make up specific facts, dates, names, or numbers
+4. Be concise but accurate
+5. Cite your source when possible
+
+"""
+
+_SYNTH_GENERAL_RULES = """You don't have access to real-time or current information, but you can answer using your general knowledge.
+
+IMPORTANT GUIDELINES:
+1. Answer the question using your general knowledge if possible
+2. If it requires current/real-time data (news, scores, weather, stocks, etc.), acknowledge the limitation and suggest checking authoritative sources
+3. For factual/historical questions, provide accurate information from your training
+4. For general knowledge, explanations, or how-to questions, provide helpful answers
+5. NEVER make up specific current events, recent data, or time-sensitive facts
+6. Be helpful - if you can answer even partially, do so
+7. If you truly cannot answer, suggest alternative approaches
+
+"""
+
+_SYS_VALIDATE = """You are a precise fact-checking assistant. Always respond with valid JSON.
+
+Analyze the generated response below for hallucinations.
+
+Question: Does the response contain specific factual claims (dates, times, names, phone numbers, prices, events) that are NOT present in the Retrieved Data?
+
+IMPORTANT: If no Retrieved Data is available, ANY specific factual claims are likely hallucinations.
+
+Respond ONLY with valid JSON:
+{"contains_hallucinations": true/false, "reason": "brief explanation", "specific_claims": ["list of suspicious claims"]}
+
+"""
+
+def _run_in_background(coro, description: str) -> asyncio.Task:
+    """
+    Run a coroutine off the response path, logging instead of dropping failures.
+
+    Tasks are held in _background_tasks until done so they are not garbage
+    collected mid-flight.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+
+    def _done(t: asyncio.Task):
+        _background_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning("Background %s failed: %s", description, t.exception())
+
+    task.add_done_callback(_done)
+    return task
+
+def timed(name: str):
+    """
+    Record a node's wall time in state.node_timings and the node_duration histogram.
+
+    Uses the monotonic perf_counter_ns clock, so timings cannot go negative
+    when the system clock is adjusted.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(state: OrchestratorState) -> OrchestratorState:
+            t0 = time.perf_counter_ns()
+            try:
+                return await fn(state)
+            finally:
+                elapsed = (time.perf_counter_ns() - t0) / 1e9
+                state.node_timings[name] = elapsed
+                node_duration.labels(node=name).observe(elapsed)
+        return wrapper
+    return decorator
+
 def _parse_classification_response(response: str) -> Tuple[IntentCategory, float]:
     """
     Parse LLM classification response into category and confidence.
@@ -285,11 +668,11 @@ def _parse_classification_response(response: str) -> Tuple[IntentCategory, float
     """
     try:
         # Extract category
-        category_match = re.search(r'CATEGORY:\s*(\w+)', response, re.IGNORECASE)
+        category_match = _CATEGORY_RE.search(response)
         category_str = category_match.group(1).upper() if category_match else None
 
         # Extract confidence
-        confidence_match = re.search(r'CONFIDENCE:\s*([\d.]+)', response)
+        confidence_match = _CONFIDENCE_RE.search(response)
         confidence = float(confidence_match.group(1)) if confidence_match else 0.5
 
         # Map to IntentCategory enum
@@ -311,16 +694,16 @@ def _parse_classification_response(response: str) -> Tuple[IntentCategory, float
         return (category, confidence)
 
     except Exception as e:
-        logger.warning(f"Failed to parse LLM response: {e}")
+        logger.warning("Failed to parse LLM response: %s", e)
         return (IntentCategory.GENERAL_INFO, 0.3)  # Low confidence fallback
 
 
 async def classify_intent_llm(query: str, conversation_history: List[Dict[str, str]] = None) -> Tuple[IntentCategory, float]:
     """
-    Use LLM (phi3:mini) to classify query intent with confidence scoring.
+    Use LLM (CLASSIFY_MODEL) to classify query intent with confidence scoring.
 
-    This is a simplified Gateway-style LLM classification that directly
-    calls Ollama API for fast, structured intent classification.
+    This is a simplified Gateway-style LLM classification that calls the
+    shared LLM router for fast, structured intent classification.
 
     Args:
         query: User query to classify
@@ -338,7 +721,7 @@ async def classify_intent_llm(query: str, conversation_history: List[Dict[str, s
     # Build context from conversation history
     context_str = ""
     if conversation_history and len(conversation_history) > 0:
-        context_str = "\n\nPrevious conversation:\n"
+        context_str = "Previous conversation:\n"
         # Include last 3 messages for context
         for msg in conversation_history[-3:]:
             role = msg.get("role", "")
@@ -347,55 +730,34 @@ async def classify_intent_llm(query: str, conversation_history: List[Dict[str, s
                 context_str += f"User: {content}\n"
             elif role == "assistant":
                 context_str += f"Assistant: {content}\n"
-        logger.info(f"Using conversation context with {len(conversation_history[-3:])} previous messages")
-
-    prompt = f"""Classify this query into ONE category:
-{context_str}
-Current Query: "{query}"
+        context_str += "\n"
+        logger.info("Using conversation context with %s previous messages", len(conversation_history[-3:]))
 
-Categories:
-- CONTROL: Home automation commands (lights, switches, thermostats, devices)
-- WEATHER: Weather conditions, forecasts, temperature
-- SPORTS: Sports scores, schedules, teams, games (Ravens, Orioles, Giants, etc.)
-- AIRPORTS: Flight info, airport status, delays (BWI, DCA, IAD, etc.)
-- GENERAL_INFO: General knowledge, facts, explanations, anything else
-- UNKNOWN: Unclear or ambiguous intent
-
-IMPORTANT: Use the conversation history to resolve pronouns and references.
-For example, if previous message was "Who do the Giants play?" and current is "who do they play next week?",
-then "they" refers to "Giants" and the intent is SPORTS.
-
-Respond in this format:
-CATEGORY: <category_name>
-CONFIDENCE: <0.0-1.0>
-REASON: <brief explanation>"""
+    # Static instructions first so every request shares the cached prefix
+    prompt = f'{_SYS_CLASSIFY_SIMPLE}{context_str}Current Query: "{query}"'
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(
-                f"{OLLAMA_URL}/api/generate",
-                json={
-                    "model": "phi3:mini",
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,  # Low temperature for consistency
-                        "num_predict": 50   # Need ~50 tokens for structured response
-                    }
-                }
-            )
-            response.raise_for_status()
-            result = response.json()
-            llm_response = result.get("response", "").strip()
+        # Through the shared router so the call reuses its pooled connections;
+        # the 5s cap keeps a slow backend from stalling classification
+        result = await asyncio.wait_for(
+            llm_router.generate(
+                model=CLASSIFY_MODEL,
+                prompt=prompt,
+                temperature=0.1,  # Low temperature for consistency
+                max_tokens=50  # Need ~50 tokens for structured response
+            ),
+            timeout=5.0
+        )
+        llm_response = result.get("response", "").strip()
 
-            # Parse structured response
-            category, confidence = _parse_classification_response(llm_response)
+        # Parse structured response
+        category, confidence = _parse_classification_response(llm_response)
 
-            logger.info(f"LLM classified '{query}' as {category} (confidence: {confidence:.2f})")
-            return (category, confidence)
+        logger.info("LLM classified '%s' as %s (confidence: %.2f)", query, category, confidence)
+        return (category, confidence)
 
     except Exception as e:
-        logger.error(f"LLM classification failed: {e}, falling back to pattern matching")
+        logger.error("LLM classification failed: %s, falling back to pattern matching", e)
         # Fallback to existing keyword-based classification
         category = _pattern_based_classification(query)
         return (category, 0.5)  # Medium confidence for fallback
@@ -411,7 +773,7 @@ def _extract_entities_simple(query: str, intent: IntentCategory) -> Dict[str, An
 
     if intent == IntentCategory.WEATHER:
         # Extract location from "in <city>" pattern
-        location_match = re.search(r'in\s+([a-z]+(?:\s+[a-z]+)?(?:\s+[a-z]+)?)', query_lower)
+        location_match = _LOCATION_RE.search(query_lower)
         if location_match:
             location = location_match.group(1).strip()
             # Title case the location
@@ -426,7 +788,7 @@ def _extract_entities_simple(query: str, intent: IntentCategory) -> Dict[str, An
 
     elif intent == IntentCategory.AIRPORTS:
         # Extract airport codes
-        airport_match = re.search(r'\b([A-Z]{3})\b', query)
+        airport_match = _AIRPORT_CODE_RE.search(query)
         if airport_match:
             entities["airport"] = airport_match.group(1)
 
@@ -488,7 +850,7 @@ def _extract_entities_with_context(
                     if keyword in content:
                         entities["team"] = full_name
                         entities["resolved_from_context"] = True
-                        logger.info(f"Resolved 'they' → '{full_name}' from conversation history")
+                        logger.info("Resolved 'they' → '%s' from conversation history", full_name)
                         break
 
                 if "team" in entities:
@@ -497,18 +859,18 @@ def _extract_entities_with_context(
             # Look for locations in previous context (WEATHER intent)
             elif intent == IntentCategory.WEATHER and "location" not in entities:
                 # Extract location from "in <city>" pattern in previous messages
-                location_match = re.search(r'in\s+([a-z]+(?:\s+[a-z]+)?(?:\s+[a-z]+)?)', content)
+                location_match = _LOCATION_RE.search(content)
                 if location_match:
                     location = location_match.group(1).strip()
                     entities["location"] = ' '.join(word.capitalize() for word in location.split())
                     entities["resolved_from_context"] = True
-                    logger.info(f"Resolved location from conversation history: {entities['location']}")
+                    logger.info("Resolved location from conversation history: %s", entities['location'])
                     break
 
     # Standard entity extraction (same as _extract_entities_simple)
     if intent == IntentCategory.WEATHER and "location" not in entities:
         # Extract location from "in <city>" pattern
-        location_match = re.search(r'in\s+([a-z]+(?:\s+[a-z]+)?(?:\s+[a-z]+)?)', query_lower)
+        location_match = _LOCATION_RE.search(query_lower)
         if location_match:
             location = location_match.group(1).strip()
             entities["location"] = ' '.join(word.capitalize() for word in location.split())
@@ -528,13 +890,14 @@ def _extract_entities_with_context(
 
     elif intent == IntentCategory.AIRPORTS:
         # Extract airport codes
-        airport_match = re.search(r'\b([A-Z]{3})\b', query)
+        airport_match = _AIRPORT_CODE_RE.search(query)
         if airport_match:
             entities["airport"] = airport_match.group(1)
 
     return entities
 
 
+@timed("classify")
 async def classify_node(state: OrchestratorState) -> OrchestratorState:
     """
     Classify user intent using LLM with Redis caching.
@@ -544,10 +907,10 @@ async def classify_node(state: OrchestratorState) -> OrchestratorState:
     - Simplified LLM mode: Fast, direct Ollama API calls (Gateway-style)
     - Standard LLM mode: JSON-based classification via llm_router
     """
-    start = time.time()
 
-    # OPTIMIZATION: Check cache first
-    cache_key = f"intent_v4:{hashlib.md5(state.query.lower().encode()).hexdigest()}"
+    # OPTIMIZATION: Check cache first (lowercased, whitespace-collapsed query)
+    normalized_query = " ".join(state.query.lower().split())
+    cache_key = f"intent_v5:{hashlib.sha1(normalized_query.encode()).hexdigest()}"
 
     def _heuristic_sports_team(query: str) -> Optional[str]:
         team_tokens = [
@@ -562,24 +925,24 @@ async def classify_node(state: OrchestratorState) -> OrchestratorState:
 
     try:
         cached = await cache_client.get(cache_key)
+        intent_cache_counter.labels(result="hit" if cached else "miss").inc()
         if cached:
             state.intent = IntentCategory(cached["intent"])
             state.confidence = cached.get("confidence", 0.9)
             state.entities = cached.get("entities", {})
-            state.node_timings["classify"] = time.time() - start
             # If sports intent cached without a team, attempt heuristic; if still empty, continue to reclassify
             if state.intent == IntentCategory.SPORTS and not state.entities.get("team"):
                 found = _heuristic_sports_team(state.query)
                 if found:
                     state.entities["team"] = found
-                    logger.info(f"Heuristic sports team extraction (cache path): {found}")
+                    logger.info("Heuristic sports team extraction (cache path): %s", found)
                 else:
-                    logger.info(f"Intent cache HIT for '{state.query}' but missing team; continuing to reclassify")
+                    logger.info("Intent cache HIT for '%s' but missing team; continuing to reclassify", state.query)
             else:
-                logger.info(f"Intent cache HIT for '{state.query}': {state.intent}")
+                logger.info("Intent cache HIT for '%s': %s", state.query, state.intent)
                 return state
     except Exception as e:
-        logger.warning(f"Intent cache lookup failed: {e}")
+        logger.warning("Intent cache lookup failed: %s", e)
 
     # Check feature flag for simplified LLM classification
     admin_client = get_admin_client()
@@ -609,36 +972,12 @@ async def classify_node(state: OrchestratorState) -> OrchestratorState:
             logger.info("Using standard JSON-based LLM classification")
 
             # Build classification prompt
-            classification_prompt = f"""Classify the following user query into a category and extract entities.
-
-Categories:
-- control: Home automation commands (lights, switches, thermostats, scenes)
-- weather: Weather information requests
-- airports: Airport or flight information
-- sports: Sports scores, games, teams
-- general_info: Other information requests
-- unknown: Unclear or ambiguous
-
-Query: "{state.query}"
-
-Respond in JSON format:
-{{
-    "intent": "category_name",
-    "confidence": 0.0-1.0,
-    "entities": {{
-        "device": "optional device name",
-        "location": "optional location",
-        "team": "optional sports team",
-        "airport": "optional airport code"
-    }}
-}}"""
-
             # Use small model for classification
-            # Combine system and user messages into a single prompt
-            full_prompt = f"You are an intent classifier. Respond only with valid JSON.\n\n{classification_prompt}"
+            # Static instructions first; only the query varies between requests
+            full_prompt = f'{_SYS_CLASSIFY}Query: "{state.query}"'
 
             result = await llm_router.generate(
-                model=ModelTier.SMALL.value,
+                model=CLASSIFY_MODEL,
                 prompt=full_prompt,
                 temperature=0.3,  # Lower temperature for consistent classification
                 request_id=state.request_id,
@@ -656,7 +995,7 @@ Respond in JSON format:
                 state.confidence = float(result.get("confidence", 0.5))
                 state.entities = result.get("entities", {})
             except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(f"Failed to parse classification: {e}")
+                logger.warning("Failed to parse classification: %s", e)
                 # Fallback to pattern matching
                 state.intent = _pattern_based_classification(state.query)
                 state.confidence = 0.7
@@ -668,71 +1007,140 @@ Respond in JSON format:
             found = _heuristic_sports_team(state.query)
             if found:
                 state.entities["team"] = found
-                logger.info(f"Heuristic sports team extraction: {state.entities['team']}")
+                logger.info("Heuristic sports team extraction: %s", state.entities['team'])
 
         if state.intent == IntentCategory.SPORTS:
-            logger.info(f"Sports classification entities: {state.entities}")
+            logger.info("Sports classification entities: %s", state.entities)
 
         # DEBUG: Log entities for all intents to trace extraction
-        logger.info(f"Classified query as {state.intent} with confidence {state.confidence}, entities: {state.entities}")
+        logger.info("Classified query as %s with confidence %s, entities: %s", state.intent, state.confidence, state.entities)
 
-        # OPTIMIZATION: Cache the result (5 minute TTL)
+        # OPTIMIZATION: Cache the result
         try:
             await cache_client.set(cache_key, {
                 "intent": state.intent.value,
                 "confidence": state.confidence,
                 "entities": state.entities
-            }, ttl=300)
-            logger.info(f"Intent classification cached for '{state.query}'")
+            }, ttl=INTENT_CACHE_TTL)
+            logger.info("Intent classification cached for '%s'", state.query)
         except Exception as e:
-            logger.warning(f"Intent cache write failed: {e}")
+            logger.warning("Intent cache write failed: %s", e)
 
     except Exception as e:
-        logger.error(f"Classification error: {e}", exc_info=True)
+        logger.error("Classification error: %s", e, exc_info=True)
         state.intent = IntentCategory.UNKNOWN
         state.confidence = 0.0
         state.error = f"Classification failed: {str(e)}"
 
-    state.node_timings["classify"] = time.time() - start
     return state
 
-def _pattern_based_classification(query: str) -> IntentCategory:
-    """Fallback pattern-based classification."""
-    query_lower = query.lower()
-
-    # Control patterns
-    control_patterns = [
+# Fallback keyword patterns in priority order; the first category with any
+# substring match wins
+_FALLBACK_PATTERNS = (
+    (IntentCategory.CONTROL, (
         "turn on", "turn off", "set", "dim", "brighten",
         "lights", "switch", "temperature", "thermostat", "scene"
-    ]
-    if any(p in query_lower for p in control_patterns):
-        return IntentCategory.CONTROL
-
-    # Weather patterns
-    if any(p in query_lower for p in ["weather", "forecast", "rain", "snow", "temperature outside"]):
-        return IntentCategory.WEATHER
-
-    # Airport patterns
-    if any(p in query_lower for p in ["airport", "flight", "delay", "bwi", "dca", "iad"]):
-        return IntentCategory.AIRPORTS
-
-    # Sports patterns
-    sports_patterns = [
+    )),
+    (IntentCategory.WEATHER, ("weather", "forecast", "rain", "snow", "temperature outside")),
+    (IntentCategory.AIRPORTS, ("airport", "flight", "delay", "bwi", "dca", "iad")),
+    (IntentCategory.SPORTS, (
         "game", "score", "ravens", "orioles", "team", "schedule",
         "football", "soccer", "basketball", "baseball", "hockey",
         "nfl", "nba", "mlb", "nhl", "mls", "ncaa",
         "playoff", "championship", "season", "match", "vs", "versus"
-    ]
-    if any(p in query_lower for p in sports_patterns):
-        return IntentCategory.SPORTS
+    )),
+)
+
+def _build_fallback_automaton() -> "ahocorasick.Automaton":
+    """Build one automaton over all fallback patterns, valued by priority rank."""
+    automaton = ahocorasick.Automaton()
+    for rank, (_, patterns) in enumerate(_FALLBACK_PATTERNS):
+        for pattern in patterns:
+            if pattern not in automaton:
+                automaton.add_word(pattern, rank)
+    automaton.make_automaton()
+    return automaton
+
+_FALLBACK_AUTOMATON = _build_fallback_automaton()
 
+def _pattern_based_classification(query: str) -> IntentCategory:
+    """Fallback pattern-based classification."""
+    # Single pass over the query for every pattern; keep the best-priority hit
+    best = len(_FALLBACK_PATTERNS)
+    for _, rank in _FALLBACK_AUTOMATON.iter(query.lower()):
+        if rank < best:
+            best = rank
+            if best == 0:
+                break
+
+    if best < len(_FALLBACK_PATTERNS):
+        return _FALLBACK_PATTERNS[best][0]
     return IntentCategory.GENERAL_INFO
 
+# Intents whose pattern match is deterministic enough to retrieve speculatively
+_SPECULATIVE_INTENTS = (IntentCategory.WEATHER, IntentCategory.AIRPORTS, IntentCategory.SPORTS)
+
+# The one entity each speculative retrieval reads; confirmation compares only it
+_SPECULATIVE_ENTITY = {
+    IntentCategory.WEATHER: "location",
+    IntentCategory.AIRPORTS: "airport",
+    IntentCategory.SPORTS: "team",
+}
+
+# Speculative retrievals accepted by classification, picked up by retrieve_node
+# (or discarded by _run_graph if the run ends first)
+_speculative_retrievals: Dict[str, asyncio.Task] = {}
+
+def _same_entity(guessed: Any, classified: Any) -> bool:
+    """Whether two spellings name the same entity ("Ravens" vs "Baltimore Ravens")."""
+    guessed, classified = str(guessed).casefold().strip(), str(classified).casefold().strip()
+    return guessed in classified or classified in guessed
+
+async def speculative_classify_node(state: OrchestratorState) -> OrchestratorState:
+    """
+    Classify intent, retrieving in parallel for RAG-backed pattern matches.
+
+    When keyword patterns point at weather/airports/sports, the matching
+    retrieval runs alongside classification. It is handed to retrieve_node only
+    if classification lands on the same intent and agrees on the entity that
+    retrieval reads (or leaves it empty); otherwise it is cancelled and the
+    normal path runs.
+    """
+    guess = _pattern_based_classification(state.query) if SPECULATIVE_RETRIEVAL else None
+    if guess not in _SPECULATIVE_INTENTS:
+        return await classify_node(state)
+
+    speculative_state = state.model_copy(deep=True)
+    speculative_state.intent = guess
+    speculative_state.entities = _extract_entities_simple(state.query, guess)
+    if _split_rag_domains(speculative_state):
+        # Compound queries fan out per domain in retrieve_node instead
+        return await classify_node(state)
+
+    field = _SPECULATIVE_ENTITY[guess]
+    guessed = speculative_state.entities.get(field)
+    task = asyncio.create_task(retrieve_node(speculative_state))
+
+    state = await classify_node(state)
+
+    classified = state.entities.get(field)
+    if state.intent == guess and (not classified or (guessed and _same_entity(guessed, classified))):
+        if not classified and guessed:
+            # Keep state consistent with what the speculative retrieval fetched
+            state.entities[field] = guessed
+        _speculative_retrievals[state.request_id] = task
+        logger.info("Speculative %s retrieval confirmed by classification", guess.value)
+    else:
+        task.cancel()
+        logger.info("Speculative %s retrieval discarded (classified as %s)", guess.value, state.intent)
+
+    return state
+
+@timed("route_control")
 async def route_control_node(state: OrchestratorState) -> OrchestratorState:
     """
     Handle home automation control commands via Home Assistant API.
     """
-    start = time.time()
 
     try:
         # Extract device and action from entities or query
@@ -757,34 +1165,34 @@ async def route_control_node(state: OrchestratorState) -> OrchestratorState:
         if device and action:
             # Call Home Assistant service
             domain = device.split(".")[0]
-            result = await ha_client.call_service(
+            client = await _get_ha_client()
+            result = await client.call_service(
                 domain=domain,
                 service=action,
                 service_data={"entity_id": device}
             )
 
-            state.answer = f"Done! I've turned {'on' if action == 'turn_on' else 'off'} the {device.replace('_', ' ').replace('.', ' ')}."
+            state.answer = f"Done! I've turned {'on' if action == 'turn_on' else 'off'} the {' '.join(device.translate(_DEVICE_NAME_TABLE).split())}."
             state.retrieved_data = {"ha_response": result}
 
         else:
             # Need more information
             state.answer = "I understand you want to control something, but I need more details. Which device would you like to control?"
 
-        logger.info(f"Control command executed: {device} - {action}")
+        logger.info("Control command executed: %s - %s", device, action)
 
     except Exception as e:
-        logger.error(f"Control execution error: {e}", exc_info=True)
+        logger.error("Control execution error: %s", e, exc_info=True)
         state.answer = "I encountered an error while trying to control that device. Please try again."
         state.error = str(e)
 
-    state.node_timings["route_control"] = time.time() - start
     return state
 
+@timed("route_info")
 async def route_info_node(state: OrchestratorState) -> OrchestratorState:
     """
     Select appropriate model tier for information queries.
     """
-    start = time.time()
 
     # Estimate complexity based on query length and intent
     query_length = len(state.query.split())
@@ -796,9 +1204,8 @@ async def route_info_node(state: OrchestratorState) -> OrchestratorState:
     else:
         state.model_tier = ModelTier.MEDIUM
 
-    logger.info(f"Selected model tier: {state.model_tier}")
+    logger.info("Selected model tier: %s", state.model_tier)
 
-    state.node_timings["route_info"] = time.time() - start
     return state
 
 def _is_time_sensitive_query(query: str) -> bool:
@@ -844,17 +1251,36 @@ def _is_time_sensitive_query(query: str) -> bool:
 
     # If query has both time and event indicators, it's definitely time-sensitive
     if has_time_indicator and has_current_event:
-        logger.info(f"Query is time-sensitive (time + event indicators): {query}")
+        logger.info("Query is time-sensitive (time + event indicators): %s", query)
         return True
 
     # Just current event indicators also make it time-sensitive
     if has_current_event:
-        logger.info(f"Query is time-sensitive (event indicators): {query}")
+        logger.info("Query is time-sensitive (event indicators): %s", query)
         return True
 
     return False
 
 
+def _collect_search_results(fused_results: list) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """
+    Build result dicts, unique sources and citations in one pass.
+
+    Sources keep first-seen order so data_source strings and logs are stable
+    across identical searches.
+    """
+    results = []
+    sources = []
+    citations = []
+    seen = set()
+    for r in fused_results:
+        results.append(r.to_dict())
+        if r.source not in seen:
+            seen.add(r.source)
+            sources.append(r.source)
+            citations.append(f"Search result from {r.source}")
+    return results, sources, citations
+
 async def _fallback_to_web_search(state: OrchestratorState, rag_service: str, error_msg: str):
     """
     Helper function to fall back to web search when RAG service fails.
@@ -864,7 +1290,7 @@ async def _fallback_to_web_search(state: OrchestratorState, rag_service: str, er
         rag_service: Name of the failed RAG service (for logging)
         error_msg: Error message from the failed service
     """
-    logger.warning(f"{rag_service} RAG service failed ({error_msg}), falling back to web search")
+    logger.warning("%s RAG service failed (%s), falling back to web search", rag_service, error_msg)
 
     try:
         # Execute parallel search with automatic intent classification
@@ -876,7 +1302,7 @@ async def _fallback_to_web_search(state: OrchestratorState, rag_service: str, er
             force_search=True  # CRITICAL: Force web search even for RAG intents
         )
 
-        logger.info(f"Fallback search intent classified as: '{intent}'")
+        logger.info("Fallback search intent classified as: '%s'", intent)
 
         if search_results:
             # Fuse and rank results based on classified intent
@@ -887,13 +1313,14 @@ async def _fallback_to_web_search(state: OrchestratorState, rag_service: str, er
                 limit=5
             )
 
-            logger.info(f"Fallback web search returned {len(fused_results)} fused results")
+            logger.info("Fallback web search returned %s fused results", len(fused_results))
 
             # Convert to dict format for LLM
+            results, sources, citations = _collect_search_results(fused_results)
             search_data = {
                 "intent": intent,
-                "results": [r.to_dict() for r in fused_results],
-                "sources": list(set(r.source for r in fused_results)),
+                "results": results,
+                "sources": sources,
                 "total_results": len(search_results),
                 "fused_results": len(fused_results),
                 "fallback_note": f"Data retrieved from web search (primary {rag_service} service unavailable)"
@@ -901,32 +1328,113 @@ async def _fallback_to_web_search(state: OrchestratorState, rag_service: str, er
 
             state.retrieved_data = search_data
             state.data_source = f"Web Search Fallback ({intent}): {', '.join(search_data['sources'])}"
-            state.citations.extend([f"Search result from {r.source}" for r in fused_results])
+            state.citations.extend(citations)
             state.citations.append(f"Note: {rag_service} service was unavailable, used web search instead")
-            logger.info(f"Fallback web search successful: intent={intent}, sources={search_data['sources']}")
+            logger.info("Fallback web search successful: intent=%s, sources=%s", intent, search_data['sources'])
         else:
             # Even web search failed - use LLM knowledge
             state.retrieved_data = {}
             state.data_source = "LLM knowledge (RAG and web search unavailable)"
-            logger.warning(f"Fallback web search returned no results, using LLM knowledge")
+            logger.warning("Fallback web search returned no results, using LLM knowledge")
 
     except Exception as e:
-        logger.error(f"Fallback web search failed: {e}", exc_info=True)
+        logger.error("Fallback web search failed: %s", e, exc_info=True)
         state.retrieved_data = {}
         state.data_source = "LLM knowledge (RAG and web search failed)"
 
 
+def _split_rag_domains(state: OrchestratorState) -> List[OrchestratorState]:
+    """
+    Split a compound query that spans several RAG domains into per-domain states.
+
+    "What's the weather in Boston and when do the Ravens play" yields one state
+    for weather and one for sports, each an isolated copy with its own
+    sub-query and entities. Returns an empty list for single-domain queries.
+    """
+    if state.intent not in _SPECULATIVE_INTENTS or intent_classifier is None:
+        return []
+
+    parts = intent_classifier.detect_multi_intent(state.query)
+    if len(parts) < 2:
+        return []
+
+    # Same keyword matcher as the speculative guess; first part wins per domain
+    domains: Dict[IntentCategory, str] = {}
+    for part in parts:
+        intent = _pattern_based_classification(part)
+        if intent in _SPECULATIVE_INTENTS:
+            domains.setdefault(intent, part)
+    if len(domains) < 2:
+        return []
+
+    sub_states = []
+    for intent, part in domains.items():
+        sub_state = state.model_copy(deep=True)
+        sub_state.query = part
+        sub_state.intent = intent
+        sub_state.entities = _extract_entities_simple(part, intent)
+        sub_state.citations = []
+        sub_states.append(sub_state)
+    return sub_states
+
+async def _retrieve_domains(
+    state: OrchestratorState,
+    sub_states: List[OrchestratorState],
+    speculative: Optional[asyncio.Task]
+) -> OrchestratorState:
+    """
+    Retrieve every domain of a compound query concurrently and merge the results.
+
+    Wall-clock time is the slowest domain rather than the sum. A speculative
+    retrieval ran on the whole compound query, so it is cancelled, not reused.
+    """
+    if speculative is not None:
+        speculative.cancel()
+
+    retrieve = retrieve_node.__wrapped__
+    retrievals = [retrieve(sub_state) for sub_state in sub_states]
+
+    retrieved_data = {}
+    data_sources = []
+    for sub_state, retrieved in zip(sub_states, await asyncio.gather(*retrievals)):
+        retrieved_data[sub_state.intent.value] = retrieved.retrieved_data
+        if retrieved.data_source:
+            data_sources.append(retrieved.data_source)
+        state.citations.extend(retrieved.citations)
+        state.error = state.error or retrieved.error
+
+    state.retrieved_data = retrieved_data
+    state.data_source = "; ".join(data_sources) or None
+    logger.info("Retrieved %d domains concurrently: %s", len(sub_states), list(retrieved_data))
+    return state
+
+@timed("retrieve")
 async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
     """
     Retrieve information from appropriate RAG service.
     Falls back to web search if RAG service is unavailable.
     """
-    start = time.time()
+
+    speculative = _speculative_retrievals.pop(state.request_id, None)
+
+    # Compound queries spanning several RAG domains retrieve them all at once
+    sub_states = _split_rag_domains(state)
+    if sub_states:
+        return await _retrieve_domains(state, sub_states, speculative)
+
+    # Adopt a retrieval already started alongside classification
+    if speculative is not None:
+        retrieved = await speculative
+        state.retrieved_data = retrieved.retrieved_data
+        state.data_source = retrieved.data_source
+        state.citations = retrieved.citations
+        state.error = retrieved.error or state.error
+        return state
 
     try:
         if state.intent == IntentCategory.WEATHER:
             # Get dynamic RAG service URL
-            service_url = await get_rag_service_url("weather")
+            service_url = get_rag_service_url("weather")
             if not service_url:
                 logger.error("Weather RAG service URL not configured")
                 # Fall back to web search instead of failing
@@ -939,54 +1447,51 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
                     # Check if forecast is needed (future timeframes)
                     needs_forecast = state.entities.get("forecast", False)
 
-                    async with httpx.AsyncClient(base_url=service_url, timeout=30.0) as client:
-                        if needs_forecast:
-                            # Call forecast endpoint for future weather
-                            logger.info(f"Fetching forecast for {location} (timeframe: {state.entities.get('timeframe', 'future')})")
-                            response = await client.get(
-                                "/weather/forecast",
-                                params={"location": location, "days": 5}
-                            )
-                        else:
-                            # Call current weather endpoint
-                            logger.info(f"Fetching current weather for {location}")
-                            response = await client.get(
-                                "/weather/current",
-                                params={"location": location}
-                            )
-
-                        response.raise_for_status()
-
-                        weather_data = response.json()
-
-                        # Validate Weather RAG response quality
-                        validation_result, reason, suggestions = validator.validate_weather_response(
-                            weather_data, state.query
+                    if needs_forecast:
+                        # Call forecast endpoint for future weather
+                        logger.info("Fetching forecast for %s (timeframe: %s)", location, state.entities.get('timeframe', 'future'))
+                        weather_data = await _rag_get(
+                            "weather",
+                            f"{service_url}/weather/forecast",
+                            params={"location": location, "days": 5}
+                        )
+                    else:
+                        # Call current weather endpoint
+                        logger.info("Fetching current weather for %s", location)
+                        weather_data = await _rag_get(
+                            "weather",
+                            f"{service_url}/weather/current",
+                            params={"location": location}
                         )
 
-                        if validation_result == ValidationResult.VALID:
-                            # Response is good, use it
-                            state.retrieved_data = weather_data
-                            state.data_source = "OpenWeatherMap"
-                            state.citations.append(f"Weather data from OpenWeatherMap for {location}")
-                            logger.debug(f"Weather RAG validation passed: {reason}")
-
-                        elif validation_result in [ValidationResult.EMPTY, ValidationResult.INVALID]:
-                            # Data is empty or invalid, trigger web search fallback
-                            logger.warning(
-                                f"Weather RAG validation failed: {validation_result.value} - {reason}"
-                            )
-                            if suggestions:
-                                logger.info(f"Fallback suggestion: {suggestions}")
-                            await _fallback_to_web_search(state, "Weather", reason)
-
-                        elif validation_result == ValidationResult.NEEDS_RETRY:
-                            # Data structure mismatch or missing information
-                            logger.info(
-                                f"Weather RAG needs retry: {reason}. Suggestions: {suggestions}"
-                            )
-                            # For now, fall back to web search for retry scenarios
-                            await _fallback_to_web_search(state, "Weather", reason)
+                    # Validate Weather RAG response quality
+                    validation_result, reason, suggestions = validator.validate_weather_response(
+                        weather_data, state.query
+                    )
+
+                    if validation_result == ValidationResult.VALID:
+                        # Response is good, use it
+                        state.retrieved_data = weather_data
+                        state.data_source = "OpenWeatherMap"
+                        state.citations.append(f"Weather data from OpenWeatherMap for {location}")
+                        logger.debug("Weather RAG validation passed: %s", reason)
+
+                    elif validation_result in [ValidationResult.EMPTY, ValidationResult.INVALID]:
+                        # Data is empty or invalid, trigger web search fallback
+                        logger.warning(
+                            "Weather RAG validation failed: %s - %s", validation_result.value, reason
+                        )
+                        if suggestions:
+                            logger.info("Fallback suggestion: %s", suggestions)
+                        await _fallback_to_web_search(state, "Weather", reason)
+
+                    elif validation_result == ValidationResult.NEEDS_RETRY:
+                        # Data structure mismatch or missing information
+                        logger.info(
+                            "Weather RAG needs retry: %s. Suggestions: %s", reason, suggestions
+                        )
+                        # For now, fall back to web search for retry scenarios
+                        await _fallback_to_web_search(state, "Weather", reason)
 
                 except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as e:
                     # RAG service failed - fall back to web search
@@ -994,7 +1499,7 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
 
         elif state.intent == IntentCategory.AIRPORTS:
             # Get dynamic RAG service URL
-            service_url = await get_rag_service_url("airports")
+            service_url = get_rag_service_url("airports")
             if not service_url:
                 logger.error("Airports RAG service URL not configured")
                 await _fallback_to_web_search(state, "Airports", "service not configured")
@@ -1002,41 +1507,37 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
                 try:
                     # Call airports service with dynamic URL
                     airport = state.entities.get("airport", "BWI")
-                    async with httpx.AsyncClient(base_url=service_url, timeout=30.0) as client:
-                        response = await client.get(f"/airports/{airport}")
-                        response.raise_for_status()
-
-                        airports_data = response.json()
-
-                        # Validate Airports RAG response quality
-                        validation_result, reason, suggestions = validator.validate_airports_response(
-                            airports_data, state.query
+                    airports_data = await _rag_get("airports", f"{service_url}/airports/{airport}")
+
+                    # Validate Airports RAG response quality
+                    validation_result, reason, suggestions = validator.validate_airports_response(
+                        airports_data, state.query
+                    )
+
+                    if validation_result == ValidationResult.VALID:
+                        # Response is good, use it
+                        state.retrieved_data = airports_data
+                        state.data_source = "FlightAware"
+                        state.citations.append(f"Flight data from FlightAware for {airport}")
+                        logger.debug("Airports RAG validation passed: %s", reason)
+
+                    elif validation_result in [ValidationResult.EMPTY, ValidationResult.INVALID]:
+                        # Data is empty or invalid, trigger web search fallback
+                        logger.warning(
+                            "Airports RAG validation failed: %s - %s", validation_result.value, reason
                         )
-
-                        if validation_result == ValidationResult.VALID:
-                            # Response is good, use it
-                            state.retrieved_data = airports_data
-                            state.data_source = "FlightAware"
-                            state.citations.append(f"Flight data from FlightAware for {airport}")
-                            logger.debug(f"Airports RAG validation passed: {reason}")
-
-                        elif validation_result in [ValidationResult.EMPTY, ValidationResult.INVALID]:
-                            # Data is empty or invalid, trigger web search fallback
-                            logger.warning(
-                                f"Airports RAG validation failed: {validation_result.value} - {reason}"
-                            )
-                            if suggestions:
-                                logger.info(f"Fallback suggestion: {suggestions}")
-                            await _fallback_to_web_search(state, "Airports", reason)
-
-                        elif validation_result == ValidationResult.NEEDS_RETRY:
-                            # Data structure mismatch or missing information
-                            logger.info(
-                                f"Airports RAG needs retry: {reason}. Suggestions: {suggestions}"
-                            )
-                            # For now, fall back to web search for retry scenarios
-                            # Future: Could retry with different RAG parameters
-                            await _fallback_to_web_search(state, "Airports", reason)
+                        if suggestions:
+                            logger.info("Fallback suggestion: %s", suggestions)
+                        await _fallback_to_web_search(state, "Airports", reason)
+
+                    elif validation_result == ValidationResult.NEEDS_RETRY:
+                        # Data structure mismatch or missing information
+                        logger.info(
+                            "Airports RAG needs retry: %s. Suggestions: %s", reason, suggestions
+                        )
+                        # For now, fall back to web search for retry scenarios
+                        # Future: Could retry with different RAG parameters
+                        await _fallback_to_web_search(state, "Airports", reason)
 
                 except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as e:
                     # RAG service failed - fall back to web search
@@ -1044,7 +1545,7 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
 
         elif state.intent == IntentCategory.SPORTS:
             # Get dynamic RAG service URL
-            service_url = await get_rag_service_url("sports")
+            service_url = get_rag_service_url("sports")
             if not service_url:
                 logger.error("Sports RAG service URL not configured")
                 await _fallback_to_web_search(state, "Sports", "service not configured")
@@ -1063,46 +1564,44 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
                         ]
                         q_lower = state.query.lower()
                         team = next((t.title() for t in team_tokens if t in q_lower), state.query)
-                    logger.info(f"Sports query team resolved to: {team}")
+                    logger.info("Sports query team resolved to: %s", team)
                     query_lower = state.query.lower()
                     news_mode = any(word in query_lower for word in ["news", "headline", "update", "latest"])
                     olympics_mode = "olympic" in query_lower
-                    async with httpx.AsyncClient(base_url=service_url, timeout=30.0) as client:
-                        if olympics_mode:
-                            olympics_q = state.query
-                            olympics_resp = await client.get(
-                                "/sports/olympics/events",
-                                params={"query": olympics_q}
-                            )
-                            olympics_resp.raise_for_status()
-                            olympics_data = olympics_resp.json()
-                            state.retrieved_data = olympics_data
-                            state.data_source = "olympics-news"
-                            state.citations.append(f"Olympics coverage for {olympics_q}")
-                            logger.debug("Olympics coverage fetched", extra={"count": olympics_data.get("count", 0)})
-                            return state
-
-                        if news_mode:
-                            news_q = team if team else state.query
-                            news_resp = await client.get(
-                                "/sports/news",
-                                params={"query": news_q, "limit": 5}
-                            )
-                            news_resp.raise_for_status()
-                            news_data = news_resp.json()
-                            state.retrieved_data = news_data
-                            state.data_source = "sports-news"
-                            state.citations.append(f"News headlines for {news_q}")
-                            logger.debug("Sports news fetched", extra={"count": news_data.get("count", 0)})
-                            return state
-
-                        # Search for team
-                        search_response = await client.get(
-                            "/sports/teams/search",
+                    if olympics_mode:
+                        olympics_q = state.query
+                        olympics_data = await _rag_get(
+                            "sports",
+                            f"{service_url}/sports/olympics/events",
+                            params={"query": olympics_q}
+                        )
+                        state.retrieved_data = olympics_data
+                        state.data_source = "olympics-news"
+                        state.citations.append(f"Olympics coverage for {olympics_q}")
+                        logger.debug("Olympics coverage fetched", extra={"count": olympics_data.get("count", 0)})
+                        return state
+
+                    if news_mode:
+                        news_q = team if team else state.query
+                        news_data = await _rag_get(
+                            "sports",
+                            f"{service_url}/sports/news",
+                            params={"query": news_q, "limit": 5}
+                        )
+                        state.retrieved_data = news_data
+                        state.data_source = "sports-news"
+                        state.citations.append(f"News headlines for {news_q}")
+                        logger.debug("Sports news fetched", extra={"count": news_data.get("count", 0)})
+                        return state
+
+                    # Search for team, skipping the round-trip for recently resolved teams
+                    team_id = _get_cached_team_id(team)
+                    if team_id is None:
+                        search_data = await _rag_get(
+                            "sports",
+                            f"{service_url}/sports/teams/search",
                             params={"query": team}
                         )
-                        search_response.raise_for_status()
-                        search_data = search_response.json()
 
                         if search_data.get("teams"):
                             # Prefer NFL Giants vs MLB Giants when query mentions football
@@ -1113,79 +1612,78 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
                                     key=lambda t: 0 if "football" in (t.get("strLeague") or "") else 1
                                 )
                             team_id = teams_list[0]["idTeam"]
-
-                            # Get next event
-                            events_response = await client.get(f"/sports/events/{team_id}/next")
-                            events_response.raise_for_status()
-
-                            events_data = events_response.json()
-
-                            # If user asks for "this week/today/tomorrow", prune events to near-term
-                            query_lower = state.query.lower()
-                            if any(kw in query_lower for kw in ["this week", "today", "tonight", "tomorrow"]):
-                                events = events_data.get("events", []) or []
-                                now = datetime.utcnow().date()
-                                week_end = now + timedelta(days=7)
-                                filtered = []
-                                for ev in events:
-                                    date_str = ev.get("dateEvent") or ev.get("date")
+                            _cache_team_id(team, team_id)
+
+                    if team_id is not None:
+                        # Get next event
+                        events_data = await _rag_get("sports", f"{service_url}/sports/events/{team_id}/next")
+
+                        # If user asks for "this week/today/tomorrow", prune events to near-term
+                        query_lower = state.query.lower()
+                        if any(kw in query_lower for kw in ["this week", "today", "tonight", "tomorrow"]):
+                            events = events_data.get("events", []) or []
+                            now = datetime.utcnow().date()
+                            week_end = now + timedelta(days=7)
+                            filtered = []
+                            for ev in events:
+                                date_str = ev.get("dateEvent") or ev.get("date")
+                                try:
+                                    d = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
+                                except Exception:
                                     try:
-                                        d = datetime.fromisoformat(date_str.replace("Z", "+00:00")).date()
+                                        d = datetime.strptime(date_str, "%Y-%m-%d").date()
                                     except Exception:
-                                        try:
-                                            d = datetime.strptime(date_str, "%Y-%m-%d").date()
-                                        except Exception:
-                                            continue
-                                    if now <= d <= week_end:
-                                        filtered.append(ev)
-                                events_data["events"] = filtered
-                                if not filtered:
-                                    # No events in the requested window; return empty result gracefully
-                                    provider = None
-                                    events_list = events_data.get("events") or []
-                                    if events_list:
-                                        provider = events_list[0].get("source")
-                                    state.retrieved_data = {"team_id": team_id, "events": []}
-                                    state.data_source = provider or "sports-rag"
-                                    state.citations.append(f"Sports data from {state.data_source} for {team}")
-                                    return state
-
-                            # Validate Sports RAG response quality
-                            # Pass team name to detect TheSportsDB API data corruption
-                            validation_result, reason, suggestions = validator.validate_sports_response(
-                                events_data, state.query, requested_team=team
-                            )
-
-                            if validation_result == ValidationResult.VALID:
-                                # Response is good, use it
-                                state.retrieved_data = events_data
-                                # Use provider from payload if available
+                                        continue
+                                if now <= d <= week_end:
+                                    filtered.append(ev)
+                            events_data["events"] = filtered
+                            if not filtered:
+                                # No events in the requested window; return empty result gracefully
                                 provider = None
-                                if events_data.get("events"):
-                                    provider = events_data["events"][0].get("source")
-                                elif events_data.get("teams"):
-                                    provider = events_data["teams"][0].get("source")
+                                events_list = events_data.get("events") or []
+                                if events_list:
+                                    provider = events_list[0].get("source")
+                                state.retrieved_data = {"team_id": team_id, "events": []}
                                 state.data_source = provider or "sports-rag"
                                 state.citations.append(f"Sports data from {state.data_source} for {team}")
-                                logger.debug(f"Sports RAG validation passed: {reason}")
+                                return state
 
-                            elif validation_result in [ValidationResult.EMPTY, ValidationResult.INVALID]:
-                                # Data is empty or invalid, trigger web search fallback
-                                logger.warning(
-                                    f"Sports RAG validation failed: {validation_result.value} - {reason}"
-                                )
-                                if suggestions:
-                                    logger.info(f"Fallback suggestion: {suggestions}")
-                                await _fallback_to_web_search(state, "Sports", reason)
-
-                            elif validation_result == ValidationResult.NEEDS_RETRY:
-                                # Data structure mismatch (e.g., got schedule when query wants scores)
-                                logger.info(
-                                    f"Sports RAG needs retry: {reason}. Suggestions: {suggestions}"
-                                )
-                                # For now, fall back to web search for retry scenarios
-                                # Future: Could retry with different RAG parameters
-                                await _fallback_to_web_search(state, "Sports", reason)
+                        # Validate Sports RAG response quality
+                        # Pass team name to detect TheSportsDB API data corruption
+                        validation_result, reason, suggestions = validator.validate_sports_response(
+                            events_data, state.query, requested_team=team
+                        )
+
+                        if validation_result == ValidationResult.VALID:
+                            # Response is good, use it
+                            state.retrieved_data = events_data
+                            # Use provider from payload if available
+                            provider = None
+                            if events_data.get("events"):
+                                provider = events_data["events"][0].get("source")
+                            elif events_data.get("teams"):
+                                provider = events_data["teams"][0].get("source")
+                            state.data_source = provider or "sports-rag"
+                            state.citations.append(f"Sports data from {state.data_source} for {team}")
+                            logger.debug("Sports RAG validation passed: %s", reason)
+
+                        elif validation_result in [ValidationResult.EMPTY, ValidationResult.INVALID]:
+                            # Data is empty or invalid, trigger web search fallback
+                            logger.warning(
+                                "Sports RAG validation failed: %s - %s", validation_result.value, reason
+                            )
+                            if suggestions:
+                                logger.info("Fallback suggestion: %s", suggestions)
+                            await _fallback_to_web_search(state, "Sports", reason)
+
+                        elif validation_result == ValidationResult.NEEDS_RETRY:
+                            # Data structure mismatch (e.g., got schedule when query wants scores)
+                            logger.info(
+                                "Sports RAG needs retry: %s. Suggestions: %s", reason, suggestions
+                            )
+                            # For now, fall back to web search for retry scenarios
+                            # Future: Could retry with different RAG parameters
+                            await _fallback_to_web_search(state, "Sports", reason)
 
                 except (httpx.HTTPStatusError, httpx.RequestError, httpx.TimeoutException) as e:
                     # RAG service failed - fall back to web search
@@ -1202,7 +1700,7 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
                 limit_per_provider=5
             )
 
-            logger.info(f"Search intent classified as: '{intent}'")
+            logger.info("Search intent classified as: '%s'", intent)
 
             if search_results:
                 # Fuse and rank results based on classified intent
@@ -1213,41 +1711,98 @@ async def retrieve_node(state: OrchestratorState) -> OrchestratorState:
                     limit=5
                 )
 
-                logger.info(f"Parallel search returned {len(fused_results)} fused results (intent: {intent})")
+                logger.info("Parallel search returned %s fused results (intent: %s)", len(fused_results), intent)
 
                 # Convert to dict format for LLM
+                results, sources, citations = _collect_search_results(fused_results)
                 search_data = {
                     "intent": intent,
-                    "results": [r.to_dict() for r in fused_results],
-                    "sources": list(set(r.source for r in fused_results)),
+                    "results": results,
+                    "sources": sources,
                     "total_results": len(search_results),
                     "fused_results": len(fused_results)
                 }
 
                 state.retrieved_data = search_data
                 state.data_source = f"Parallel Search ({intent}): {', '.join(search_data['sources'])}"
-                state.citations.extend([f"Search result from {r.source}" for r in fused_results])
-                logger.info(f"Parallel search completed: intent={intent}, sources={search_data['sources']}")
+                state.citations.extend(citations)
+                logger.info("Parallel search completed: intent=%s, sources=%s", intent, search_data['sources'])
             else:
                 # Fallback to LLM knowledge
                 state.retrieved_data = {}
                 state.data_source = "LLM knowledge"
-                logger.info(f"Parallel search returned no results (intent: {intent}), using LLM knowledge")
+                logger.info("Parallel search returned no results (intent: %s), using LLM knowledge", intent)
 
-        logger.info(f"Retrieved data from {state.data_source}")
+        logger.info("Retrieved data from %s", state.data_source)
 
     except Exception as e:
-        logger.error(f"Retrieval error: {e}", exc_info=True)
+        logger.error("Retrieval error: %s", e, exc_info=True)
         state.error = f"Retrieval failed: {str(e)}"
 
-    state.node_timings["retrieve"] = time.time() - start
     return state
 
+def _template_answer(state: OrchestratorState) -> Optional[str]:
+    """
+    Format a deterministic answer when retrieved data fully answers the query.
+
+    Covers current weather and clear "when is the next game" sports lookups, where
+    the LLM would only restate a few fields. Returns None when the data does
+    not have the expected shape so synthesis falls through to the LLM.
+    """
+    data = state.retrieved_data
+    if not isinstance(data, dict) or state.conversation_history:
+        return None
+
+    try:
+        if state.intent == IntentCategory.WEATHER and "current" in data and "location" in data:
+            current = data["current"]
+            return (
+                f"It's {round(current['temperature'])}°F and {current['description']} "
+                f"in {data['location']['name']}, feeling like {round(current['feels_like'])}°F "
+                f"with {current['humidity']}% humidity and winds at {round(current['wind_speed'])} mph."
+            )
+
+        if state.intent == IntentCategory.SPORTS and data.get("events"):
+            if not _NEXT_GAME_RE.search(state.query.lower()):
+                return None
+            event = data["events"][0]
+            if event.get("source") not in _TEMPLATE_SPORTS_SOURCES:
+                return None
+            home = event.get("strHomeTeam")
+            away = event.get("strAwayTeam")
+            date = event.get("dateEvent")
+            if not home or not away or not date:
+                return None
+            # Kickoff times arrive in UTC without a zone; leave them to the LLM
+            # path rather than print a misleading local time
+            when = datetime.strptime(date, "%Y-%m-%d").strftime("%A, %B %-d")
+            return f"The next game is {away} at {home} on {when}."
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    return None
+
+@timed("synthesize")
 async def synthesize_node(state: OrchestratorState) -> OrchestratorState:
     """
     Generate natural language response using LLM with retrieved data and conversation history.
     """
-    start = time.time()
+
+    # Structured RAG answers that need no rewording skip the LLM round-trip
+    stream = _synthesis_stream.get()
+    if stream is not None and "web_search_retry_attempted" in state.entities:
+        # Validation is re-synthesizing; tell the client to discard what it has
+        stream.put_nowait({"type": "reset"})
+
+    templated = _template_answer(state)
+    if templated:
+        state.answer = templated
+        if state.citations:
+            state.answer += f"\n\n_Source: {', '.join(state.citations)}_"
+        if stream is not None:
+            stream.put_nowait({"type": "token", "text": state.answer})
+        logger.info("Synthesized templated %s response", state.intent.value)
+        return state
 
     try:
         # Build synthesis prompt with retrieved data
@@ -1258,47 +1813,29 @@ async def synthesize_node(state: OrchestratorState) -> OrchestratorState:
         )
 
         if has_data:
-            context = json.dumps(state.retrieved_data, indent=2)
-            synthesis_prompt = f"""Answer the following question using ONLY the provided context.
-
-Question: {state.query}
+            # Compact form: indentation only costs serialization time and prompt tokens
+            context = orjson.dumps(
+                state.retrieved_data, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+            instructions = _SYNTH_CONTEXT_RULES
+            synthesis_prompt = f"""Question: {state.query}
 
 Context Data:
 {context}
 
-CRITICAL INSTRUCTIONS:
-1. ONLY use facts from the Context Data above
-2. If the context doesn't have the information, say "I don't have current information about that"
-3. NEVER make up specific facts, dates, names, or numbers
-4. Be concise but accurate
-5. Cite your source when possible
-
 Response:"""
         else:
             # No data retrieved - use general knowledge with caveats
             # This happens when web search failed/returned nothing
+            instructions = _SYNTH_GENERAL_RULES
             synthesis_prompt = f"""Question: {state.query}
 
-You don't have access to real-time or current information, but you can answer using your general knowledge.
-
-IMPORTANT GUIDELINES:
-1. Answer the question using your general knowledge if possible
-2. If it requires current/real-time data (news, scores, weather, stocks, etc.), acknowledge the limitation and suggest checking authoritative sources
-3. For factual/historical questions, provide accurate information from your training
-4. For general knowledge, explanations, or how-to questions, provide helpful answers
-5. NEVER make up specific current events, recent data, or time-sensitive facts
-6. Be helpful - if you can answer even partially, do so
-7. If you truly cannot answer, suggest alternative approaches
-
 Response:"""
 
-        # Build prompt with system context
-        system_context = "You are Athena, a helpful home assistant. Provide clear, concise answers.\n\n"
-
         # Format conversation history for LLM context
         history_context = ""
         if state.conversation_history:
-            logger.info(f"Including {len(state.conversation_history)} previous messages in context")
+            logger.info("Including %s previous messages in context", len(state.conversation_history))
             history_context = "Previous conversation:\n"
             for msg in state.conversation_history:
                 role = msg["role"].capitalize()
@@ -1306,10 +1843,10 @@ Response:"""
                 history_context += f"{role}: {content}\n"
             history_context += "\n"
 
-        # Combine system context, history, and synthesis prompt
-        full_prompt = system_context + history_context + synthesis_prompt
+        # Static system text and instructions first, so requests share a cacheable prefix
+        full_prompt = _SYS_SYNTHESIZE + instructions + history_context + synthesis_prompt
 
-        result = await llm_router.generate(
+        llm_kwargs = dict(
             model=state.model_tier.value if state.model_tier else ModelTier.MEDIUM.value,
             prompt=full_prompt,
             temperature=state.temperature,
@@ -1320,22 +1857,34 @@ Response:"""
             intent=state.intent.value if state.intent else None
         )
 
-        state.answer = result.get("response", "")
+        if stream is not None:
+            # /query/stream: forward fragments to the client as they arrive
+            fragments = []
+            async for fragment in llm_router.generate_stream(**llm_kwargs):
+                fragments.append(fragment)
+                stream.put_nowait({"type": "token", "text": fragment})
+            state.answer = "".join(fragments)
+        else:
+            result = await llm_router.generate(**llm_kwargs)
+            state.answer = result.get("response", "")
 
         # Add data attribution
         if state.citations:
-            state.answer += f"\n\n_Source: {', '.join(state.citations)}_"
+            attribution = f"\n\n_Source: {', '.join(state.citations)}_"
+            state.answer += attribution
+            if stream is not None:
+                stream.put_nowait({"type": "token", "text": attribution})
 
-        logger.info(f"Synthesized response using {state.model_tier}")
+        logger.info("Synthesized response using %s", state.model_tier)
 
     except Exception as e:
-        logger.error(f"Synthesis error: {e}", exc_info=True)
+        logger.error("Synthesis error: %s", e, exc_info=True)
         state.answer = "I apologize, but I'm having trouble generating a response. Please try again."
         state.error = f"Synthesis failed: {str(e)}"
 
-    state.node_timings["synthesize"] = time.time() - start
     return state
 
+@timed("validate")
 async def validate_node(state: OrchestratorState) -> OrchestratorState:
     """
     Multi-layer anti-hallucination validation.
@@ -1345,21 +1894,18 @@ async def validate_node(state: OrchestratorState) -> OrchestratorState:
     Layer 3: LLM-based fact checking
     Layer 4: Uncertainty marker detection
     """
-    start = time.time()
 
     # Layer 1: Basic validation
     if not state.answer or len(state.answer) < 10:
         state.validation_passed = False
         state.validation_reason = "Response too short"
-        logger.warning(f"Validation failed: {state.validation_reason}")
-        state.node_timings["validate"] = time.time() - start
+        logger.warning("Validation failed: %s", state.validation_reason)
         return state
 
     if len(state.answer) > 2000:
         state.validation_passed = False
         state.validation_reason = "Response too long"
-        logger.warning(f"Validation failed: {state.validation_reason}")
-        state.node_timings["validate"] = time.time() - start
+        logger.warning("Validation failed: %s", state.validation_reason)
         return state
 
     # Layer 1.5: Answer Quality Validation (Priority 2 Fix) - RE-ENABLED with targeted patterns
@@ -1375,8 +1921,8 @@ async def validate_node(state: OrchestratorState) -> OrchestratorState:
     )
 
     if validation_result != ValidationResult.VALID:
-        logger.warning(f"Answer quality validation failed: {reason}")
-        logger.info(f"Suggestions: {suggestions}")
+        logger.warning("Answer quality validation failed: %s", reason)
+        logger.info("Suggestions: %s", suggestions)
 
         # If we haven't already retried with web search, trigger fallback
         if "web_search_retry_attempted" not in state.entities:
@@ -1395,12 +1941,11 @@ async def validate_node(state: OrchestratorState) -> OrchestratorState:
                 # Don't validate again - accept this answer to avoid infinite loop
                 state.validation_passed = True
                 state.validation_reason = "Passed after web search retry"
-                logger.info(f"Answer after web search retry: {state.answer[:100]}...")
-                state.node_timings["validate"] = time.time() - start
+                logger.info("Answer after web search retry: %s...", state.answer[:100])
                 return state
 
             except Exception as e:
-                logger.error(f"Web search retry failed: {e}", exc_info=True)
+                logger.error("Web search retry failed: %s", e, exc_info=True)
                 # Continue with original answer even though it's unhelpful
                 state.validation_passed = True
                 state.validation_reason = "Failed answer quality but retry failed"
@@ -1411,54 +1956,46 @@ async def validate_node(state: OrchestratorState) -> OrchestratorState:
             state.validation_reason = "Accepted after failed retry"
 
     # Layer 2: Pattern detection for hallucinations
-    # Look for specific patterns that indicate fabricated information
-    import re
-
-    # Detect specific dates (Month DD, YYYY or MM/DD/YYYY)
-    date_patterns = re.findall(r'(\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:st|nd|rd|th)?,?\s+\d{4}\b|\b\d{1,2}/\d{1,2}/\d{2,4}\b)', state.answer)
-
-    # Detect specific times (HH:MM AM/PM)
-    time_patterns = re.findall(r'\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)\b', state.answer)
-
-    # Detect specific dollar amounts
-    money_patterns = re.findall(r'\$\d+(?:,\d{3})*(?:\.\d{2})?', state.answer)
-
-    # Detect phone numbers
-    phone_patterns = re.findall(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', state.answer)
-
-    has_specific_facts = bool(date_patterns or time_patterns or money_patterns or phone_patterns)
+    # Look for specific patterns that indicate fabricated information;
+    # the first hit is enough to decide
+    has_specific_facts = _FACT_RE.search(state.answer) is not None
 
     # Layer 3: Check if we have data to support specific facts
     has_supporting_data = bool(state.retrieved_data)
 
     if has_specific_facts and not has_supporting_data:
-        logger.warning(f"Response contains specific facts but no supporting data retrieved")
-        logger.warning(f"Dates: {date_patterns}, Times: {time_patterns}, Money: {money_patterns}, Phones: {phone_patterns}")
+        facts: Dict[str, List[str]] = {"date": [], "time": [], "money": [], "phone": []}
+        for match in _FACT_RE.finditer(state.answer):
+            facts[match.lastgroup].append(match.group())
+        logger.warning("Response contains specific facts but no supporting data retrieved")
+        logger.warning("Dates: %s, Times: %s, Money: %s, Phones: %s", facts['date'], facts['time'], facts['money'], facts['phone'])
+
+        # Facts the user supplied (in the query or earlier turns) are grounded,
+        # not hallucinated - no LLM round-trip is needed to confirm that
+        user_context = " ".join(
+            [state.query] + [
+                msg.get("content", "") for msg in state.conversation_history
+                if msg.get("role") == "user"
+            ]
+        ).lower()
+        if all(fact.lower() in user_context for found in facts.values() for fact in found):
+            state.validation_passed = True
+            logger.info("Response facts all appear in the user's own context, skipping LLM fact check")
+            return state
 
-        # Layer 4: LLM-based fact checking
+        # Layer 4: LLM-based fact checking (only reached without retrieved data)
         try:
-            fact_check_prompt = f"""You are a fact-checking assistant. Analyze this response for hallucinations.
-
-Original Query: {state.query}
+            # Static instructions first; only the query and answer vary between requests
+            full_fact_check_prompt = f"""{_SYS_VALIDATE}Original Query: {state.query}
 
-Retrieved Data Available: {'Yes' if state.retrieved_data else 'No'}
-{f"Retrieved Data: {json.dumps(state.retrieved_data, indent=2)}" if state.retrieved_data else "No data was retrieved from external sources."}
+Retrieved Data Available: No
+No data was retrieved from external sources.
 
 Generated Response:
-{state.answer}
-
-Question: Does this response contain specific factual claims (dates, times, names, phone numbers, prices, events) that are NOT present in the Retrieved Data?
-
-IMPORTANT: If no Retrieved Data is available, ANY specific factual claims are likely hallucinations.
-
-Respond ONLY with valid JSON:
-{{"contains_hallucinations": true/false, "reason": "brief explanation", "specific_claims": ["list of suspicious claims"]}}"""
-
-            # Combine system and user prompts
-            full_fact_check_prompt = f"You are a precise fact-checking assistant. Always respond with valid JSON.\n\n{fact_check_prompt}"
+{state.answer}"""
 
             result = await llm_router.generate(
-                model=ModelTier.SMALL.value,  # OPTIMIZATION: Fix bug - use SMALL model for validation
+                model=VALIDATE_MODEL,
                 prompt=full_fact_check_prompt,
                 temperature=0.1,  # Low temperature for consistent checking
                 request_id=state.request_id,
@@ -1472,7 +2009,7 @@ Respond ONLY with valid JSON:
             # Parse fact check response
             try:
                 # Extract JSON from response (handle markdown code blocks)
-                json_match = re.search(r'\{.*\}', fact_check_response, re.DOTALL)
+                json_match = _JSON_OBJECT_RE.search(fact_check_response)
                 if json_match:
                     fact_check_result = json.loads(json_match.group())
 
@@ -1480,25 +2017,25 @@ Respond ONLY with valid JSON:
                         state.validation_passed = False
                         state.validation_reason = f"Hallucination detected: {fact_check_result.get('reason', 'Unknown')}"
                         state.validation_details = fact_check_result.get("specific_claims", [])
-                        logger.warning(f"Hallucination detected by LLM fact checker: {state.validation_reason}")
-                        logger.warning(f"Suspicious claims: {state.validation_details}")
+                        logger.warning("Hallucination detected by LLM fact checker: %s", state.validation_reason)
+                        logger.warning("Suspicious claims: %s", state.validation_details)
                     else:
                         state.validation_passed = True
                         logger.info("Response passed LLM fact checking")
                 else:
-                    logger.warning(f"Could not parse fact check response as JSON: {fact_check_response}")
+                    logger.warning("Could not parse fact check response as JSON: %s", fact_check_response)
                     # Default to failing validation if we can't parse
                     state.validation_passed = False
                     state.validation_reason = "Could not verify response accuracy"
 
             except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse fact check JSON: {e}")
+                logger.warning("Failed to parse fact check JSON: %s", e)
                 # Default to failing validation if we can't parse
                 state.validation_passed = False
                 state.validation_reason = "Could not verify response accuracy"
 
         except Exception as e:
-            logger.error(f"Fact checking error: {e}", exc_info=True)
+            logger.error("Fact checking error: %s", e, exc_info=True)
             # If fact checking fails, be conservative and fail validation
             state.validation_passed = False
             state.validation_reason = f"Validation error: {str(e)}"
@@ -1508,18 +2045,17 @@ Respond ONLY with valid JSON:
         state.validation_passed = True
         logger.info("Response passed validation (no specific facts or has supporting data)")
 
-    state.node_timings["validate"] = time.time() - start
     return state
 
+@timed("finalize")
 async def finalize_node(state: OrchestratorState) -> OrchestratorState:
     """
     Prepare final response with fallbacks for validation failures.
     """
-    start = time.time()
 
     if not state.validation_passed:
         # Provide fallback response based on validation failure reason
-        logger.warning(f"Validation failed, providing fallback response: {state.validation_reason}")
+        logger.warning("Validation failed, providing fallback response: %s", state.validation_reason)
 
         if "hallucination" in state.validation_reason.lower():
             # Hallucination detected - provide helpful fallback
@@ -1530,9 +2066,9 @@ async def finalize_node(state: OrchestratorState) -> OrchestratorState:
             state.answer = "I'm not confident in my response. Could you please rephrase your question?"
 
     # Calculate total processing time
-    total_time = time.time() - state.start_time
+    total_time = (time.perf_counter_ns() - state.start_time_ns) / 1e9
     logger.info(
-        f"Request {state.request_id} completed in {total_time:.2f}s",
+        "Request %s completed in %.2fs", state.request_id, total_time,
         extra={
             "request_id": state.request_id,
             "intent": state.intent,
@@ -1541,19 +2077,34 @@ async def finalize_node(state: OrchestratorState) -> OrchestratorState:
         }
     )
 
-    # Cache conversation context for follow-ups
-    await cache_client.set(
-        f"conversation:{state.request_id}",
-        {
-            "query": state.query,
-            "intent": state.intent.value if state.intent else None,
-            "answer": state.answer,
-            "timestamp": time.time()
-        },
-        ttl=3600  # 1 hour TTL
+    # Cache conversation context for follow-ups without holding the response
+    # on the Redis round-trip
+    _run_in_background(
+        cache_client.set(
+            f"conversation:{state.request_id}",
+            {
+                "query": state.query,
+                "intent": state.intent.value if state.intent else None,
+                "answer": state.answer,
+                "timestamp": time.time()
+            },
+            ttl=3600  # 1 hour TTL
+        ),
+        f"conversation cache write for {state.request_id}"
     )
 
-    state.node_timings["finalize"] = time.time() - start
+    return state
+
+async def info_pipeline_node(state: OrchestratorState) -> OrchestratorState:
+    """
+    Run the info path (route_info -> retrieve -> synthesize -> validate -> finalize).
+
+    The path never branches, so its steps are awaited directly on one state
+    object instead of each being a graph node that LangGraph rebuilds the
+    state for. Per-node timings are still recorded by each step.
+    """
+    for step in (route_info_node, retrieve_node, synthesize_node, validate_node, finalize_node):
+        state = await step(state)
     return state
 
 # ============================================================================
@@ -1567,12 +2118,9 @@ def create_orchestrator_graph() -> StateGraph:
     graph = StateGraph(OrchestratorState)
 
     # Add nodes
-    graph.add_node("classify", classify_node)
+    graph.add_node("classify", speculative_classify_node)
     graph.add_node("route_control", route_control_node)
-    graph.add_node("route_info", route_info_node)
-    graph.add_node("retrieve", retrieve_node)
-    graph.add_node("synthesize", synthesize_node)
-    graph.add_node("validate", validate_node)
+    graph.add_node("info_pipeline", info_pipeline_node)
     graph.add_node("finalize", finalize_node)
 
     # Define edges
@@ -1585,14 +2133,14 @@ def create_orchestrator_graph() -> StateGraph:
         elif state.intent == IntentCategory.UNKNOWN:
             return "finalize"  # Skip to finalize for unknown intents
         else:
-            return "route_info"
+            return "info_pipeline"
 
     graph.add_conditional_edges(
         "classify",
         route_after_classify,
         {
             "route_control": "route_control",
-            "route_info": "route_info",
+            "info_pipeline": "info_pipeline",
             "finalize": "finalize"
         }
     )
@@ -1600,11 +2148,8 @@ def create_orchestrator_graph() -> StateGraph:
     # Control path
     graph.add_edge("route_control", "finalize")
 
-    # Info path
-    graph.add_edge("route_info", "retrieve")
-    graph.add_edge("retrieve", "synthesize")
-    graph.add_edge("synthesize", "validate")
-    graph.add_edge("validate", "finalize")
+    # Info path (linear, runs to completion including finalize)
+    graph.add_edge("info_pipeline", END)
 
     # End
     graph.add_edge("finalize", END)
@@ -1638,6 +2183,119 @@ class QueryResponse(BaseModel):
     processing_time: float = Field(..., description="Total processing time")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+async def _prepare_query(request: QueryRequest) -> Tuple[Any, OrchestratorState]:
+    """Load or create the request's session and build the initial graph state."""
+    # Session management: get or create session
+    session = await session_manager.get_or_create_session(
+        session_id=request.session_id,
+        user_id=request.mode,  # Use mode as user_id for now
+        zone=request.room
+    )
+
+    logger.info("Processing query in session %s", session.session_id)
+
+    # Get conversation history for LLM context
+    config = await get_config()
+    conv_settings = await config.get_conversation_settings()
+
+    # Only load history if conversation context is enabled
+    conversation_history = []
+    if conv_settings.get("enabled", True) and conv_settings.get("use_context", True):
+        max_history = conv_settings.get("max_llm_history_messages", 10)
+        conversation_history = session.get_llm_history(max_history)
+        logger.info("Loaded %s previous messages from session", len(conversation_history))
+
+    # Create initial state with conversation history
+    initial_state = OrchestratorState(
+        query=request.query,
+        mode=request.mode,
+        room=request.room,
+        temperature=request.temperature,
+        session_id=session.session_id,
+        conversation_history=conversation_history
+    )
+    return session, initial_state
+
+async def _complete_query(request: QueryRequest, session: Any, final_state: Dict[str, Any]) -> QueryResponse:
+    """Record metrics and session history for a finished run and build the response."""
+    # Track metrics
+    intent_value = final_state.get("intent")
+    if intent_value and hasattr(intent_value, "value"):
+        intent_str = intent_value.value
+    elif isinstance(intent_value, str):
+        intent_str = intent_value
+    else:
+        intent_str = "unknown"
+
+    request_counter.labels(
+        intent=intent_str,
+        status="success"
+    ).inc()
+
+    # Add messages to session history
+    answer = final_state.get("answer") or "I couldn't process that request."
+
+    # Extract model_tier for session metadata
+    model_tier = final_state.get("model_tier")
+
+    # Add user message to session
+    session.add_message(
+        role="user",
+        content=request.query,
+        metadata={
+            "intent": intent_str,
+            "confidence": final_state.get("confidence"),
+            "room": request.room
+        }
+    )
+
+    # Add assistant response to session
+    session.add_message(
+        role="assistant",
+        content=answer,
+        metadata={
+            "model_tier": model_tier.value if model_tier and hasattr(model_tier, "value") else str(model_tier),
+            "data_source": final_state.get("data_source"),
+            "validation_passed": final_state.get("validation_passed")
+        }
+    )
+
+    # Save session (with trimming based on config)
+    await session_manager.add_message(
+        session_id=session.session_id,
+        role="user",
+        content=request.query,
+        metadata={"intent": intent_str, "confidence": final_state.get("confidence")}
+    )
+    await session_manager.add_message(
+        session_id=session.session_id,
+        role="assistant",
+        content=answer,
+        metadata={"model_tier": model_tier.value if model_tier and hasattr(model_tier, "value") else str(model_tier)}
+    )
+
+    logger.info("Session %s updated with %s total messages", session.session_id, len(session.messages))
+
+    # Build response
+    model_tier_str = model_tier.value if model_tier and hasattr(model_tier, "value") else model_tier
+
+    return QueryResponse(
+        answer=answer,
+        intent=intent_str if intent_str != "unknown" else IntentCategory.UNKNOWN.value,
+        confidence=final_state.get("confidence"),
+        citations=final_state.get("citations"),
+        request_id=final_state.get("request_id"),
+        session_id=session.session_id,
+        processing_time=(time.perf_counter_ns() - final_state["start_time_ns"]) / 1e9,
+        metadata={
+            "model_used": model_tier_str,
+            "data_source": final_state.get("data_source"),
+            "validation_passed": final_state.get("validation_passed"),
+            "node_timings": final_state.get("node_timings"),
+            "conversation_turns": len(session.messages) // 2
+        }
+    )
+
 @app.post("/query", response_model=QueryResponse)
 async def process_query(request: QueryRequest) -> QueryResponse:
     """
@@ -1653,127 +2311,99 @@ async def process_query(request: QueryRequest) -> QueryResponse:
     request_counter.labels(intent="unknown", status="started").inc()
 
     try:
-        # Session management: get or create session
-        session = await session_manager.get_or_create_session(
-            session_id=request.session_id,
-            user_id=request.mode,  # Use mode as user_id for now
-            zone=request.room
-        )
-
-        logger.info(f"Processing query in session {session.session_id}")
-
-        # Get conversation history for LLM context
-        config = await get_config()
-        conv_settings = await config.get_conversation_settings()
-
-        # Only load history if conversation context is enabled
-        conversation_history = []
-        if conv_settings.get("enabled", True) and conv_settings.get("use_context", True):
-            max_history = conv_settings.get("max_llm_history_messages", 10)
-            conversation_history = session.get_llm_history(max_history)
-            logger.info(f"Loaded {len(conversation_history)} previous messages from session")
-
-        # Create initial state with conversation history
-        initial_state = OrchestratorState(
-            query=request.query,
-            mode=request.mode,
-            room=request.room,
-            temperature=request.temperature,
-            session_id=session.session_id,
-            conversation_history=conversation_history
-        )
+        session, initial_state = await _prepare_query(request)
 
         # Run through state machine
         with request_duration.labels(intent="processing").time():
-            final_state = await orchestrator_graph.ainvoke(initial_state)
-
-        # Track metrics
-        intent_value = final_state.get("intent")
-        if intent_value and hasattr(intent_value, "value"):
-            intent_str = intent_value.value
-        elif isinstance(intent_value, str):
-            intent_str = intent_value
-        else:
-            intent_str = "unknown"
-
-        request_counter.labels(
-            intent=intent_str,
-            status="success"
-        ).inc()
-
-        # Add messages to session history
-        answer = final_state.get("answer") or "I couldn't process that request."
-
-        # Extract model_tier for session metadata
-        model_tier = final_state.get("model_tier")
-
-        # Add user message to session
-        session.add_message(
-            role="user",
-            content=request.query,
-            metadata={
-                "intent": intent_str,
-                "confidence": final_state.get("confidence"),
-                "room": request.room
-            }
-        )
+            final_state = await _run_graph(initial_state)
 
-        # Add assistant response to session
-        session.add_message(
-            role="assistant",
-            content=answer,
-            metadata={
-                "model_tier": model_tier.value if model_tier and hasattr(model_tier, "value") else str(model_tier),
-                "data_source": final_state.get("data_source"),
-                "validation_passed": final_state.get("validation_passed")
-            }
-        )
+        return await _complete_query(request, session, final_state)
 
-        # Save session (with trimming based on config)
-        await session_manager.add_message(
-            session_id=session.session_id,
-            role="user",
-            content=request.query,
-            metadata={"intent": intent_str, "confidence": final_state.get("confidence")}
-        )
-        await session_manager.add_message(
-            session_id=session.session_id,
-            role="assistant",
-            content=answer,
-            metadata={"model_tier": model_tier.value if model_tier and hasattr(model_tier, "value") else str(model_tier)}
-        )
+    except Exception as e:
+        logger.error("Query processing error: %s", e, exc_info=True)
+        request_counter.labels(intent="unknown", status="error").inc()
 
-        logger.info(f"Session {session.session_id} updated with {len(session.messages)} total messages")
-
-        # Build response
-        model_tier_str = model_tier.value if model_tier and hasattr(model_tier, "value") else model_tier
-
-        return QueryResponse(
-            answer=answer,
-            intent=intent_str if intent_str != "unknown" else IntentCategory.UNKNOWN.value,
-            confidence=final_state.get("confidence"),
-            citations=final_state.get("citations"),
-            request_id=final_state.get("request_id"),
-            session_id=session.session_id,
-            processing_time=time.time() - final_state.get("start_time", time.time()),
-            metadata={
-                "model_used": model_tier_str,
-                "data_source": final_state.get("data_source"),
-                "validation_passed": final_state.get("validation_passed"),
-                "node_timings": final_state.get("node_timings"),
-                "conversation_turns": len(session.messages) // 2
-            }
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to process query: {str(e)}"
         )
 
+async def _run_graph(initial_state: OrchestratorState) -> Dict[str, Any]:
+    """Run the orchestrator graph, discarding any speculative retrieval it left unclaimed."""
+    try:
+        return await orchestrator_graph.ainvoke(initial_state)
+    finally:
+        # Set when the run ends (or is cancelled) between classify and retrieve
+        speculative = _speculative_retrievals.pop(initial_state.request_id, None)
+        if speculative is not None:
+            speculative.cancel()
+
+def _sse(payload: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
+
+@app.post("/query/stream")
+async def process_query_stream(request: QueryRequest) -> StreamingResponse:
+    """
+    Process a user query, streaming the synthesized answer as server-sent events.
+
+    Emits {"type": "token", "text": ...} fragments while the answer is being
+    generated and {"type": "reset"} if validation restarts synthesis. Validation
+    and finalization still run on the complete text, so the closing
+    {"type": "done", "response": QueryResponse} event carries the authoritative
+    answer, which may replace the streamed one (e.g. after a validation fallback).
+    """
+    global orchestrator_graph
+
+    # Initialize graph if needed
+    if orchestrator_graph is None:
+        orchestrator_graph = create_orchestrator_graph()
+
+    # Track request
+    request_counter.labels(intent="unknown", status="started").inc()
+
+    try:
+        session, initial_state = await _prepare_query(request)
     except Exception as e:
-        logger.error(f"Query processing error: {e}", exc_info=True)
+        logger.error("Query processing error: %s", e, exc_info=True)
         request_counter.labels(intent="unknown", status="error").inc()
-
         raise HTTPException(
             status_code=500,
             detail=f"Failed to process query: {str(e)}"
         )
 
+    async def event_stream():
+        events: asyncio.Queue = asyncio.Queue()
+
+        # The graph task copies the current context, so synthesize_node sees
+        # this request's queue
+        token = _synthesis_stream.set(events)
+        try:
+            run = asyncio.create_task(_run_graph(initial_state))
+        finally:
+            _synthesis_stream.reset(token)
+        run.add_done_callback(lambda _: events.put_nowait(None))
+
+        try:
+            with request_duration.labels(intent="processing").time():
+                while (event := await events.get()) is not None:
+                    yield _sse(event)
+
+            response = await _complete_query(request, session, run.result())
+            yield _sse({"type": "done", "response": response.model_dump()})
+
+        except Exception as e:
+            logger.error("Query processing error: %s", e, exc_info=True)
+            request_counter.labels(intent="unknown", status="error").inc()
+            yield _sse({"type": "error", "detail": f"Failed to process query: {str(e)}"})
+
+        finally:
+            # Client went away mid-stream; stop the graph run
+            if not run.done():
+                run.cancel()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -1784,33 +2414,35 @@ async def health_check():
         "components": {}
     }
 
-    # Check Home Assistant
-    try:
-        ha_healthy = await ha_client.health_check() if ha_client else False
-        health["components"]["home_assistant"] = ha_healthy
-    except:
-        health["components"]["home_assistant"] = False
+    async def check_home_assistant() -> bool:
+        client = await _get_ha_client()
+        return await client.health_check() if client else False
 
-    # Check LLM Router (supports Ollama, MLX, etc.)
-    try:
-        health["components"]["llm_router"] = llm_router is not None
-    except:
-        health["components"]["llm_router"] = False
+    async def check_redis() -> bool:
+        if not cache_client:
+            return False
+        await cache_client.client.ping()
+        return True
 
-    # Check Redis
-    try:
-        await cache_client.client.ping() if cache_client else False
-        health["components"]["redis"] = True
-    except:
-        health["components"]["redis"] = False
+    async def check_rag(service_url: str) -> bool:
+        response = await _get_rag_http_client().get(f"{service_url}/health")
+        return response.status_code == 200
 
-    # Check RAG services
-    for name, client in rag_clients.items():
-        try:
-            response = await client.get("/health")
-            health["components"][f"rag_{name}"] = response.status_code == 200
-        except:
-            health["components"][f"rag_{name}"] = False
+    # Run the subchecks concurrently so the endpoint takes as long as the
+    # slowest dependency rather than the sum of all of them
+    checks = {"home_assistant": check_home_assistant(), "redis": check_redis()}
+    for name, service_url in RAG_SERVICE_URLS.items():
+        checks[f"rag_{name}"] = check_rag(service_url)
+    results = dict(zip(checks, await asyncio.gather(*checks.values(), return_exceptions=True)))
+
+    health["components"]["home_assistant"] = results["home_assistant"] is True
+
+    # Check LLM Router (supports Ollama, MLX, etc.)
+    health["components"]["llm_router"] = llm_router is not None
+
+    health["components"]["redis"] = results["redis"] is True
+    for name in RAG_SERVICE_URLS:
+        health["components"][f"rag_{name}"] = results[f"rag_{name}"] is True
 
     # Determine overall health
     critical_components = ["llm_router", "redis"]
@@ -1840,7 +2472,7 @@ async def llm_metrics():
         metrics_data = llm_router.report_metrics()
         return metrics_data
     except Exception as e:
-        logger.error(f"Failed to retrieve LLM metrics: {e}")
+        logger.error("Failed to retrieve LLM metrics: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve metrics: {str(e)}"
@@ -1884,7 +2516,7 @@ async def list_sessions(
     # For now, we'll return an empty list since session_manager stores sessions in Redis/memory
     # and doesn't have a built-in list_all method
 
-    logger.info(f"Listing sessions (limit={limit}, offset={offset})")
+    logger.info("Listing sessions (limit=%s, offset=%s)", limit, offset)
 
     return SessionListResponse(
         sessions=[],
@@ -1904,7 +2536,7 @@ async def get_session_details(session_id: str) -> SessionDetailResponse:
     if not session:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
 
-    logger.info(f"Retrieved session {session_id} with {len(session.messages)} messages")
+    logger.info("Retrieved session %s with %s messages", session_id, len(session.messages))
 
     return SessionDetailResponse(
         session_id=session.session_id,
@@ -1932,7 +2564,7 @@ async def delete_session(session_id: str):
 
     await session_manager.delete_session(session_id)
 
-    logger.info(f"Deleted session {session_id}")
+    logger.info("Deleted session %s", session_id)
 
     return {"status": "success", "message": f"Session {session_id} deleted"}
 
@@ -32,7 +32,8 @@ class ParallelSearchEngine:
         self,
         intent_classifier: IntentClassifier,
         provider_router: ProviderRouter,
-        timeout: float = 3.0
+        timeout: float = 3.0,
+        max_concurrency: int = 4
     ):
         """
         Initialize parallel search engine with intent-based routing.
@@ -41,10 +42,17 @@ class ParallelSearchEngine:
             intent_classifier: Intent classifier for query routing
             provider_router: Provider router for intent-to-provider mapping
             timeout: Maximum wait time for all providers (seconds)
+            max_concurrency: Max in-flight searches per provider across
+                overlapping queries
         """
         self.intent_classifier = intent_classifier
         self.provider_router = provider_router
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+
+        # One semaphore per provider so bursts of queries don't flood a single
+        # search host, while one query's fan-out across providers stays parallel
+        self._provider_limits: Dict[str, asyncio.Semaphore] = {}
 
         logger.info(f"ParallelSearchEngine initialized with intent-based routing")
 
@@ -158,9 +166,13 @@ class ParallelSearchEngine:
             Tuple of (provider_name, results)
         """
         provider_name = provider.name
+        limit_sem = self._provider_limits.get(provider_name)
+        if limit_sem is None:
+            limit_sem = self._provider_limits[provider_name] = asyncio.Semaphore(self.max_concurrency)
         try:
             logger.info(f"Starting search for provider: {provider_name}")
-            results = await provider.search(query, location=location, limit=limit, **kwargs)
+            async with limit_sem:
+                results = await provider.search(query, location=location, limit=limit, **kwargs)
             logger.info(f"Provider '{provider_name}' completed successfully: {len(results)} results")
             return (provider_name, results)
 
@@ -186,6 +198,7 @@ class ParallelSearchEngine:
             EVENTBRITE_API_KEY: Eventbrite API key (fallback)
             BRAVE_SEARCH_API_KEY: Brave Search API key (fallback)
             SEARCH_TIMEOUT: Global timeout in seconds (default 3.0)
+            SEARCH_MAX_CONCURRENCY: Max in-flight searches per provider (default 4)
             ENABLE_TICKETMASTER: Enable Ticketmaster provider (default: true)
             ENABLE_EVENTBRITE: Enable Eventbrite provider (default: true)
             ENABLE_BRAVE_SEARCH: Enable Brave Search provider (default: true)
@@ -198,6 +211,7 @@ class ParallelSearchEngine:
             Configured ParallelSearchEngine instance with intent-based routing
         """
         timeout = float(os.getenv("SEARCH_TIMEOUT", "3.0"))
+        max_concurrency = int(os.getenv("SEARCH_MAX_CONCURRENCY", "4"))
 
         # Initialize intent classifier
         intent_classifier = IntentClassifier()
@@ -208,5 +222,6 @@ class ParallelSearchEngine:
         return cls(
             intent_classifier=intent_classifier,
             provider_router=provider_router,
-            timeout=kwargs.get("timeout", timeout)
+            timeout=kwargs.get("timeout", timeout),
+            max_concurrency=kwargs.get("max_concurrency", max_concurrency)
         )
@@ -4,6 +4,8 @@ Admin Configuration Client
 Allows services to fetch configuration and secrets from the admin API.
 Uses service-to-service authentication with API key.
 """
+import asyncio
+import functools
 import os
 import time
 import httpx
@@ -12,6 +14,29 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Service names whose external API keys the search providers load at startup
+BOOTSTRAP_API_KEY_SERVICES = ("brave-search", "ticketmaster", "eventbrite")
+
+
+def _single_flight(method):
+    """
+    Share one in-flight admin API call between concurrent callers.
+
+    Calls with the same method and arguments that arrive while a fetch is
+    still pending await that fetch instead of issuing another request.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args):
+        key = (method.__name__, *args)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the fetch for the rest
+        return await asyncio.shield(task)
+    return wrapper
+
 
 class AdminConfigClient:
     """Client for fetching configuration from admin API."""
@@ -53,6 +78,14 @@ class AdminConfigClient:
         self._features_cache: Optional[Dict[str, bool]] = None
         self._features_cache_time = 0.0
 
+        # External API keys cache (per service)
+        self._api_keys_cache: Dict[str, Dict[str, Any]] = {}
+        self._api_keys_cache_time: Dict[str, float] = {}
+
+        # Pending fetches shared by concurrent callers (see _single_flight)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    @_single_flight
     async def get_secret(self, service_name: str) -> Optional[str]:
         """
         Fetch a secret value from the admin API.
@@ -118,6 +151,7 @@ class AdminConfigClient:
         # For now, use environment variables
         return os.getenv(key, default)
 
+    @_single_flight
     async def get_intent_patterns(self) -> Dict[str, List[str]]:
         """
         Fetch intent patterns from Admin API with caching.
@@ -174,6 +208,7 @@ class AdminConfigClient:
         # Return empty dict to trigger hardcoded fallback
         return {}
 
+    @_single_flight
     async def get_intent_routing(self) -> Dict[str, Dict]:
         """
         Fetch intent routing configuration with caching.
@@ -231,6 +266,7 @@ class AdminConfigClient:
         # Return empty dict to trigger hardcoded fallback
         return {}
 
+    @_single_flight
     async def get_provider_routing(self) -> Dict[str, List[str]]:
         """
         Fetch provider routing with caching (ordered by priority).
@@ -293,6 +329,7 @@ class AdminConfigClient:
         # Return empty dict to trigger hardcoded fallback
         return {}
 
+    @_single_flight
     async def get_llm_backends(self) -> List[Dict[str, Any]]:
         """
         Fetch enabled LLM backends from Admin API with caching.
@@ -343,6 +380,7 @@ class AdminConfigClient:
         # Return empty list to trigger env var fallback
         return []
 
+    @_single_flight
     async def get_feature_flags(self) -> Dict[str, bool]:
         """
         Fetch feature flags from Admin API with caching.
@@ -415,6 +453,16 @@ class AdminConfigClient:
         Returns:
             Dict with api_key, endpoint_url, rate_limit_per_minute, or None if not found
         """
+        # Check cache
+        cached = self._api_keys_cache.get(service_name)
+        if cached and (time.time() - self._api_keys_cache_time[service_name] < self._cache_ttl):
+            return cached
+
+        return await self._fetch_external_api_key(service_name)
+
+    @_single_flight
+    async def _fetch_external_api_key(self, service_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch an external API key from the admin API and cache it."""
         try:
             url = f"{self.admin_url}/api/external-api-keys/public/{service_name}/key"
             response = await self.client.get(url)
@@ -429,6 +477,10 @@ class AdminConfigClient:
             response.raise_for_status()
             data = response.json()
 
+            # Cache successful result
+            self._api_keys_cache[service_name] = data
+            self._api_keys_cache_time[service_name] = time.time()
+
             logger.info(
                 "external_api_key_fetched",
                 service_name=service_name,
@@ -452,6 +504,39 @@ class AdminConfigClient:
             )
             return None
 
+    async def get_bootstrap_config(self) -> Dict[str, Any]:
+        """
+        Fetch everything a service needs at startup in one concurrent batch.
+
+        Issues the Home Assistant secret, intent/provider routing and external
+        API key requests together. Routing and API keys land in the client
+        caches, and callers that ask for the same data while the batch is in
+        flight share its requests, so startup pays for one round trip instead
+        of one per call site.
+
+        Returns:
+            Dict with ha_token, intent_routing, provider_routing and
+            search_api_keys (service_name -> key data); failed lookups are None
+        """
+        results = await asyncio.gather(
+            self.get_secret("home-assistant"),
+            self.get_intent_routing(),
+            self.get_provider_routing(),
+            *(self.get_external_api_key(name) for name in BOOTSTRAP_API_KEY_SERVICES),
+            return_exceptions=True
+        )
+        ha_token, intent_routing, provider_routing, *api_keys = [
+            None if isinstance(result, Exception) else result
+            for result in results
+        ]
+
+        return {
+            "ha_token": ha_token,
+            "intent_routing": intent_routing,
+            "provider_routing": provider_routing,
+            "search_api_keys": dict(zip(BOOTSTRAP_API_KEY_SERVICES, api_keys)),
+        }
+
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
@@ -504,7 +589,6 @@ async def get_config(key: str, default: Any = None) -> Any:
 
 
 if __name__ == "__main__":
-    import asyncio
 
     async def test():
         """Test the admin configuration client."""
@@ -8,9 +8,10 @@ fallback.
 Open Source Compatible - No vendor lock-in.
 """
 import os
+import json
 import httpx
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 from enum import Enum
 from collections import deque
 import structlog
@@ -59,7 +60,21 @@ class LLMRouter:
             "http://localhost:8080"
         )
         self._admin_url_base = self.admin_url
-        self.client = httpx.AsyncClient(timeout=120.0)
+        # One pooled client for admin lookups and every backend generation;
+        # limits and HTTP/2 live on the transport because httpx ignores the
+        # client-level ones once a transport is passed
+        self.client = httpx.AsyncClient(
+            timeout=120.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=40,
+                    max_connections=100,
+                    keepalive_expiry=30.0
+                )
+            )
+        )
         self._backend_cache: Dict[str, Dict[str, Any]] = {}
         self._cache_expiry: Dict[str, float] = {}
         self._cache_ttl = cache_ttl
@@ -219,50 +234,160 @@ class LLMRouter:
             return response
 
         finally:
-            duration = time.time() - start_time
+            self._track_request(
+                model, backend_type, start_time, response,
+                request_id, session_id, user_id, zone, intent
+            )
 
-            # Track metrics if response was generated
-            if response:
-                tokens = response.get("eval_count", 0)
-                tokens_per_sec = tokens / duration if duration > 0 and tokens > 0 else 0
+    async def generate_stream(
+        self,
+        model: str,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        request_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        zone: Optional[str] = None,
+        intent: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Generate text, yielding response fragments as the backend produces them.
+
+        Ollama backends stream token chunks. MLX and AUTO backends are not
+        streamed; their full response is yielded once via generate().
+
+        Args:
+            Same as generate()
+
+        Yields:
+            Response text fragments in order
+        """
+        config = await self._get_backend_config(model)
+        backend_type = config["backend_type"]
 
-                metric = {
-                    "timestamp": start_time,
+        if backend_type != BackendType.OLLAMA:
+            result = await self.generate(
+                model=model,
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                request_id=request_id,
+                session_id=session_id,
+                user_id=user_id,
+                zone=zone,
+                intent=intent
+            )
+            yield result.get("response", "")
+            return
+
+        endpoint_url = config["endpoint_url"]
+        temperature = temperature or config.get("temperature_default", 0.7)
+        max_tokens = max_tokens or config.get("max_tokens", 2048)
+        timeout = config.get("timeout_seconds", 60)
+
+        logger.info(
+            "routing_llm_stream_request",
+            model=model,
+            backend_type=backend_type,
+            endpoint=endpoint_url
+        )
+
+        start_time = time.time()
+        response = None
+
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{endpoint_url.rstrip('/')}/api/generate",
+                json={
                     "model": model,
-                    "backend": response.get("backend"),
-                    "latency_seconds": duration,
-                    "tokens": tokens,
-                    "tokens_per_second": tokens_per_sec,
-                    "request_id": request_id,
-                    "session_id": session_id,
-                    "user_id": user_id,
-                    "zone": zone,
-                    "intent": intent
-                }
-                self._metrics.append(metric)
+                    "prompt": prompt,
+                    "stream": True,
+                    "options": {
+                        "temperature": temperature,
+                        "num_predict": max_tokens
+                    }
+                },
+                timeout=timeout
+            ) as stream:
+                stream.raise_for_status()
+                async for line in stream.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("response"):
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        response = {
+                            "backend": "ollama",
+                            "eval_count": chunk.get("eval_count", 0)
+                        }
+                        break
 
-                # Persist metric to database asynchronously
-                import asyncio
-                asyncio.create_task(self._persist_metric(metric, source="orchestrator"))
+        finally:
+            self._track_request(
+                model, backend_type, start_time, response,
+                request_id, session_id, user_id, zone, intent
+            )
 
-                logger.info(
-                    "llm_request_completed",
-                    model=model,
-                    backend_type=backend_type,
-                    duration=duration,
-                    tokens_per_sec=round(tokens_per_sec, 2),
-                    request_id=request_id,
-                    session_id=session_id
-                )
-            else:
-                logger.info(
-                    "llm_request_completed",
-                    model=model,
-                    backend_type=backend_type,
-                    duration=duration,
-                    request_id=request_id,
-                    session_id=session_id
-                )
+    def _track_request(
+        self,
+        model: str,
+        backend_type: str,
+        start_time: float,
+        response: Optional[Dict[str, Any]],
+        request_id: Optional[str],
+        session_id: Optional[str],
+        user_id: Optional[str],
+        zone: Optional[str],
+        intent: Optional[str]
+    ):
+        """Record latency/throughput for a finished request and log completion."""
+        duration = time.time() - start_time
+
+        # Track metrics if response was generated
+        if response:
+            tokens = response.get("eval_count", 0)
+            tokens_per_sec = tokens / duration if duration > 0 and tokens > 0 else 0
+
+            metric = {
+                "timestamp": start_time,
+                "model": model,
+                "backend": response.get("backend"),
+                "latency_seconds": duration,
+                "tokens": tokens,
+                "tokens_per_second": tokens_per_sec,
+                "request_id": request_id,
+                "session_id": session_id,
+                "user_id": user_id,
+                "zone": zone,
+                "intent": intent
+            }
+            self._metrics.append(metric)
+
+            # Persist metric to database asynchronously
+            import asyncio
+            asyncio.create_task(self._persist_metric(metric, source="orchestrator"))
+
+            logger.info(
+                "llm_request_completed",
+                model=model,
+                backend_type=backend_type,
+                duration=duration,
+                tokens_per_sec=round(tokens_per_sec, 2),
+                request_id=request_id,
+                session_id=session_id
+            )
+        else:
+            logger.info(
+                "llm_request_completed",
+                model=model,
+                backend_type=backend_type,
+                duration=duration,
+                request_id=request_id,
+                session_id=session_id
+            )
 
     async def _generate_ollama(
         self,
@@ -274,10 +399,9 @@ class LLMRouter:
         timeout: int
     ) -> Dict[str, Any]:
         """Generate using Ollama backend."""
-        client = httpx.AsyncClient(base_url=endpoint_url, timeout=timeout)
-
-        try:
-            response = await client.post("/api/generate", json={
+        response = await self.client.post(
+            f"{endpoint_url.rstrip('/')}/api/generate",
+            json={
                 "model": model,
                 "prompt": prompt,
                 "stream": False,
@@ -285,22 +409,21 @@ class LLMRouter:
                     "temperature": temperature,
                     "num_predict": max_tokens
                 }
-            })
-
-            response.raise_for_status()
-            data = response.json()
+            },
+            timeout=timeout
+        )
 
-            return {
-                "response": data.get("response"),
-                "backend": "ollama",
-                "model": model,
-                "done": data.get("done", True),
-                "total_duration": data.get("total_duration"),
-                "eval_count": data.get("eval_count")
-            }
+        response.raise_for_status()
+        data = response.json()
 
-        finally:
-            await client.aclose()
+        return {
+            "response": data.get("response"),
+            "backend": "ollama",
+            "model": model,
+            "done": data.get("done", True),
+            "total_duration": data.get("total_duration"),
+            "eval_count": data.get("eval_count")
+        }
 
     async def _generate_mlx(
         self,
@@ -312,33 +435,31 @@ class LLMRouter:
         timeout: int
     ) -> Dict[str, Any]:
         """Generate using MLX backend."""
-        client = httpx.AsyncClient(base_url=endpoint_url, timeout=timeout)
-
-        try:
-            # MLX server uses OpenAI-compatible API
-            response = await client.post("/v1/completions", json={
+        # MLX server uses OpenAI-compatible API
+        response = await self.client.post(
+            f"{endpoint_url.rstrip('/')}/v1/completions",
+            json={
                 "model": model,
                 "prompt": prompt,
                 "temperature": temperature,
                 "max_tokens": max_tokens
-            })
-
-            response.raise_for_status()
-            data = response.json()
+            },
+            timeout=timeout
+        )
 
-            choice = data["choices"][0]
+        response.raise_for_status()
+        data = response.json()
 
-            return {
-                "response": choice["text"],
-                "backend": "mlx",
-                "model": model,
-                "done": True,
-                "total_duration": None,  # MLX doesn't provide this
-                "eval_count": data.get("usage", {}).get("completion_tokens")
-            }
+        choice = data["choices"][0]
 
-        finally:
-            await client.aclose()
+        return {
+            "response": choice["text"],
+            "backend": "mlx",
+            "model": model,
+            "done": True,
+            "total_duration": None,  # MLX doesn't provide this
+            "eval_count": data.get("usage", {}).get("completion_tokens")
+        }
 
     async def _persist_metric(self, metric: Dict[str, Any], source: Optional[str] = None):
         """
@@ -60,6 +60,24 @@ class OllamaClient:
                     import json
                     yield json.loads(line)
     
+    async def chat_once(
+        self,
+        model: str,
+        messages: list,
+        temperature: float = 0.7
+    ) -> Dict[str, Any]:
+        """Non-streaming chat completion from Ollama, returned as a single response"""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": False,
+            "options": {"temperature": temperature}
+        }
+        
+        response = await self.client.post("/api/chat", json=payload)
+        response.raise_for_status()
+        return response.json()
+    
     async def list_models(self) -> Dict[str, Any]:
         """List available models"""
         response = await self.client.get("/api/tags")